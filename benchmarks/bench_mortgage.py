@@ -0,0 +1,243 @@
+"""
+Description: Benchmarks for Mortgage construction, payment calculation, formatting 
+and end-to-end portfolio file processing.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Run python benchmarks/bench_mortgage.py -o results.json from the project 
+root to time every benchmark and save the results as JSON. Pass --compare with 
+an earlier results file to print the change for each benchmark. Use --max-rows 
+to limit the synthetic portfolio sizes (1K up to 10M rows by default).
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from mortgage.batch import calculate_payments_from_codes
+from mortgage import synthetic
+from mortgage.comparison import compare_frequencies
+from mortgage.mortgage import Mortgage
+from mortgage.pipeline import process_file
+from mortgage.pixell_lookup import FREQUENCIES, RATES, VALID_AMORTIZATION
+from mortgage.precision import calculate_payment_cents, exact_payment
+from mortgage.simulation import PortfolioColumns, PrepaymentModel, VasicekRates, simulate
+
+PORTFOLIO_SIZES = (1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+REPEATS = 5
+
+def time_call(function, repeats: int = REPEATS) -> list:
+
+    """Times a function, returns the seconds per call of each repeat"""
+
+    timer = timeit.Timer(function)
+    loops, _ = timer.autorange()
+    return [total / loops for total in timer.repeat(repeat=repeats, number=loops)]
+
+def write_portfolio(path: str, rows: int, seed: int = 0):
+
+    """Writes a synthetic portfolio file in the pixell_river_mortgages.txt format"""
+
+    synthetic.write_portfolio(path, rows, seed)
+
+def micro_benchmarks() -> dict:
+
+    """Times the Mortgage methods, returns the seconds per call of each repeat by name"""
+
+    mortgage = Mortgage(682912.43, "FIXED_3", "BI_WEEKLY", 30)
+
+    return {
+        "mortgage_init": time_call(lambda: Mortgage(682912.43, "FIXED_3", "BI_WEEKLY", 30)),
+        "mortgage_init_invalid": time_call(lambda: _construct_invalid()),
+        "calculate_payment": time_call(mortgage.calculate_payment),
+        "mortgage_str": time_call(mortgage.__str__),
+    }
+
+def _construct_invalid():
+
+    """Creates a Mortgage with an invalid rate, as happens for dirty input rows"""
+
+    try:
+        Mortgage(682912.43, "FIXED_33", "BI_WEEKLY", 30)
+    except ValueError:
+        pass
+
+def portfolio_benchmarks(max_rows: int) -> dict:
+
+    """Times the pipeline over synthetic portfolio files, returns the seconds per row by name"""
+
+    results = {}
+
+    with tempfile.TemporaryDirectory() as directory:
+        input_path = os.path.join(directory, "portfolio.txt")
+        output_path = os.path.join(directory, "priced.csv")
+        reject_path = os.path.join(directory, "rejects.txt")
+
+        for rows in (size for size in PORTFOLIO_SIZES if size <= max_rows):
+            write_portfolio(input_path, rows)
+            #larger files are timed fewer times to keep the suite practical
+            repeats = REPEATS if rows <= 100_000 else 1
+            runs = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                process_file(input_path, output_path, reject_path)
+                runs.append((time.perf_counter() - start) / rows)
+            results[f"pipeline_{rows}_rows"] = runs
+
+    return results
+
+def precision_benchmarks(max_rows: int) -> dict:
+
+    """Times float payments, exact cent payments and Decimal payments over encoded columns,
+    returns the seconds per row by name"""
+
+    rows = min(1_000_000, max_rows)
+    generator = random.Random(0)
+    amounts = [round(generator.uniform(10_000, 1_000_000), 2) for _ in range(rows)]
+    rate_codes = [generator.randrange(len(RATES)) for _ in range(rows)]
+    frequency_codes = [generator.randrange(len(FREQUENCIES)) for _ in range(rows)]
+    amortizations = [generator.choice(sorted(VALID_AMORTIZATION)) for _ in range(rows)]
+    #columnar arrays, as a MortgagePortfolio or binary portfolio provides them
+    columns = tuple(np.array(column) for column in (amounts, rate_codes, frequency_codes, amortizations))
+
+    #Decimal is slow enough that a sample of the rows gives its rate per row
+    sample = min(rows, 10_000)
+    sample_terms = [(amounts[index], RATES[rate_codes[index]], FREQUENCIES[frequency_codes[index]],
+                     amortizations[index]) for index in range(sample)]
+
+    def decimal_payments():
+        for terms in sample_terms:
+            exact_payment(*terms)
+
+    return {
+        f"payments_float_{rows}_rows": [run / rows for run in time_call(
+            lambda: calculate_payments_from_codes(*columns))],
+        f"payments_cents_{rows}_rows": [run / rows for run in time_call(lambda: calculate_payment_cents(*columns))],
+        f"payments_decimal_{sample}_rows": [run / sample for run in time_call(decimal_payments)],
+    }
+
+def comparison_benchmarks(max_rows: int) -> dict:
+
+    """Times comparing payment frequencies with one Mortgage per frequency and with
+    compare_frequencies, returns the seconds per loan by name"""
+
+    rows = min(1_000_000, max_rows)
+    generator = random.Random(0)
+    amounts = np.array([round(generator.uniform(10_000, 1_000_000), 2) for _ in range(rows)])
+    rate_codes = np.array([generator.randrange(len(RATES)) for _ in range(rows)])
+    amortizations = np.array([generator.choice(sorted(VALID_AMORTIZATION)) for _ in range(rows)])
+
+    sample = min(rows, 10_000)
+    sample_terms = [(float(amounts[index]), RATES[rate_codes[index]].name, int(amortizations[index]))
+                    for index in range(sample)]
+
+    def mortgage_comparisons():
+        #payment and total paid of each regular frequency, the way a caller would without the comparison API
+        for amount, rate, amortization in sample_terms:
+            mortgage = Mortgage(amount, rate, "MONTHLY", amortization)
+            for frequency in FREQUENCIES:
+                mortgage.frequency = frequency.name
+                payment = mortgage.calculate_payment()
+                payment * amortization * frequency.value
+
+    return {
+        f"compare_mortgages_{sample}_rows": [run / sample for run in time_call(mortgage_comparisons)],
+        f"compare_frequencies_{rows}_rows": [run / rows for run in time_call(
+            lambda: compare_frequencies(amounts, rate_codes, amortizations))],
+    }
+
+def simulation_benchmarks(max_rows: int) -> dict:
+
+    """Times the rate and prepayment simulation, returns the seconds per loan and path by name"""
+
+    loans, paths = min(2_000, max_rows), 128
+    generator = np.random.default_rng(0)
+    portfolio = PortfolioColumns(np.round(generator.uniform(10_000, 1_000_000, loans), 2),
+                                 generator.integers(0, len(RATES), loans),
+                                 generator.integers(0, len(FREQUENCIES), loans),
+                                 generator.choice(sorted(VALID_AMORTIZATION), loans))
+
+    def simulation():
+        simulate(portfolio, VasicekRates(), PrepaymentModel(0.05, 0.1), paths)
+
+    return {f"simulate_{loans * paths}_rows": [run / (loans * paths) for run in time_call(simulation, repeats=3)]}
+
+def summarize(name: str, runs: list) -> dict:
+
+    """Returns the JSON entry for one benchmark"""
+
+    unit = "seconds per row" if name.endswith("_rows") else "seconds per call"
+    return {"name": name, "unit": unit, "runs": runs, "mean": statistics.mean(runs),
+            "stdev": statistics.stdev(runs) if len(runs) > 1 else 0.0, "min": min(runs)}
+
+def metadata() -> dict:
+
+    """Returns details of the environment the benchmarks ran in"""
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = ""
+
+    return {"python": platform.python_version(), "platform": platform.platform(),
+            "commit": commit, "date": time.strftime("%Y-%m-%dT%H:%M:%S")}
+
+def compare(results: dict, baseline: dict) -> str:
+
+    """Returns a table of the change in mean time of each benchmark against a baseline"""
+
+    baseline_means = {entry["name"]: entry["mean"] for entry in baseline["benchmarks"]}
+    lines = []
+
+    for entry in results["benchmarks"]:
+        previous = baseline_means.get(entry["name"])
+        if previous:
+            lines.append(f"{entry['name']:<30} {previous:.3e} -> {entry['mean']:.3e}  "
+                         f"({entry['mean'] / previous:.2f}x)")
+
+    return "\n".join(lines)
+
+def main(argv=None) -> int:
+
+    """Runs the benchmarks from the command line"""
+
+    parser = argparse.ArgumentParser(description="Benchmark the mortgage package.")
+    parser.add_argument("-o", "--output", help="file to save the JSON results to")
+    parser.add_argument("--compare", help="earlier JSON results to compare against")
+    parser.add_argument("--max-rows", type=int, default=PORTFOLIO_SIZES[-1],
+                        help="largest synthetic portfolio to process")
+    args = parser.parse_args(argv)
+
+    timings = micro_benchmarks()
+    timings.update(precision_benchmarks(args.max_rows))
+    timings.update(comparison_benchmarks(args.max_rows))
+    timings.update(simulation_benchmarks(args.max_rows))
+    timings.update(portfolio_benchmarks(args.max_rows))
+    results = {"metadata": metadata(),
+               "benchmarks": [summarize(name, runs) for name, runs in timings.items()]}
+
+    for entry in results["benchmarks"]:
+        print(f"{entry['name']:<30} mean {entry['mean']:.3e} s  stdev {entry['stdev']:.1e} s")
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            print(compare(results, json.load(baseline_file)))
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
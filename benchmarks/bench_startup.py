@@ -0,0 +1,105 @@
+"""
+Description: Benchmarks for the import and startup time of the mortgage package.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Run python benchmarks/bench_startup.py -o startup.json from the project
+root. Each target is imported in a fresh interpreter under python -X importtime,
+and the total import time, the number of modules loaded and whether numpy was
+loaded are reported, along with the wall time of starting the mortgage command.
+Bytecode is compiled first so the runs do not time compilation. Pass --compare
+with an earlier results file to print the change for each benchmark.
+"""
+import argparse
+import compileall
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from bench_mortgage import compare, metadata, summarize
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+#benchmark name: statement run in a fresh interpreter
+TARGETS = {
+    "import_package": "import mortgage",
+    "import_mortgage_class": "from mortgage.mortgage import Mortgage",
+    "import_cli": "import mortgage.cli",
+    "import_pipeline": "import mortgage.pipeline",
+}
+
+REPEATS = 10
+
+def import_profile(statement: str) -> tuple:
+
+    """Runs a statement under python -X importtime, returns a tuple of
+    (total import seconds, modules imported, names of the modules imported)"""
+
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], cwd=ROOT,
+                               capture_output=True, text=True, check=True)
+    total = 0
+    modules = []
+
+    #lines look like "import time:       self [us] |  cumulative | name", after one header line
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, _, name = line[len("import time:"):].split("|")
+        total += int(self_time)
+        modules.append(name.strip())
+
+    return total / 1e6, len(modules), modules
+
+def startup_seconds(arguments: list) -> float:
+
+    """Returns the wall time of running the mortgage command with the given arguments"""
+
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-m", "mortgage.cli", *arguments], cwd=ROOT,
+                   capture_output=True, check=True)
+    return time.perf_counter() - start
+
+def main(argv=None) -> int:
+
+    """Runs the startup benchmarks from the command line"""
+
+    parser = argparse.ArgumentParser(description="Benchmark the mortgage package startup.")
+    parser.add_argument("-o", "--output", help="file to save the JSON results to")
+    parser.add_argument("--compare", help="earlier JSON results to compare against")
+    parser.add_argument("--repeats", type=int, default=REPEATS, help="runs of each benchmark")
+    args = parser.parse_args(argv)
+
+    compileall.compile_dir(os.path.join(ROOT, "mortgage"), quiet=1)
+
+    timings = {}
+    details = {}
+    for name, statement in TARGETS.items():
+        profiles = [import_profile(statement) for _ in range(args.repeats)]
+        timings[name] = [seconds for seconds, _, _ in profiles]
+        _, module_count, modules = profiles[-1]
+        details[name] = {"modules": module_count, "numpy": "numpy" in modules}
+
+    timings["startup_cli_help"] = [startup_seconds(["--help"]) for _ in range(args.repeats)]
+
+    results = {"metadata": metadata(),
+               "benchmarks": [dict(summarize(name, runs), **details.get(name, {}))
+                              for name, runs in timings.items()]}
+
+    for entry in results["benchmarks"]:
+        extra = f"  modules {entry['modules']}  numpy {entry['numpy']}" if "modules" in entry else ""
+        print(f"{entry['name']:<30} median {statistics.median(entry['runs']) * 1000:.1f} ms{extra}")
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            print(compare(results, json.load(baseline_file)))
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
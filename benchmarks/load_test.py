@@ -0,0 +1,94 @@
+"""
+Description: A load test for the asyncio quoting server.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Run python benchmarks/load_test.py --clients 200 --requests 500 to start 
+a QuoteServer on a free localhost port and drive it with concurrent clients, 
+or pass --port to test a server that is already running. Prints the 
+throughput and latency percentiles of the single quote requests.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from mortgage.pixell_lookup import FREQUENCIES, RATES, VALID_AMORTIZATION
+from mortgage.server import DEFAULT_HOST, QuoteServer
+
+def random_quote(generator: random.Random) -> bytes:
+
+    """Returns one encoded single quote request"""
+
+    return json.dumps({"amount": round(generator.uniform(10_000, 1_000_000), 2),
+                       "rate": generator.choice(RATES).name,
+                       "frequency": generator.choice(FREQUENCIES).name,
+                       "amortization": generator.choice(sorted(VALID_AMORTIZATION))}).encode() + b"\n"
+
+async def run_client(host: str, port: int, requests: int, seed: int, latencies: list):
+
+    """Sends requests one at a time over one connection, recording the latency of each"""
+
+    generator = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+
+    for _ in range(requests):
+        start = time.perf_counter()
+        writer.write(random_quote(generator))
+        await writer.drain()
+        response = json.loads(await reader.readline())
+        latencies.append(time.perf_counter() - start)
+        if "payment" not in response:
+            raise RuntimeError(f"Unexpected response: {response}")
+
+    writer.close()
+    await writer.wait_closed()
+
+async def load_test(host: str, port: int, clients: int, requests: int) -> dict:
+
+    """Drives a quoting server with concurrent clients, returns the throughput and latencies"""
+
+    server = None
+    if port == 0:
+        server = QuoteServer(host, 0)
+        await server.start()
+        port = server.port
+
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(run_client(host, port, requests, seed, latencies) for seed in range(clients)))
+    elapsed = time.perf_counter() - start
+
+    result = {"requests": len(latencies), "seconds": elapsed, "requests_per_second": len(latencies) / elapsed}
+    percentiles = statistics.quantiles(latencies, n=100)
+    result.update({"p50_ms": percentiles[49] * 1000, "p99_ms": percentiles[98] * 1000})
+
+    if server is not None:
+        result["batches"] = server.batches
+        await server.close()
+
+    return result
+
+def main(argv=None) -> int:
+
+    """Runs the load test from the command line"""
+
+    parser = argparse.ArgumentParser(description="Load test the mortgage quoting server.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="address of the server")
+    parser.add_argument("--port", type=int, default=0, help="port of a running server (default: start one)")
+    parser.add_argument("--clients", type=int, default=100, help="concurrent connections")
+    parser.add_argument("--requests", type=int, default=200, help="requests per connection")
+    args = parser.parse_args(argv)
+
+    result = asyncio.run(load_test(args.host, args.port, args.clients, args.requests))
+    for name, value in result.items():
+        print(f"{name:<20} {value:,.2f}" if isinstance(value, float) else f"{name:<20} {value:,}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
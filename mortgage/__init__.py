@@ -0,0 +1,44 @@
+"""
+Description: The PiXELL River mortgage package.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Import modules directly, such as from mortgage.mortgage import Mortgage,
+or use the names listed in __all__ from the package itself. Those names are
+looked up on first use, so importing the package loads no submodule and
+numpy is only loaded by the features that need it.
+"""
+import importlib
+
+#name exported by the package: module that defines it
+_EXPORTS = {
+    "Mortgage": "mortgage.mortgage",
+    "MortgageRate": "mortgage.pixell_lookup",
+    "PaymentFrequency": "mortgage.pixell_lookup",
+    "VALID_AMORTIZATION": "mortgage.pixell_lookup",
+    "calculate_payments": "mortgage.batch",
+    "MortgagePortfolio": "mortgage.portfolio",
+    "process_file": "mortgage.pipeline",
+    "verify_file": "mortgage.verify",
+    "write_report": "mortgage.report",
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name: str):
+
+    """Imports the module defining an exported name the first time the name is used"""
+
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'mortgage' has no attribute '{name}'")
+
+    value = getattr(importlib.import_module(module_name), name)
+    #later lookups find the name directly without calling this function
+    globals()[name] = value
+    return value
+
+def __dir__():
+
+    """Returns the names of the package, including the exports not loaded yet"""
+
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,137 @@
+"""
+Description: Inverse payment calculations for what a borrower can afford.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Call max_principal(payment, "FIXED_5", "MONTHLY", 25) for the largest
+loan a payment covers, or min_amortization(amount, budget, "FIXED_5", "MONTHLY")
+for the shortest valid amortization period that keeps the payment within a
+budget. max_principals and min_amortizations answer the same questions for
+whole columns of clients at once. Every solver divides by or compares with
+the same precomputed annuity factors as Mortgage.calculate_payment, so
+there is no search over repeated payment calculations.
+"""
+import numpy as np
+
+from mortgage.batch import encode_frequencies, encode_rates, factor_array
+from mortgage.pixell_lookup import VALID_AMORTIZATION, annuity_factor, lookup_frequency, lookup_rate
+
+#amortization periods from the shortest, which has the highest payment, to the longest
+AMORTIZATIONS = tuple(sorted(VALID_AMORTIZATION))
+
+def _lookup_terms(rate, frequency) -> tuple:
+
+    """Returns the MortgageRate and PaymentFrequency for names or members, raising like Mortgage"""
+
+    rate = lookup_rate(getattr(rate, "name", rate))
+    if rate is None:
+        raise ValueError("Rate provided is invalid.")
+
+    frequency = lookup_frequency(getattr(frequency, "name", frequency))
+    if frequency is None:
+        raise ValueError("Frequency provided is invalid.")
+
+    return rate, frequency
+
+def max_principal(payment: float, rate, frequency, amortization: int) -> float:
+
+    """
+    Returns the largest loan amount the payment covers with the given terms
+
+    Arguments:
+    payment(float): the payment per period
+    rate(str or MortgageRate), frequency(str or PaymentFrequency), amortization(int): the terms
+
+    Raises:
+        ValueError: the payment must be positive, or the terms are not valid
+    """
+
+    if payment <= 0:
+        raise ValueError("Payment must be positive.")
+
+    rate, frequency = _lookup_terms(rate, frequency)
+    if amortization not in VALID_AMORTIZATION:
+        raise ValueError("Amortization provided is invalid.")
+
+    return payment / annuity_factor(rate, frequency, amortization)
+
+def min_amortization(loan_amount: float, budget: float, rate, frequency):
+
+    """
+    Returns the shortest valid amortization period whose payment for the loan is within the budget,
+    or None when even the longest period costs more
+
+    Raises:
+        ValueError: the loan amount and budget must be positive, or the terms are not valid
+    """
+
+    if loan_amount <= 0:
+        raise ValueError("Loan Amount must be positive.")
+    if budget <= 0:
+        raise ValueError("Budget must be positive.")
+
+    rate, frequency = _lookup_terms(rate, frequency)
+
+    for amortization in AMORTIZATIONS:
+        if loan_amount * annuity_factor(rate, frequency, amortization) <= budget:
+            return amortization
+    return None
+
+def max_principals(payments, rates, frequencies, amortizations) -> np.ndarray:
+
+    """
+    Returns the largest loan amount each payment covers, in one vectorized pass
+
+    Arguments:
+    payments(array of float): the payment per period of each client
+    rates, frequencies(sequences of names or members), amortizations(array of int): the terms
+
+    Raises:
+        ValueError: the columns must all have the same length, the payments must be positive,
+        or any of the terms are not valid
+    """
+
+    if not len(payments) == len(rates) == len(frequencies) == len(amortizations):
+        raise ValueError("Columns provided must have the same length.")
+
+    payments = np.asarray(payments, dtype=np.float64)
+    amortizations = np.asarray(amortizations)
+    if not np.all(payments > 0):
+        raise ValueError("Payment must be positive.")
+
+    rate_codes = encode_rates(rates)
+    frequency_codes = encode_frequencies(frequencies)
+    if not np.all(np.isin(amortizations, AMORTIZATIONS)):
+        raise ValueError("Amortization provided is invalid.")
+
+    return payments / factor_array()[rate_codes, frequency_codes, amortizations.astype(np.intp)]
+
+def min_amortizations(loan_amounts, budgets, rates, frequencies) -> np.ndarray:
+
+    """
+    Returns the shortest valid amortization period within each budget, in one vectorized pass,
+    0 for clients whose budget does not cover even the longest period
+
+    Raises:
+        ValueError: the columns must all have the same length, the loan amounts and budgets
+        must be positive, or any of the terms are not valid
+    """
+
+    if not len(loan_amounts) == len(budgets) == len(rates) == len(frequencies):
+        raise ValueError("Columns provided must have the same length.")
+
+    loan_amounts = np.asarray(loan_amounts, dtype=np.float64)
+    budgets = np.asarray(budgets, dtype=np.float64)
+    if not np.all(loan_amounts > 0):
+        raise ValueError("Loan Amount must be positive.")
+    if not np.all(budgets > 0):
+        raise ValueError("Budget must be positive.")
+
+    rate_codes = encode_rates(rates)
+    frequency_codes = encode_frequencies(frequencies)
+
+    #payment of every client for every period, shortest period first
+    factors = factor_array()[rate_codes[:, None], frequency_codes[:, None], np.array(AMORTIZATIONS)]
+    affordable = loan_amounts[:, None] * factors <= budgets[:, None]
+
+    shortest = np.take(AMORTIZATIONS, np.argmax(affordable, axis=1))
+    return np.where(affordable.any(axis=1), shortest, 0)
@@ -0,0 +1,251 @@
+"""
+Description: Portfolio totals grouped by rate, payment frequency and amortization period.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Call aggregate_file(path) to total a portfolio file in one streaming pass,
+or create a PortfolioAggregate and add() encoded columns such as those of a
+MortgagePortfolio or BinaryPortfolio. group_by("rate"), group_by("frequency",
+"amortization") or totals() then report the loan count, principal, sum of
+payments, annualized cash flow and principal-weighted average rate of each
+group. Aggregates are kept per term in fixed-size arrays, so partial results
+from shards or processes are combined with merge().
+"""
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from mortgage.batch import calculate_payments_from_codes
+from mortgage.pipeline import DEFAULT_CHUNK_SIZE, parse_chunk, read_chunks
+from mortgage.pixell_lookup import FREQUENCIES, RATES, VALID_AMORTIZATION
+
+GROUP_KEYS = ("rate", "frequency", "amortization")
+
+#totals are kept for every rate code, frequency code and amortization in years
+_SHAPE = (len(RATES), len(FREQUENCIES), max(VALID_AMORTIZATION) + 1)
+
+_PAYMENTS_PER_YEAR = np.array([frequency.value for frequency in FREQUENCIES], dtype=np.float64)
+
+class PortfolioAggregate:
+
+    """Running totals of a portfolio for every combination of rate, frequency and amortization"""
+
+    def __init__(self):
+
+        """Initializing an empty PortfolioAggregate object"""
+
+        self.count = np.zeros(_SHAPE, dtype=np.int64)
+        self.principal = np.zeros(_SHAPE)
+        self.payments = np.zeros(_SHAPE)
+        self.annual_cash_flow = np.zeros(_SHAPE)
+        #sum of annual rate times principal, divided by the principal for the weighted average rate
+        self.rate_principal = np.zeros(_SHAPE)
+        self.rejected = 0
+
+    def add(self, amounts, rate_codes, frequency_codes, amortizations, payments=None):
+
+        """
+        Adds a batch of encoded mortgages to the totals
+
+        Arguments:
+        amounts, rate_codes, frequency_codes, amortizations: encoded columns of valid mortgages
+        payments(array of float): the already calculated payments, calculated here when not given
+
+        Raises:
+            ValueError: a loan amount or amortization period is not valid
+        """
+
+        amounts = np.asarray(amounts, dtype=np.float64)
+        rate_codes = np.asarray(rate_codes, dtype=np.intp)
+        frequency_codes = np.asarray(frequency_codes, dtype=np.intp)
+        amortizations = np.asarray(amortizations, dtype=np.intp)
+
+        if payments is None:
+            payments = calculate_payments_from_codes(amounts, rate_codes, frequency_codes, amortizations)
+        payments = np.asarray(payments, dtype=np.float64)
+
+        annual_rates = np.array([rate.annual_rate for rate in RATES])
+        terms = np.ravel_multi_index((rate_codes, frequency_codes, amortizations), _SHAPE)
+        size = self.count.size
+
+        #one weighted count per column sums every mortgage into its term in a single pass
+        self.count += np.bincount(terms, minlength=size).reshape(_SHAPE)
+        self.principal += np.bincount(terms, amounts, size).reshape(_SHAPE)
+        self.payments += np.bincount(terms, payments, size).reshape(_SHAPE)
+        self.annual_cash_flow += np.bincount(terms, payments * _PAYMENTS_PER_YEAR[frequency_codes],
+                                             size).reshape(_SHAPE)
+        self.rate_principal += np.bincount(terms, amounts * annual_rates[rate_codes], size).reshape(_SHAPE)
+
+    def add_lines(self, lines):
+
+        """Parses a chunk of portfolio lines and adds its valid rows, counting the rejected ones"""
+
+        (_, amounts, rate_codes, frequency_codes, amortizations), rejects = parse_chunk(lines)
+        if amounts:
+            self.add(amounts, rate_codes, frequency_codes, amortizations)
+        self.rejected += len(rejects)
+
+    def merge(self, other: "PortfolioAggregate") -> "PortfolioAggregate":
+
+        """Adds the totals of another aggregate, such as one from another shard, returns this aggregate"""
+
+        self.count += other.count
+        self.principal += other.principal
+        self.payments += other.payments
+        self.annual_cash_flow += other.annual_cash_flow
+        self.rate_principal += other.rate_principal
+        self.rejected += other.rejected
+        return self
+
+    def group_by(self, *keys) -> list:
+
+        """
+        Returns one row for each group of mortgages with the same values of the keys
+
+        Arguments:
+        keys(str): any of rate, frequency and amortization, none for the portfolio total
+
+        Raises:
+            ValueError: a key is not one of the group keys
+
+        Each row is a dict holding the key values, count, principal, payments,
+        annual_cash_flow and weighted_average_rate of its group, in code order.
+        """
+
+        for key in keys:
+            if key not in GROUP_KEYS:
+                raise ValueError("Group key provided is invalid.")
+
+        #sum over the dimensions that are not grouped on
+        summed_axes = tuple(axis for axis, key in enumerate(GROUP_KEYS) if key not in keys)
+        totals = [array.sum(axis=summed_axes, keepdims=True)
+                  for array in (self.count, self.principal, self.payments, self.annual_cash_flow,
+                                self.rate_principal)]
+
+        rows = []
+        for index in zip(*np.nonzero(totals[0])):
+            count, principal, payments, annual_cash_flow, rate_principal = (total[index] for total in totals)
+            row = {key: value for key, value in zip(GROUP_KEYS, (RATES[index[0]], FREQUENCIES[index[1]], index[2]))
+                   if key in keys}
+            row.update(count=int(count), principal=float(principal), payments=float(payments),
+                       annual_cash_flow=float(annual_cash_flow),
+                       weighted_average_rate=float(rate_principal / principal))
+            rows.append(row)
+
+        return rows
+
+    def totals(self) -> dict:
+
+        """Returns the totals of the whole portfolio, with a count of 0 when it is empty"""
+
+        rows = self.group_by()
+        return rows[0] if rows else {"count": 0, "principal": 0.0, "payments": 0.0,
+                                     "annual_cash_flow": 0.0, "weighted_average_rate": 0.0}
+
+def aggregate_stream(input_file, chunk_size: int = DEFAULT_CHUNK_SIZE) -> PortfolioAggregate:
+
+    """Totals every line of an open portfolio file chunk by chunk"""
+
+    aggregate = PortfolioAggregate()
+    for lines in read_chunks(input_file, chunk_size):
+        aggregate.add_lines(lines)
+    return aggregate
+
+def aggregate_shard(input_path: str, start: int, end: int) -> PortfolioAggregate:
+
+    """Totals the lines between two byte offsets of a portfolio file"""
+
+    with open(input_path, "rb") as input_file:
+        input_file.seek(start)
+        lines = input_file.read(end - start).decode().splitlines()
+
+    aggregate = PortfolioAggregate()
+    aggregate.add_lines(lines)
+    return aggregate
+
+def aggregate_file(input_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE, workers: int = 1,
+                   shard_bytes: int = None) -> PortfolioAggregate:
+
+    """
+    Totals a portfolio file in one pass, or in byte-range shards totalled by a pool of
+    worker processes and merged when workers is not 1 (0 or None for one per CPU)
+
+    Raises:
+        ValueError: the chunk size, number of workers or shard size is not positive
+        FileNotFoundError: the file does not exist
+    """
+
+    if workers == 1:
+        with open(input_path, "r") as input_file:
+            return aggregate_stream(input_file, chunk_size)
+
+    #imported here so the serial path does not need the sharding helpers
+    from mortgage.parallel import DEFAULT_SHARD_BYTES, shard_ranges
+
+    workers = workers or os.cpu_count() or 1
+    if workers <= 0:
+        raise ValueError("Number of workers must be positive.")
+
+    ranges = shard_ranges(input_path, shard_bytes or DEFAULT_SHARD_BYTES)
+    aggregate = PortfolioAggregate()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        starts = [start for start, _ in ranges]
+        ends = [end for _, end in ranges]
+        for partial in executor.map(aggregate_shard, [input_path] * len(ranges), starts, ends):
+            aggregate.merge(partial)
+
+    return aggregate
+
+def format_rows(rows, keys) -> str:
+
+    """Returns group rows as an aligned text table"""
+
+    header = [f"{key:<12}" for key in keys] + [f"{'count':>10}", f"{'principal':>18}", f"{'payments':>16}",
+                                               f"{'annual cash flow':>18}", f"{'avg rate':>8}"]
+    lines = ["  ".join(header)]
+
+    for row in rows:
+        values = [f"{getattr(row[key], 'name', row[key])!s:<12}" for key in keys]
+        values += [f"{row['count']:>10,}", f"{row['principal']:>18,.2f}", f"{row['payments']:>16,.2f}",
+                   f"{row['annual_cash_flow']:>18,.2f}", f"{row['weighted_average_rate'] * 100:>7.3f}%"]
+        lines.append("  ".join(values))
+
+    return "\n".join(lines)
+
+def build_parser() -> argparse.ArgumentParser:
+
+    """Returns the command line parser for the aggregate command"""
+
+    parser = argparse.ArgumentParser(description="Total a portfolio file by rate, frequency and amortization.")
+    parser.add_argument("input", help="portfolio file with one amount,rate,amortization,frequency per line")
+    parser.add_argument("--by", nargs="*", choices=GROUP_KEYS, default=list(GROUP_KEYS),
+                        help="keys to group by, none for the portfolio total")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="lines per chunk")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes, 0 for one per CPU")
+    parser.add_argument("--shard-bytes", type=int, help="bytes of the file each worker task totals")
+    return parser
+
+def main(argv=None) -> int:
+
+    """Prints the totals of a portfolio file from the command line, returns the exit code"""
+
+    args = build_parser().parse_args(argv)
+
+    try:
+        aggregate = aggregate_file(args.input, args.chunk_size, args.workers, args.shard_bytes)
+    except FileNotFoundError:
+        print("File was not found", file=sys.stderr)
+        return 1
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    print(format_rows(aggregate.group_by(*args.by), args.by))
+    print(f"Rejected rows: {aggregate.rejected}", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+"""
+Description: Vectorized payment calculations for whole mortgage portfolios.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Pass columns of loan amounts, rates, frequencies and amortization 
+periods to calculate_payments to price every mortgage in a single pass 
+instead of creating one Mortgage object per record.
+"""
+import numpy as np
+
+from mortgage.pixell_lookup import (FREQUENCIES, FREQUENCY_CODES, RATE_CODES, RATES, VALID_AMORTIZATION, 
+                                    annuity_factors)
+
+#the annuity factor table as an array indexed by [rate code, frequency code, amortization],
+#along with the lookup table it was copied from so it is rebuilt when that table is
+_factor_array = None
+_factor_source = None
+
+def factor_array() -> np.ndarray:
+
+    """Returns the annuity factors as an array indexed by rate code, frequency code 
+    and amortization, with NaN for amortization periods that are not valid"""
+
+    global _factor_array, _factor_source
+
+    factors = annuity_factors()
+    if factors is not _factor_source:
+        array = np.full((len(RATES), len(FREQUENCIES), max(VALID_AMORTIZATION) + 1), np.nan)
+        for rate_code, rate in enumerate(RATES):
+            for frequency_code, frequency in enumerate(FREQUENCIES):
+                for amortization in VALID_AMORTIZATION:
+                    array[rate_code, frequency_code, amortization] = factors[(rate, frequency, amortization)]
+        _factor_array, _factor_source = array, factors
+    return _factor_array
+
+def _encode(values, codes: dict, message: str) -> np.ndarray:
+
+    """Converts a column of enum names or members into an array of integer codes,
+    raising a ValueError with the given message if any value is invalid"""
+
+    if isinstance(values, np.ndarray) and values.dtype.kind == "U":
+        if values.ndim != 1:
+            raise ValueError(message)
+        #an array of names is compared with each of the few valid names in turn
+        encoded = np.full(len(values), -1, dtype=np.intp)
+        for name, code in codes.items():
+            encoded[values == name] = code
+        if np.any(encoded < 0):
+            raise ValueError(message)
+        return encoded
+
+    try:
+        #a column of names is looked up without a Python loop
+        return np.fromiter(map(codes.__getitem__, values), dtype=np.intp, count=len(values))
+    except (KeyError, TypeError):
+        #enum members, and values that are not names at all, are looked up one by one below
+        pass
+
+    encoded = np.empty(len(values), dtype=np.intp)
+    try:
+        for index, value in enumerate(values):
+            #enum members are looked up by name so both forms are accepted
+            encoded[index] = codes[getattr(value, "name", value)]
+    except (KeyError, TypeError):
+        raise ValueError(message)
+    return encoded
+
+def encode_rates(rates) -> np.ndarray:
+
+    """Returns the integer rate codes for a column of MortgageRate names or members"""
+
+    return _encode(rates, RATE_CODES, "Rate provided is invalid.")
+
+def encode_frequencies(frequencies) -> np.ndarray:
+
+    """Returns the integer frequency codes for a column of PaymentFrequency names or members"""
+
+    return _encode(frequencies, FREQUENCY_CODES, "Frequency provided is invalid.")
+
+def check_rate_codes(rate_codes: np.ndarray):
+
+    """Raises the Mortgage rate error if any rate code is not a position in MortgageRate,
+    as codes outside the table would wrap around or fail to index it"""
+
+    if not np.all((rate_codes >= 0) & (rate_codes < len(RATES))):
+        raise ValueError("Rate provided is invalid.")
+
+def check_frequency_codes(frequency_codes: np.ndarray):
+
+    """Raises the Mortgage frequency error if any frequency code is not a position in PaymentFrequency"""
+
+    if not np.all((frequency_codes >= 0) & (frequency_codes < len(FREQUENCIES))):
+        raise ValueError("Frequency provided is invalid.")
+
+def calculate_payments_from_codes(amounts, rate_codes, frequency_codes, amortizations) -> np.ndarray:
+
+    """
+    Calculates the payment of every mortgage from already encoded columns
+    
+    Arguments:
+    amounts(array of float): the loan amounts
+    rate_codes(array of int): positions of the rates in MortgageRate
+    frequency_codes(array of int): positions of the frequencies in PaymentFrequency
+    amortizations(array of int): the amortization periods in years
+
+    Raises:
+        ValueError:
+        the loan amounts must be positive,
+        the amortization periods provided must be valid
+    """
+
+    amounts = np.asarray(amounts, dtype=np.float64)
+    rate_codes = np.asarray(rate_codes, dtype=np.intp)
+    frequency_codes = np.asarray(frequency_codes, dtype=np.intp)
+    amortizations = np.asarray(amortizations)
+
+    if not np.all((amounts > 0) & (amounts < np.inf)):
+        raise ValueError("Loan Amount must be positive.")
+
+    check_rate_codes(rate_codes)
+    check_frequency_codes(frequency_codes)
+
+    if not np.all(np.isin(amortizations, tuple(VALID_AMORTIZATION))):
+        raise ValueError("Amortization provided is invalid.")
+
+    #same precomputed annuity factors as Mortgage.calculate_payment
+    return amounts * factor_array()[rate_codes, frequency_codes, amortizations.astype(np.intp)]
+
+def calculate_payments(amounts, rates, frequencies, amortizations) -> np.ndarray:
+
+    """
+    Calculates the payment of every mortgage in a portfolio in one vectorized pass
+    
+    Arguments:
+    amounts(array of float): the loan amounts
+    rates(sequence of str or MortgageRate): the rate of each mortgage
+    frequencies(sequence of str or PaymentFrequency): the payment frequency of each mortgage
+    amortizations(array of int): the amortization periods in years
+
+    Raises:
+        ValueError: 
+        the columns must all have the same length,
+        any of the validation errors raised by the Mortgage class
+
+    Returns an array holding the payment of each mortgage.
+    """
+
+    if not len(amounts) == len(rates) == len(frequencies) == len(amortizations):
+        raise ValueError("Columns provided must have the same length.")
+
+    return calculate_payments_from_codes(
+        amounts, encode_rates(rates), encode_frequencies(frequencies), amortizations)
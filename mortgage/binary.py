@@ -0,0 +1,191 @@
+"""
+Description: A compact binary portfolio format read through memory mapping.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Run python -m mortgage.binary convert INPUT OUTPUT to parse a text
+portfolio once into fixed-width records (float64 amount, uint8 rate code,
+uint8 frequency code, uint8 amortization), then open_portfolio(OUTPUT) or
+python -m mortgage.binary price OUTPUT for repeat pricing runs. The reader
+maps the file into memory, so its columns are numpy views of the file with
+no parsing or copying.
+"""
+import argparse
+import sys
+
+import numpy as np
+
+from mortgage.batch import calculate_payments_from_codes
+from mortgage.pipeline import (DEFAULT_CHUNK_SIZE, PipelineSummary, format_rejects, open_output, parse_chunk,
+                               read_chunks)
+from mortgage.pixell_lookup import FREQUENCIES, RATES
+
+#the header identifies the format and its version, the records follow it directly
+MAGIC = b"PXRMTG\x00\x01"
+HEADER_SIZE = len(MAGIC)
+
+RECORD_DTYPE = np.dtype([("amount", "<f8"), ("rate", "u1"), ("frequency", "u1"), ("amortization", "u1")])
+
+class BinaryPortfolio:
+
+    """A portfolio whose columns are views of a memory-mapped binary file"""
+
+    def __init__(self, records: np.ndarray):
+
+        """Initializing a BinaryPortfolio object over an array of records"""
+
+        self.records = records
+        self.amounts = records["amount"]
+        self.rate_codes = records["rate"]
+        self.frequency_codes = records["frequency"]
+        self.amortizations = records["amortization"]
+
+    def __len__(self):
+
+        """Returns the number of mortgages in the portfolio"""
+
+        return len(self.records)
+
+    def calculate_payments(self, start: int = 0, end: int = None) -> np.ndarray:
+
+        """Calculates the payments of the records from start to end in one vectorized pass"""
+
+        return calculate_payments_from_codes(self.amounts[start:end], self.rate_codes[start:end],
+                                             self.frequency_codes[start:end], self.amortizations[start:end])
+
+def encode_records(amounts, rate_codes, frequency_codes, amortizations) -> np.ndarray:
+
+    """Packs encoded columns into an array of binary records"""
+
+    records = np.empty(len(amounts), dtype=RECORD_DTYPE)
+    records["amount"] = amounts
+    records["rate"] = rate_codes
+    records["frequency"] = frequency_codes
+    records["amortization"] = amortizations
+    return records
+
+def convert_stream(input_file, output_file, reject_file, chunk_size: int = DEFAULT_CHUNK_SIZE) -> PipelineSummary:
+
+    """Converts an open text portfolio into binary records written to an open binary file,
+    writing rejected rows to the reject stream, returns a summary of the conversion"""
+
+    summary = PipelineSummary()
+    output_file.write(MAGIC)
+
+    for lines in read_chunks(input_file, chunk_size):
+        (rows, amounts, rate_codes, frequency_codes, amortizations), rejects = parse_chunk(lines)
+        output_file.write(encode_records(amounts, rate_codes, frequency_codes, amortizations).tobytes())
+        reject_file.write(format_rejects(rejects))
+        summary.add(len(rows), len(rejects))
+
+    return summary
+
+def convert_text(input_path: str, output_path: str, reject_path: str = "-",
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> PipelineSummary:
+
+    """Converts a text portfolio file into a binary portfolio file, writing rejected rows
+    to reject_path (stderr when -), returns a summary of the conversion"""
+
+    with open(input_path, "r") as input_file, open(output_path, "wb") as output_file:
+        reject_file = open_output(reject_path, sys.stderr)
+        try:
+            return convert_stream(input_file, output_file, reject_file, chunk_size)
+        finally:
+            if reject_file is not sys.stderr:
+                reject_file.close()
+
+def open_portfolio(path: str) -> BinaryPortfolio:
+
+    """
+    Opens a binary portfolio file by mapping it into memory
+
+    Raises:
+        ValueError: the file is not a binary portfolio file
+        FileNotFoundError: the file does not exist
+    """
+
+    with open(path, "rb") as input_file:
+        header = input_file.read(HEADER_SIZE)
+        input_file.seek(0, 2)
+        size = input_file.tell()
+
+    if header != MAGIC or (size - HEADER_SIZE) % RECORD_DTYPE.itemsize:
+        raise ValueError("File is not a binary portfolio.")
+
+    if size == HEADER_SIZE:
+        #an empty file can not be memory mapped
+        return BinaryPortfolio(np.empty(0, dtype=RECORD_DTYPE))
+
+    return BinaryPortfolio(np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=HEADER_SIZE))
+
+def price_stream(portfolio: BinaryPortfolio, output_file, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+
+    """Writes every record of a binary portfolio with its payment to an open text stream,
+    a chunk at a time, returns the number of records priced"""
+
+    rate_names = [rate.name for rate in RATES]
+    frequency_names = [frequency.name for frequency in FREQUENCIES]
+
+    for start in range(0, len(portfolio), chunk_size):
+        end = start + chunk_size
+        payments = portfolio.calculate_payments(start, end)
+        output_file.write("".join(
+            f"{amount},{rate_names[rate]},{amortization},{frequency_names[frequency]},{payment:.2f}\n"
+            for amount, rate, amortization, frequency, payment in zip(
+                portfolio.amounts[start:end].tolist(), portfolio.rate_codes[start:end].tolist(),
+                portfolio.amortizations[start:end].tolist(), portfolio.frequency_codes[start:end].tolist(),
+                payments.tolist())))
+
+    return len(portfolio)
+
+def build_parser() -> argparse.ArgumentParser:
+
+    """Returns the command line parser for the binary format commands"""
+
+    parser = argparse.ArgumentParser(description="Convert and price binary portfolio files.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    convert = commands.add_parser("convert", help="convert a text portfolio to the binary format")
+    convert.add_argument("input", help="text portfolio file")
+    convert.add_argument("output", help="binary portfolio file to write")
+    convert.add_argument("--rejects", default="-", help="file for rejected rows (default: stderr)")
+    convert.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="lines per chunk")
+
+    price = commands.add_parser("price", help="price a binary portfolio")
+    price.add_argument("input", help="binary portfolio file")
+    price.add_argument("-o", "--output", default="-", help="file for priced rows (default: stdout)")
+    price.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="records per chunk")
+
+    return parser
+
+def main(argv=None) -> int:
+
+    """Runs the binary format commands from the command line, returns the exit code"""
+
+    args = build_parser().parse_args(argv)
+
+    try:
+        if args.command == "convert":
+            summary = convert_text(args.input, args.output, args.rejects, args.chunk_size)
+            print(f"Converted {summary.priced} of {summary.rows} rows, rejected {summary.rejected}.", file=sys.stderr)
+        else:
+            if args.chunk_size <= 0:
+                raise ValueError("Chunk size must be positive.")
+            portfolio = open_portfolio(args.input)
+            output_file = open_output(args.output, sys.stdout)
+            try:
+                priced = price_stream(portfolio, output_file, args.chunk_size)
+            finally:
+                if output_file is not sys.stdout:
+                    output_file.close()
+            print(f"Priced {priced} rows.", file=sys.stderr)
+    except FileNotFoundError:
+        print("File was not found", file=sys.stderr)
+        return 1
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+"""
+Description: An optional bounded cache of quoted mortgage payments.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Call enable_payment_cache(maxsize) to keep a shared least recently
+used cache of quotes, then quote_payment(amount, rate, frequency,
+amortization) for each request. A repeated request is answered from the
+cache without building and validating a Mortgage, which is most of the cost
+of a quote now that payments come from the annuity factor table. Requests
+are keyed by their raw terms together with the rate table in effect, so
+loading new rates never returns a stale payment, and Mortgage instances are
+never cached, so their setters can not leave one behind. Invalid requests
+raise the Mortgage errors and are not cached. Call disable_payment_cache to
+go back to building a Mortgage for every quote.
+"""
+from functools import lru_cache
+
+from mortgage.mortgage import Mortgage
+from mortgage.pixell_lookup import current_rate_table
+
+DEFAULT_MAXSIZE = 4096
+
+#PaymentCache used by quote_payment, set through enable_payment_cache
+_payment_cache = None
+
+def _quote(table, loan_amount, rate, frequency, amortization) -> float:
+
+    """Validates the terms with the Mortgage class, returns their payment under the rate table"""
+
+    mortgage = Mortgage(loan_amount, rate, frequency, amortization)
+    return loan_amount * table.factors[(mortgage.rate, mortgage.frequency, amortization)]
+
+class PaymentCache:
+
+    """A least recently used cache of quoted payments with hit, miss and eviction counters"""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+
+        """
+        Initializing an empty PaymentCache object
+
+        Arguments:
+        maxsize(int): the most payments kept before the least recently used is evicted
+
+        Raises:
+            ValueError: the size must be positive
+        """
+
+        if maxsize <= 0:
+            raise ValueError("Cache size must be positive.")
+
+        self.maxsize = maxsize
+        #functools.lru_cache keeps the entries and counters in C behind its own lock,
+        #so a hit costs about as much as one dictionary lookup
+        self.__quotes = lru_cache(maxsize)(_quote)
+        #counters from before the last clear, as lru_cache resets its own when cleared
+        self.__past_hits = self.__past_misses = self.__past_evictions = 0
+        #misses since the last clear that raised, which lru_cache counts but does not store
+        self.__failures = 0
+
+    def payment(self, loan_amount: float, rate, frequency, amortization: int) -> float:
+
+        """
+        Returns the payment for the given terms, validating and calculating it on a miss
+
+        Raises:
+            ValueError: any of the validation errors raised by the Mortgage class
+        """
+
+        try:
+            return self.__quotes(current_rate_table(), loan_amount, rate, frequency, amortization)
+        except ValueError:
+            self.__failures += 1
+            raise
+        except TypeError:
+            #terms that can not be hashed are not cached, the Mortgage class reports what is wrong with them
+            return Mortgage(loan_amount, rate, frequency, amortization).calculate_payment()
+
+    @property
+    def hits(self) -> int:
+
+        """Returns the number of quotes answered from the cache"""
+
+        return self.__past_hits + self.__quotes.cache_info().hits
+
+    @property
+    def misses(self) -> int:
+
+        """Returns the number of quotes that had to be calculated"""
+
+        return self.__past_misses + self.__quotes.cache_info().misses
+
+    @property
+    def evictions(self) -> int:
+
+        """Returns the number of payments evicted to make room for newer ones"""
+
+        info = self.__quotes.cache_info()
+        #every miss that did not raise was stored, so the ones no longer stored were evicted
+        return self.__past_evictions + info.misses - self.__failures - info.currsize
+
+    def clear(self):
+
+        """Removes every stored payment, keeping the counters"""
+
+        self.__past_hits, self.__past_misses, self.__past_evictions = self.hits, self.misses, self.evictions
+        self.__failures = 0
+        self.__quotes.cache_clear()
+
+    def stats(self) -> dict:
+
+        """Returns the counters and current size of the cache"""
+
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "size": len(self), "maxsize": self.maxsize}
+
+    def __len__(self):
+
+        """Returns the number of stored payments"""
+
+        return self.__quotes.cache_info().currsize
+
+def enable_payment_cache(maxsize: int = DEFAULT_MAXSIZE) -> PaymentCache:
+
+    """Makes quote_payment use a new shared PaymentCache, returns that cache"""
+
+    global _payment_cache
+    _payment_cache = PaymentCache(maxsize)
+    return _payment_cache
+
+def disable_payment_cache():
+
+    """Makes quote_payment build a Mortgage for every quote again"""
+
+    global _payment_cache
+    _payment_cache = None
+
+def payment_cache():
+
+    """Returns the PaymentCache in use, or None when caching is disabled"""
+
+    return _payment_cache
+
+def quote_payment(loan_amount: float, rate, frequency, amortization: int) -> float:
+
+    """
+    Returns the payment for one request, from the shared cache when it is enabled
+
+    Raises:
+        ValueError: any of the validation errors raised by the Mortgage class
+    """
+
+    cache = _payment_cache
+    if cache is not None:
+        return cache.payment(loan_amount, rate, frequency, amortization)
+    return Mortgage(loan_amount, rate, frequency, amortization).calculate_payment()
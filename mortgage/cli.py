@@ -0,0 +1,62 @@
+"""
+Description: The mortgage command, a single entry point for every command line tool.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Run mortgage COMMAND [ARGUMENTS], for example mortgage price INPUT -o OUTPUT
+or mortgage verify INPUT, and mortgage COMMAND --help for the arguments of a
+command. Run mortgage with no command to print the report of
+data/pixell_river_mortgages.txt, as main.py did. Only the module of the
+command that runs is imported, so a short job does not pay for the others.
+"""
+import argparse
+import importlib
+import os
+import sys
+
+#command: (module whose main runs it, description)
+COMMANDS = {
+    "price": ("mortgage.pipeline", "price a portfolio file in chunks"),
+    "report": ("mortgage.report", "write a text, CSV or JSON Lines payment report"),
+    "verify": ("mortgage.verify", "check payments against the expected payments in a file"),
+    "incremental": ("mortgage.incremental", "price only the rows that changed since the last run"),
+    "aggregate": ("mortgage.aggregation", "total a portfolio file by rate, frequency and amortization"),
+    "compare": ("mortgage.comparison", "compare the payments of a loan under every payment frequency"),
+    "simulate": ("mortgage.simulation", "simulate variable rates and prepayments over a portfolio file"),
+    "generate": ("mortgage.synthetic", "write a synthetic portfolio file, with invalid rows if asked"),
+    "binary": ("mortgage.binary", "convert and price binary portfolio files"),
+    "serve": ("mortgage.server", "serve payment quotes over a line protocol"),
+}
+
+DEFAULT_INPUT = os.path.join("data", "pixell_river_mortgages.txt")
+SEPARATOR = "*" * 50
+
+def build_parser() -> argparse.ArgumentParser:
+
+    """Returns the command line parser for the mortgage command"""
+
+    parser = argparse.ArgumentParser(
+        prog="mortgage", description="PiXELL River mortgage tools.",
+        epilog="commands:\n" + "\n".join(f"  {name:<12} {description}"
+                                         for name, (_, description) in COMMANDS.items()),
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", nargs="?", choices=COMMANDS, metavar="COMMAND",
+                        help="command to run (default: report of the PiXELL River sample file)")
+    parser.add_argument("arguments", nargs=argparse.REMAINDER, help="arguments of the command")
+    return parser
+
+def main(argv=None) -> int:
+
+    """Runs a mortgage command, returns its exit code"""
+
+    args = build_parser().parse_args(argv)
+
+    if args.command is None:
+        command, arguments = "report", [DEFAULT_INPUT, "--separator", SEPARATOR]
+    else:
+        command, arguments = args.command, args.arguments
+
+    module = importlib.import_module(COMMANDS[command][0])
+    return module.main(arguments)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+"""
+Description: Payments, total paid and total interest of loans under every payment frequency.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Call compare_loan(682912.43, "FIXED_1", 10) for one loan, or
+compare_frequencies(amounts, rate_codes, amortizations) and
+compare_portfolio(portfolio) for every loan of a portfolio in one pass. Each
+returns a FrequencyComparison with one row per loan and one column per plan
+in PLANS: monthly, bi-weekly and weekly, and accelerated bi-weekly and weekly,
+which pay half or a quarter of the monthly payment every period so the loan
+is repaid early. Every amount scales with the loan, so the figures are worked
+out once per dollar for each rate and amortization and shared by every loan
+on those terms. Run python -m mortgage.comparison AMOUNT RATE AMORTIZATION
+to print the table of one loan.
+"""
+import argparse
+import sys
+from typing import NamedTuple
+
+import numpy as np
+
+from mortgage.batch import check_rate_codes, encode_rates, factor_array
+from mortgage.pixell_lookup import FREQUENCIES, RATES, VALID_AMORTIZATION, PaymentFrequency
+
+#plan name: (payment frequency, fraction of the monthly payment paid each period, None for the regular payment)
+PLANS = {
+    "MONTHLY": (PaymentFrequency.MONTHLY, None),
+    "BI_WEEKLY": (PaymentFrequency.BI_WEEKLY, None),
+    "WEEKLY": (PaymentFrequency.WEEKLY, None),
+    "ACCELERATED_BI_WEEKLY": (PaymentFrequency.BI_WEEKLY, 1 / 2),
+    "ACCELERATED_WEEKLY": (PaymentFrequency.WEEKLY, 1 / 4),
+}
+
+PLAN_NAMES = tuple(PLANS)
+
+#per-dollar figures of every plan, along with the factor array they were worked out from
+_plan_table = None
+_plan_source = None
+
+class FrequencyComparison(NamedTuple):
+
+    """The payment, number of payments, total paid and total interest of each loan under
+    each plan. Every array has one row per loan and one column per plan, in PLAN_NAMES order."""
+
+    plans: tuple
+    payment: np.ndarray
+    number_of_payments: np.ndarray
+    total_paid: np.ndarray
+    total_interest: np.ndarray
+
+def _accelerated_totals(annual_rate: float, frequency: int, payment: float) -> tuple:
+
+    """Returns the number of payments and total paid per dollar borrowed when the given
+    payment is made every period, the last payment only clearing the remaining balance"""
+
+    interest_rate = annual_rate / frequency
+    growth = 1 + interest_rate
+
+    #the balance reaches zero after n payments, where (1 + i) ** n = payment / (payment - i)
+    periods = np.log(payment / (payment - interest_rate)) / np.log(growth)
+    #full payments before the last one, allowing for a period count that is a whole number up to rounding
+    full_payments = int(np.ceil(periods - 1e-9)) - 1
+
+    balance = growth ** full_payments - payment * (growth ** full_payments - 1) / interest_rate
+    return full_payments + 1, full_payments * payment + balance * growth
+
+def plan_table() -> tuple:
+
+    """
+    Returns the payment, number of payments and total paid per dollar borrowed of each plan
+
+    Each array is indexed by [rate code, amortization, plan], with NaN for amortization
+    periods that are not valid. The table is rebuilt when the rates change.
+    """
+
+    global _plan_table, _plan_source
+
+    factors = factor_array()
+    if factors is not _plan_source:
+        shape = (len(RATES), factors.shape[2], len(PLANS))
+        payments, totals = np.full(shape, np.nan), np.full(shape, np.nan)
+        number_of_payments = np.zeros(shape, dtype=np.int64)
+        monthly = FREQUENCIES.index(PaymentFrequency.MONTHLY)
+
+        for rate_code, rate in enumerate(RATES):
+            for amortization in VALID_AMORTIZATION:
+                for plan, (frequency, fraction) in enumerate(PLANS.values()):
+                    if fraction is None:
+                        payment = factors[rate_code, FREQUENCIES.index(frequency), amortization]
+                        periods = amortization * frequency.value
+                        total = payment * periods
+                    else:
+                        payment = factors[rate_code, monthly, amortization] * fraction
+                        periods, total = _accelerated_totals(rate.annual_rate, frequency.value, payment)
+                    index = rate_code, amortization, plan
+                    payments[index], number_of_payments[index], totals[index] = payment, periods, total
+
+        _plan_table, _plan_source = (payments, number_of_payments, totals), factors
+    return _plan_table
+
+def compare_frequencies(amounts, rate_codes, amortizations) -> FrequencyComparison:
+
+    """
+    Compares every plan for each loan given as encoded columns
+
+    Arguments:
+    amounts(array of float): the loan amounts
+    rate_codes(array of int): positions of the rates in MortgageRate
+    amortizations(array of int): the amortization periods in years
+
+    Raises:
+        ValueError:
+        the loan amounts must be positive,
+        the rate codes provided must be valid,
+        the amortization periods provided must be valid
+    """
+
+    amounts = np.asarray(amounts, dtype=np.float64)
+    rate_codes = np.asarray(rate_codes, dtype=np.intp)
+    amortizations = np.asarray(amortizations)
+
+    if not np.all((amounts > 0) & (amounts < np.inf)):
+        raise ValueError("Loan Amount must be positive.")
+
+    check_rate_codes(rate_codes)
+
+    if not np.all(np.isin(amortizations, tuple(VALID_AMORTIZATION))):
+        raise ValueError("Amortization provided is invalid.")
+
+    payments, number_of_payments, totals = plan_table()
+    terms = rate_codes, amortizations.astype(np.intp)
+
+    #one gather per figure, scaled by the loan amount
+    payment = amounts[:, None] * payments[terms]
+    total_paid = amounts[:, None] * totals[terms]
+    return FrequencyComparison(PLAN_NAMES, payment, number_of_payments[terms], total_paid,
+                               total_paid - amounts[:, None])
+
+def compare_portfolio(portfolio) -> FrequencyComparison:
+
+    """Compares every plan for each loan of a MortgagePortfolio, BinaryPortfolio or any
+    object with amounts, rate_codes and amortizations columns, whatever their frequency"""
+
+    return compare_frequencies(portfolio.amounts, portfolio.rate_codes, portfolio.amortizations)
+
+def compare_loan(loan_amount: float, rate, amortization: int) -> FrequencyComparison:
+
+    """
+    Compares every plan for one loan
+
+    Arguments:
+    loan_amount(float): the loan amount
+    rate(str or MortgageRate): the rate of the loan
+    amortization(int): the amortization period in years
+
+    Raises:
+        ValueError: any of the validation errors raised by the Mortgage class
+    """
+
+    if not 0 < loan_amount < np.inf:
+        raise ValueError("Loan Amount must be positive.")
+    if amortization not in VALID_AMORTIZATION:
+        raise ValueError("Amortization provided is invalid.")
+
+    return compare_frequencies([loan_amount], encode_rates([rate]), [amortization])
+
+def format_comparison(comparison: FrequencyComparison, row: int = 0) -> str:
+
+    """Returns the plans of one loan of a comparison as an aligned text table"""
+
+    lines = [f"{'plan':<22}  {'payment':>12}  {'payments':>8}  {'years':>5}  {'total paid':>16}  "
+             f"{'total interest':>16}"]
+
+    for plan, name in enumerate(comparison.plans):
+        frequency = PLANS[name][0].value
+        number_of_payments = int(comparison.number_of_payments[row, plan])
+        lines.append(f"{name:<22}  {comparison.payment[row, plan]:>12,.2f}  {number_of_payments:>8}  "
+                     f"{number_of_payments / frequency:>5.1f}  {comparison.total_paid[row, plan]:>16,.2f}  "
+                     f"{comparison.total_interest[row, plan]:>16,.2f}")
+
+    return "\n".join(lines)
+
+def build_parser() -> argparse.ArgumentParser:
+
+    """Returns the command line parser for the compare command"""
+
+    parser = argparse.ArgumentParser(description="Compare the payments of a loan under every payment frequency.")
+    parser.add_argument("amount", type=float, help="loan amount")
+    parser.add_argument("rate", help="rate name, for example FIXED_5")
+    parser.add_argument("amortization", type=int, help="amortization period in years")
+    return parser
+
+def main(argv=None) -> int:
+
+    """Prints the comparison of one loan from the command line, returns the exit code"""
+
+    args = build_parser().parse_args(argv)
+
+    try:
+        comparison = compare_loan(args.amount, args.rate, args.amortization)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    print(format_comparison(comparison))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+"""
+Description: Randomized equivalence checks of payment paths against the Mortgage class.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Pass any alternative way of calculating payments to check_payments,
+as a function of columns of amounts, rate names, frequency names and
+amortization periods, or any alternative way of reading portfolio lines to
+check_lines, as a function of a list of lines returning the payments of the
+valid rows and the (row, message) pairs of the rejected ones. Both draw
+random inputs from a seed, validate them with one Mortgage per row the way
+main.py always has, price the valid ones with the annuity formula from the
+rates the enum was defined with rather than the shared factor tables, and
+raise an AssertionError naming the
+seed and the first input that differs by more than a cent tolerance. The
+same seed always draws the same inputs, so a failure can be replayed.
+"""
+import numpy as np
+
+from mortgage.mortgage import Mortgage
+from mortgage.pixell_lookup import FREQUENCIES, RATES, VALID_AMORTIZATION
+from mortgage.synthetic import generate_chunks
+
+#payments are reported to the cent, so paths must agree to within half a cent
+CENT_TOLERANCE = 0.005
+
+DEFAULT_BATCH_SIZE = 256
+
+#amounts that sit on the edges of what the inputs can hold
+_EDGE_AMOUNTS = (0.01, 0.5, 1.0, 999_999.99, 1_000_000.0, 123_456_789.01, 1e9)
+
+#amounts that parse as floats but are not loan amounts
+_NON_FINITE_AMOUNTS = (float("nan"), float("inf"), float("-inf"))
+
+#rate values that are not names, which every path must reject as Mortgage does
+_NON_STRING_RATES = (None, 5, 0.0519, b"FIXED_5", ("FIXED_5",), ["FIXED_5"])
+
+def random_terms(generator: np.random.Generator, size: int) -> tuple:
+
+    """
+    Draws the terms of random mortgages, a few of them invalid
+
+    Amounts are drawn over every order of magnitude from a cent to a billion, mostly
+    with two decimal places, along with whole numbers and the edge amounts, and every
+    rate, frequency and amortization period is equally likely. Some amortization periods
+    are whole floats such as 25.0, which Mortgage accepts, while some amounts are NaN or
+    infinite and some rates are not strings, which Mortgage rejects. No row has more than one fault.
+
+    Returns a tuple of lists (amounts, rate names, frequency names, amortizations).
+    """
+
+    amounts = np.round(10 ** generator.uniform(-2, 9, size), 2)
+    whole = generator.random(size) < 0.1
+    amounts[whole] = np.ceil(amounts[whole])
+    edge = generator.random(size) < 0.05
+    amounts[edge] = generator.choice(_EDGE_AMOUNTS, int(edge.sum()))
+    #rounding can leave amounts below a cent at zero
+    amounts = np.maximum(amounts, 0.01)
+    non_finite = generator.random(size) < 0.02
+    amounts[non_finite] = generator.choice(_NON_FINITE_AMOUNTS, int(non_finite.sum()))
+
+    rates = [RATES[code].name for code in generator.integers(0, len(RATES), size).tolist()]
+    #only rows with a valid amount get a bad rate, as paths validating a column at a time can not
+    #report the first fault of each row
+    for index in np.flatnonzero((generator.random(size) < 0.02) & ~non_finite).tolist():
+        rates[index] = _NON_STRING_RATES[generator.integers(len(_NON_STRING_RATES))]
+    frequencies = [FREQUENCIES[code].name for code in generator.integers(0, len(FREQUENCIES), size).tolist()]
+    amortizations = generator.choice(sorted(VALID_AMORTIZATION), size).tolist()
+    for index in np.flatnonzero(generator.random(size) < 0.05).tolist():
+        amortizations[index] = float(amortizations[index])
+
+    return amounts.tolist(), rates, frequencies, amortizations
+
+def baseline_payment(mortgage: Mortgage) -> float:
+
+    """Returns the payment of a validated Mortgage worked out from its terms with the annuity
+    formula the Mortgage class used before the factor tables, P * i(1 + i)^n / ((1 + i)^n - 1),
+    so no path is checked against the tables it reads itself"""
+
+    #the rate the enum was defined with, not the rate table every fast path shares
+    interest_rate = mortgage.rate.value / mortgage.frequency.value
+    number_of_payments = mortgage.amortization * mortgage.frequency.value
+    growth = (1 + interest_rate) ** number_of_payments
+    return mortgage.loan_amount * (interest_rate * growth) / (growth - 1)
+
+def reference_payments(amounts, rates, frequencies, amortizations) -> list:
+
+    """Returns the baseline payments of columns of terms, validated with one Mortgage per row"""
+
+    return [baseline_payment(Mortgage(*terms)) for terms in zip(amounts, rates, frequencies, amortizations)]
+
+def _reference_result(terms) -> tuple:
+
+    """Returns a tuple of (baseline payment, None) for terms Mortgage accepts, or (None, message)
+    for terms it rejects"""
+
+    try:
+        return baseline_payment(Mortgage(*terms)), None
+    except ValueError as e:
+        return None, str(e)
+
+def reference_lines(lines) -> tuple:
+
+    """Reads portfolio lines with one Mortgage per line as main.py always has, pricing them with
+    baseline_payment, returns a tuple of (payments of the valid rows, (row, message) pairs of the
+    rejected rows)"""
+
+    payments, rejects = [], []
+
+    for data in lines:
+        items = data.split(",")
+        try:
+            mortgage = Mortgage(float(items[0]), items[1], items[3], int(items[2]))
+        except Exception as e:
+            rejects.append((data.strip(), str(e)))
+            continue
+        payments.append(baseline_payment(mortgage))
+
+    return payments, rejects
+
+def _first_difference(payments, expected, tolerance: float):
+
+    """Returns the index of the first payment further than the tolerance from the expected one, or None"""
+
+    differences = np.abs(np.asarray(payments, dtype=np.float64) - np.asarray(expected, dtype=np.float64))
+    #NaN payments count as differences
+    failures = np.flatnonzero(~(differences <= tolerance))
+    return int(failures[0]) if len(failures) else None
+
+def check_payments(candidate, examples: int = 1000, seed: int = 0, tolerance: float = CENT_TOLERANCE,
+                   batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+
+    """
+    Checks that a payment calculation agrees with the Mortgage class on random terms,
+    pricing the valid terms together and passing each invalid row on its own
+
+    Arguments:
+    candidate: a function of (amounts, rate names, frequency names, amortizations) lists
+    returning one payment per row
+    examples(int): the number of random mortgages to check
+    seed(int): the seed the random terms are drawn from
+    tolerance(float): the largest difference allowed from a Mortgage payment
+
+    Raises:
+        AssertionError: a payment differs by more than the tolerance, the candidate
+        returns the wrong number of payments, or it does not raise the ValueError
+        Mortgage raises for an invalid row
+
+    Returns the number of mortgages checked.
+    """
+
+    generator = np.random.default_rng(seed)
+
+    for start in range(0, examples, batch_size):
+        terms = random_terms(generator, min(batch_size, examples - start))
+        results = [_reference_result(row) for row in zip(*terms)]
+
+        #terms Mortgage rejects must be rejected with its message, one row at a time
+        for index, (_, message) in enumerate(results):
+            if message is not None:
+                _check_rejected(candidate, tuple(column[index] for column in terms), message, seed, start + index)
+
+        valid = [index for index, (_, message) in enumerate(results) if message is None]
+        valid_terms = tuple([column[index] for index in valid] for column in terms)
+        payments = list(candidate(*valid_terms))
+        expected = [results[index][0] for index in valid]
+
+        if len(payments) != len(expected):
+            raise AssertionError(f"Candidate returned {len(payments)} payments for {len(expected)} mortgages "
+                                 f"(seed {seed})")
+
+        index = _first_difference(payments, expected, tolerance)
+        if index is not None:
+            row = tuple(column[index] for column in valid_terms)
+            raise AssertionError(f"Payment for {row} is {float(payments[index])!r}, Mortgage gives "
+                                 f"{expected[index]!r} (seed {seed}, example {start + valid[index]})")
+
+    return examples
+
+def _check_rejected(candidate, row: tuple, message: str, seed: int, example: int):
+
+    """Raises an AssertionError unless the candidate rejects the row with the message Mortgage raises"""
+
+    try:
+        payments = list(candidate(*([value] for value in row)))
+    except ValueError as e:
+        if str(e) == message:
+            return
+        outcome = f"raises {e!r}"
+    except Exception as e:
+        outcome = f"raises {e!r}"
+    else:
+        outcome = f"gives {payments!r}"
+    raise AssertionError(f"Candidate {outcome} for {row!r}, Mortgage raises {message!r} "
+                         f"(seed {seed}, example {example})")
+
+def check_lines(candidate, rows: int = 10_000, seed: int = 0, invalid_ratio: float = 0.1,
+                tolerance: float = CENT_TOLERANCE) -> int:
+
+    """
+    Checks that a way of reading portfolio lines agrees with one Mortgage per line
+    on a synthetic portfolio
+
+    Arguments:
+    candidate: a function of a list of lines returning a tuple of (payments of the valid
+    rows in order, (row, message) pairs of the rejected rows in order)
+    rows(int): the number of synthetic rows to check
+    seed(int): the seed of the synthetic portfolio
+    invalid_ratio(float): the fraction of rows with a fault, of every kind in INVALID_KINDS
+    tolerance(float): the largest difference allowed from a Mortgage payment
+
+    Raises:
+        AssertionError: the rejected rows, their messages or the payments differ
+
+    Returns the number of lines checked.
+    """
+
+    for chunk, lines in enumerate(generate_chunks(rows, seed, invalid_ratio)):
+        payments, rejects = candidate(lines)
+        expected_payments, expected_rejects = reference_lines(lines)
+
+        rejects = [tuple(reject) for reject in rejects]
+        if rejects != expected_rejects:
+            #the first reject that differs, or the first one only one side has
+            index = next((index for index, (reject, expected) in enumerate(zip(rejects, expected_rejects))
+                          if reject != expected), min(len(rejects), len(expected_rejects)))
+            raise AssertionError(f"Rejected {rejects[index:index + 1]!r}, Mortgage rejects "
+                                 f"{expected_rejects[index:index + 1]!r} (seed {seed}, chunk {chunk})")
+
+        if len(payments) != len(expected_payments):
+            raise AssertionError(f"Candidate priced {len(payments)} rows, Mortgage prices {len(expected_payments)} "
+                                 f"(seed {seed}, chunk {chunk})")
+
+        index = _first_difference(payments, expected_payments, tolerance)
+        if index is not None:
+            raise AssertionError(f"Payment {index} of the valid rows is {float(payments[index])!r}, Mortgage gives "
+                                 f"{expected_payments[index]!r} (seed {seed}, chunk {chunk})")
+
+    return rows
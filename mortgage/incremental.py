@@ -0,0 +1,241 @@
+"""
+Description: Re-prices only the rows of a portfolio file that changed since the last run.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Run python -m mortgage.incremental INPUT -o OUTPUT --rejects REJECTS to
+price a portfolio file using an index saved next to it (INPUT.index unless
+--index is given). The index maps a 64-bit hash of each priced row to its
+payment, sorted by hash, so a whole chunk is looked up in one vectorized
+search. Rows found in the index are written from it and only new or changed
+rows, and rejected rows, are priced, so a run costs hashing the file plus
+pricing what changed. The output is the same as the pipeline's. Each run
+saves a new index of the rows in the file, and an index built with other
+rates than the ones in effect is ignored.
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+
+import numpy as np
+
+from mortgage.pipeline import DEFAULT_CHUNK_SIZE, PipelineSummary, open_output, price_chunk, read_chunks
+from mortgage.pixell_lookup import current_rate_table
+
+#the header identifies the format and its version, the length of the rates text and the rates follow it
+MAGIC = b"PXRIDX\x00\x01"
+
+INDEX_DTYPE = np.dtype([("key", "<i8"), ("payment", "<f8")])
+
+def row_keys(rows) -> np.ndarray:
+
+    """Returns the 64-bit index key of each stripped portfolio row"""
+
+    digests = b"".join([hashlib.blake2b(row.encode(), digest_size=8).digest() for row in rows])
+    return np.frombuffer(digests, dtype="<i8")
+
+def rates_fingerprint() -> bytes:
+
+    """Returns a text form of the rates in effect, which every indexed payment depends on"""
+
+    return json.dumps({rate.name: annual_rate for rate, annual_rate in current_rate_table().rates.items()},
+                      sort_keys=True).encode()
+
+class PaymentIndex:
+
+    """A map from row keys to payments held as sorted arrays"""
+
+    def __init__(self, keys=(), payments=()):
+
+        """Initializing a PaymentIndex object over keys sorted in ascending order and their payments"""
+
+        self.keys = np.asarray(keys, dtype=np.int64)
+        self.payments = np.asarray(payments, dtype=np.float64)
+
+    def __len__(self):
+
+        """Returns the number of rows in the index"""
+
+        return len(self.keys)
+
+    def lookup(self, keys: np.ndarray) -> tuple:
+
+        """Returns a tuple of (found, payments) for an array of keys, where found marks the keys
+        in the index and payments holds their payments, NaN for the others"""
+
+        if not len(self.keys):
+            return np.zeros(len(keys), dtype=bool), np.full(len(keys), np.nan)
+
+        positions = np.minimum(np.searchsorted(self.keys, keys), len(self.keys) - 1)
+        found = self.keys[positions] == keys
+        return found, np.where(found, self.payments[positions], np.nan)
+
+def load_index(path: str) -> PaymentIndex:
+
+    """Returns the index saved at path, or an empty index when there is none or it
+    was built with other rates than the ones in effect"""
+
+    try:
+        with open(path, "rb") as index_file:
+            header = index_file.read(len(MAGIC) + 8)
+            if header[:len(MAGIC)] != MAGIC:
+                return PaymentIndex()
+            fingerprint = index_file.read(int.from_bytes(header[len(MAGIC):], "little"))
+            if fingerprint != rates_fingerprint():
+                return PaymentIndex()
+            records = np.fromfile(index_file, dtype=INDEX_DTYPE)
+    except FileNotFoundError:
+        return PaymentIndex()
+
+    return PaymentIndex(records["key"], records["payment"])
+
+def save_index(path: str, keys: np.ndarray, payments: np.ndarray):
+
+    """Saves the payments of a set of keys as an index, replacing the file at path in one step"""
+
+    keys, first = np.unique(keys, return_index=True)
+    records = np.empty(len(keys), dtype=INDEX_DTYPE)
+    records["key"] = keys
+    records["payment"] = payments[first]
+    fingerprint = rates_fingerprint()
+
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "wb") as index_file:
+        index_file.write(MAGIC + len(fingerprint).to_bytes(8, "little") + fingerprint)
+        records.tofile(index_file)
+    os.replace(temporary_path, path)
+
+class IncrementalSummary(PipelineSummary):
+
+    """Keeps count of the rows of an incremental run and how many were priced again"""
+
+    def __init__(self):
+
+        """Initializing an empty IncrementalSummary object"""
+
+        super().__init__()
+        self.reused = 0
+        self.computed = 0
+
+    def __repr__(self):
+
+        """Returns a string representation of an IncrementalSummary object without formatting"""
+
+        return (f"IncrementalSummary(rows={self.rows}, priced={self.priced}, rejected={self.rejected}, "
+                f"reused={self.reused}, computed={self.computed})")
+
+def process_chunk(lines, index: PaymentIndex):
+
+    """
+    Prices the rows of a chunk that are not in the index
+
+    Returns a tuple of (priced_text, reject_text, keys, payments, rejected_count, computed_count),
+    where keys and payments hold the index entries of the priced rows of the chunk.
+    """
+
+    rows = [row for row in (line.strip() for line in lines) if row]
+    keys = row_keys(rows)
+    found, payments = index.lookup(keys)
+    errors = {}
+
+    missing = np.flatnonzero(~found)
+    if len(missing):
+        priced_rows, new_payments, rejects = price_chunk([rows[position] for position in missing])
+        priced = dict(zip((",".join(items) for items in priced_rows), np.asarray(new_payments).tolist()))
+        errors = dict(rejects)
+        payments[missing] = [priced.get(rows[position], np.nan) for position in missing]
+
+    priced_lines = []
+    reject_lines = []
+    for row, payment in zip(rows, payments.tolist()):
+        if payment == payment:
+            priced_lines.append(f"{','.join(row.split(',', 4)[:4])},{payment:.2f}\n")
+        else:
+            reject_lines.append(f"Data: {row} caused Exception: {errors[row]}\n")
+
+    is_priced = ~np.isnan(payments)
+    return ("".join(priced_lines), "".join(reject_lines), keys[is_priced], payments[is_priced],
+            len(reject_lines), len(missing))
+
+def process_stream_incremental(input_file, output_file, reject_file, index: PaymentIndex,
+                               chunk_size: int = DEFAULT_CHUNK_SIZE) -> tuple:
+
+    """Prices every line of an open input file chunk by chunk, reusing the payments in the index,
+    writing the results and rejects as each chunk completes, returns a tuple of
+    (summary, keys, payments) where keys and payments make up the index of this input"""
+
+    summary = IncrementalSummary()
+    keys, payments = [], []
+
+    for lines in read_chunks(input_file, chunk_size):
+        priced_text, reject_text, chunk_keys, chunk_payments, rejected, computed = process_chunk(lines, index)
+        output_file.write(priced_text)
+        reject_file.write(reject_text)
+        summary.add(len(chunk_keys), rejected)
+        summary.computed += computed
+        summary.reused += len(chunk_keys) + rejected - computed
+        keys.append(chunk_keys)
+        payments.append(chunk_payments)
+
+    return (summary, np.concatenate(keys) if keys else np.empty(0, dtype=np.int64),
+            np.concatenate(payments) if payments else np.empty(0))
+
+def process_file_incremental(input_path: str, output_path: str = "-", reject_path: str = "-",
+                             index_path: str = None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> IncrementalSummary:
+
+    """Prices a portfolio file with the index at index_path (INPUT.index by default), writing the
+    results to output_path and the rejects to reject_path (stdout and stderr when -), then saves
+    the index of this file, returns a summary of the run"""
+
+    index_path = index_path or f"{input_path}.index"
+
+    with open(input_path, "r") as input_file:
+        index = load_index(index_path)
+        output_file = open_output(output_path, sys.stdout)
+        reject_file = open_output(reject_path, sys.stderr)
+
+        try:
+            summary, keys, payments = process_stream_incremental(input_file, output_file, reject_file,
+                                                                 index, chunk_size)
+        finally:
+            for stream in (output_file, reject_file):
+                if stream is not sys.stdout and stream is not sys.stderr:
+                    stream.close()
+
+    save_index(index_path, keys, payments)
+    return summary
+
+def build_parser() -> argparse.ArgumentParser:
+
+    """Returns the command line parser for the incremental pricing command"""
+
+    parser = argparse.ArgumentParser(description="Price a portfolio file, re-pricing only rows that changed.")
+    parser.add_argument("input", help="portfolio file with one amount,rate,amortization,frequency per line")
+    parser.add_argument("-o", "--output", default="-", help="file for priced rows (default: stdout)")
+    parser.add_argument("--rejects", default="-", help="file for rejected rows (default: stderr)")
+    parser.add_argument("--index", help="index file (default: INPUT.index)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="lines per chunk")
+    return parser
+
+def main(argv=None) -> int:
+
+    """Runs incremental pricing from the command line, returns the exit code"""
+
+    args = build_parser().parse_args(argv)
+
+    try:
+        summary = process_file_incremental(args.input, args.output, args.rejects, args.index, args.chunk_size)
+    except FileNotFoundError:
+        print("File was not found", file=sys.stderr)
+        return 1
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    print(f"Priced {summary.priced} of {summary.rows} rows, rejected {summary.rejected}, "
+          f"re-priced {summary.computed}.", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
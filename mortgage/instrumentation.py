@@ -0,0 +1,180 @@
+"""
+Description: Opt-in timing of the Mortgage methods and the pipeline stages.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Call enable() to start recording a call counter, an error counter and
+a latency histogram for Mortgage.__init__, calculate_payment and __str__ and
+for the parse, price and render stages of the pipeline. Call snapshot() or
+write_prometheus(path) to export them and disable() to stop. Nothing is
+wrapped until enable() is called, so there is no overhead when it is off.
+profile_call runs a function under cProfile and saves the stats to a file.
+"""
+import cProfile
+import functools
+import os
+import threading
+import time
+from bisect import bisect_left
+
+from mortgage import pipeline
+from mortgage.mortgage import Mortgage
+
+#upper bounds of the latency buckets in seconds, from 1 microsecond to 10 seconds
+BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3,
+           2.5e-3, 5e-3, 1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+#(owner, attribute, metric name) of everything timed while instrumentation is enabled,
+#the names are exported as they are so they all carry the mortgage_ namespace
+TARGETS = (
+    (Mortgage, "__init__", "mortgage_init"),
+    (Mortgage, "calculate_payment", "mortgage_calculate_payment"),
+    (Mortgage, "__str__", "mortgage_str"),
+    (pipeline, "parse_chunk", "mortgage_pipeline_parse"),
+    (pipeline, "calculate_payments_from_codes", "mortgage_pipeline_price"),
+    (pipeline, "render_results", "mortgage_pipeline_render"),
+)
+
+class LatencyHistogram:
+
+    """Counts calls, errors and the time they took in fixed latency buckets"""
+
+    def __init__(self, name: str):
+
+        """Initializing an empty LatencyHistogram object"""
+
+        self.name = name
+        self.__lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+
+        """Discards every recorded call"""
+
+        with self.__lock:
+            self.count = 0
+            self.errors = 0
+            self.total = 0.0
+            self.bucket_counts = [0] * (len(BUCKETS) + 1)
+
+    def observe(self, seconds: float, failed: bool = False):
+
+        """Records one call that took the given number of seconds"""
+
+        with self.__lock:
+            self.count += 1
+            self.total += seconds
+            self.bucket_counts[bisect_left(BUCKETS, seconds)] += 1
+            if failed:
+                self.errors += 1
+
+    def snapshot(self) -> dict:
+
+        """Returns the counters and bucket counts of the histogram"""
+
+        with self.__lock:
+            return {"count": self.count, "errors": self.errors, "sum": self.total,
+                    "buckets": dict(zip(BUCKETS + (float("inf"),), self.bucket_counts))}
+
+_histograms = {}
+_originals = {}
+
+def _timed(function, histogram: LatencyHistogram):
+
+    """Returns a wrapper around function that records each call in the histogram"""
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        failed = True
+        try:
+            result = function(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            histogram.observe(time.perf_counter() - start, failed)
+
+    return wrapper
+
+def enabled() -> bool:
+
+    """Returns True while instrumentation is enabled"""
+
+    return bool(_originals)
+
+def enable():
+
+    """Starts timing every target, keeping any measurements already recorded"""
+
+    if enabled():
+        return
+
+    for owner, attribute, name in TARGETS:
+        if name not in _histograms:
+            _histograms[name] = LatencyHistogram(name)
+        histogram = _histograms[name]
+        original = getattr(owner, attribute)
+        _originals[(owner, attribute)] = original
+        setattr(owner, attribute, _timed(original, histogram))
+
+def disable():
+
+    """Stops timing, putting every target back exactly as it was"""
+
+    for (owner, attribute), original in _originals.items():
+        setattr(owner, attribute, original)
+    _originals.clear()
+
+def reset():
+
+    """Discards every measurement recorded so far"""
+
+    for histogram in _histograms.values():
+        histogram.clear()
+
+def snapshot() -> dict:
+
+    """Returns the measurements of every target by metric name"""
+
+    return {name: histogram.snapshot() for name, histogram in _histograms.items()}
+
+def prometheus_text() -> str:
+
+    """Returns the measurements in the Prometheus text exposition format"""
+
+    lines = []
+
+    for name, values in snapshot().items():
+        lines.append(f"# HELP {name}_seconds Latency of {name.replace('_', ' ')} calls.")
+        lines.append(f"# TYPE {name}_seconds histogram")
+        cumulative = 0
+        for bound, count in values["buckets"].items():
+            cumulative += count
+            label = "+Inf" if bound == float("inf") else repr(bound)
+            lines.append(f'{name}_seconds_bucket{{le="{label}"}} {cumulative}')
+        lines.append(f"{name}_seconds_sum {values['sum']!r}")
+        lines.append(f"{name}_seconds_count {values['count']}")
+        lines.append(f"# TYPE {name}_errors_total counter")
+        lines.append(f"{name}_errors_total {values['errors']}")
+
+    return "\n".join(lines) + "\n"
+
+def write_prometheus(path: str):
+
+    """Writes the measurements in the Prometheus text format, replacing the file in one step
+    so a collector never reads a partly written file"""
+
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "w") as metrics_file:
+        metrics_file.write(prometheus_text())
+    os.replace(temporary_path, path)
+
+def profile_call(path: str, function, *args, **kwargs):
+
+    """Runs a function under cProfile, saves the stats to path for pstats or snakeviz,
+    returns the function's result"""
+
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(function, *args, **kwargs)
+    finally:
+        profiler.dump_stats(path)
@@ -3,9 +3,136 @@ Description: A class meant to manage Mortgage options.
 Author: Pablito Salazar
 Date: November 16, 2024
 Usage: Create an instance of the Mortgage class to manage mortgage records and 
-calculate payments.
+calculate payments. Call snapshot() for an immutable MortgageTerms copy that
+threads can share without locks, and Mortgage.from_terms() to edit one again.
 """
-from mortgage.pixell_lookup import MortgageRate, PaymentFrequency, VALID_AMORTIZATION
+import threading
+import weakref
+from collections import namedtuple
+
+from mortgage.pixell_lookup import (MortgageRate, PaymentFrequency, VALID_AMORTIZATION, annuity_factor, 
+                                    lookup_frequency, lookup_rate)
+
+#NaN and infinite amounts fail 0 < amount < _INFINITY, as amounts that are not positive do
+_INFINITY = float("inf")
+
+#collections is already loaded by enum, while typing.NamedTuple would add typing to every import of Mortgage
+SchedulePeriod = namedtuple("SchedulePeriod", ["period", "payment", "interest", "principal", "balance"])
+SchedulePeriod.__doc__ = "One period of an amortization schedule"
+
+class MortgageTerms:
+
+    """The validated terms of a mortgage as an immutable, hashable value. Equal terms
+    share one instance while it is in use, so they are cheap to compare and to use as keys."""
+
+    __slots__ = ("loan_amount", "rate", "frequency", "amortization", "_MortgageTerms__key", "__weakref__")
+
+    #(loan amount, rate name, frequency name, amortization): the instance holding them, while it is in use
+    __interned = weakref.WeakValueDictionary()
+    __intern_lock = threading.Lock()
+
+    def __new__(cls, loan_amount, rate, frequency, amortization):
+
+        """
+        Returns the MortgageTerms instance for the given terms, validated like Mortgage.__init__
+
+        Arguments:
+        loan_amount(float): the loan amount
+        rate(str or MortgageRate), frequency(str or PaymentFrequency): names or members
+        amortization(int): the amortization period
+
+        Raises:
+            ValueError: any of the validation errors raised by the Mortgage class
+        """
+
+        if not 0 < loan_amount < _INFINITY:
+            raise ValueError("Loan Amount must be positive.")
+
+        mortgage_rate = lookup_rate(getattr(rate, "name", rate))
+        if mortgage_rate is None:
+            raise ValueError("Rate provided is invalid.")
+
+        payment_frequency = lookup_frequency(getattr(frequency, "name", frequency))
+        if payment_frequency is None:
+            raise ValueError("Frequency provided is invalid.")
+
+        if amortization not in VALID_AMORTIZATION:
+            raise ValueError("Amortization provided is invalid.")
+
+        return cls._intern(loan_amount, mortgage_rate, payment_frequency, amortization)
+
+    @classmethod
+    def _intern(cls, loan_amount, rate: MortgageRate, frequency: PaymentFrequency, amortization: int):
+
+        """Returns the shared instance for already validated terms, creating it when there is none"""
+
+        #enum members hash in Python, their names hash once and are cached by str
+        key = (loan_amount, rate._name_, frequency._name_, amortization)
+        interned = cls.__interned
+
+        #terms in use are found without the lock, which is only taken to create them
+        terms = interned.get(key)
+        if terms is not None:
+            return terms
+
+        with cls.__intern_lock:
+            terms = interned.get(key)
+            if terms is None:
+                terms = object.__new__(cls)
+                #object.__setattr__ stores the fields past the __setattr__ that makes them read-only
+                object.__setattr__(terms, "loan_amount", loan_amount)
+                object.__setattr__(terms, "rate", rate)
+                object.__setattr__(terms, "frequency", frequency)
+                object.__setattr__(terms, "amortization", amortization)
+                object.__setattr__(terms, "_MortgageTerms__key", key)
+                interned[key] = terms
+
+        return terms
+
+    def __setattr__(self, name, value):
+
+        """Prevents changing the terms"""
+
+        raise AttributeError("MortgageTerms can not be changed.")
+
+    def __delattr__(self, name):
+
+        """Prevents removing the terms"""
+
+        raise AttributeError("MortgageTerms can not be changed.")
+
+    def __eq__(self, other):
+
+        """Returns True when the other object holds the same terms"""
+
+        if not isinstance(other, MortgageTerms):
+            return NotImplemented
+        return self is other or self.__key == other.__key
+
+    def __hash__(self):
+
+        """Returns the hash of the terms"""
+
+        return hash(self.__key)
+
+    def __reduce__(self):
+
+        """Pickles the terms by their fields, so they are validated and interned again when unpickled"""
+
+        return (MortgageTerms, (self.loan_amount, self.rate.name, self.frequency.name, self.amortization))
+
+    def calculate_payment(self) -> float:
+
+        """Calculates the payment for the terms with the same annuity factors as Mortgage"""
+
+        return self.loan_amount * annuity_factor(self.rate, self.frequency, self.amortization)
+
+    def __repr__(self):
+
+        """Returns a string representation of a MortgageTerms object without formatting"""
+
+        return (f"MortgageTerms({self.loan_amount}, {self.rate.name}, {self.frequency.name}, "
+                f"{self.amortization})")
 
 class Mortgage:
     """Represents a mortgage with mortgage rates and payment frequencies"""
@@ -29,18 +156,18 @@ class Mortgage:
 
 
         """
-        if loan_amount_float <= 0: #validates that the loan amount is not less that or equal to zero
+        if not 0 < loan_amount_float < _INFINITY: #validates that the loan amount is a positive, finite number
             raise ValueError("Loan Amount must be positive.")
         self.__loan_amount_float = loan_amount_float
 
-        try: #assigns the rate, raising a value error if it is invalid
-            self.__rate = MortgageRate[string_rate_value]
-        except Exception as e:
+        #assigns the rate, raising a value error if it is invalid
+        self.__rate = lookup_rate(string_rate_value)
+        if self.__rate is None:
             raise ValueError("Rate provided is invalid.")
         
-        try: #assigns the frequency, raising a value error if it is invalid
-            self.__frequency = PaymentFrequency[string_frequency_value]
-        except Exception as e:
+        #assigns the frequency, raising a value error if it is invalid
+        self.__frequency = lookup_frequency(string_frequency_value)
+        if self.__frequency is None:
             raise ValueError("Frequency provided is invalid.")
         
 
@@ -62,7 +189,7 @@ class Mortgage:
 
         """Sets the loan amount and checks for validation"""
 
-        if value <= 0:
+        if not 0 < value < _INFINITY:
             raise ValueError("Loan Amount must be positive.")
         self.__loan_amount_float = value
 
@@ -79,10 +206,10 @@ class Mortgage:
 
         """Sets the rate and check for validation"""
 
-        try: #assigns the rate, raising a value error if it is invalid
-            self.__rate = MortgageRate[rate_value]
-        except Exception as e:
+        rate = lookup_rate(rate_value)
+        if rate is None: #the rate is only assigned if it is valid
             raise ValueError("Rate provided is invalid.")
+        self.__rate = rate
         
     #FREQUENCY
 
@@ -98,10 +225,10 @@ class Mortgage:
         
         """Sets the frequency and checks for validation"""
 
-        try: #assigns the frequency, raising a value error if it is invalid
-            self.__frequency = PaymentFrequency[frequency_value]
-        except Exception as e:
+        frequency = lookup_frequency(frequency_value)
+        if frequency is None: #the frequency is only assigned if it is valid
             raise ValueError("Frequency provided is invalid.")
+        self.__frequency = frequency
         
 
     #AMORTIZATION
@@ -122,42 +249,84 @@ class Mortgage:
             raise ValueError("Amortization provided is invalid.")
         self.__amortization_value_int = amortization_value_int
 
+    @classmethod
+    def from_terms(cls, terms: MortgageTerms) -> "Mortgage":
+
+        """Creates a Mortgage with the given terms, which are already validated"""
+
+        mortgage = cls.__new__(cls)
+        mortgage.__loan_amount_float = terms.loan_amount
+        mortgage.__rate = terms.rate
+        mortgage.__frequency = terms.frequency
+        mortgage.__amortization_value_int = terms.amortization
+        return mortgage
+
+    def snapshot(self) -> MortgageTerms:
+
+        """Returns the current terms as an immutable MortgageTerms that threads can share"""
+
+        return MortgageTerms._intern(self.__loan_amount_float, self.__rate, self.__frequency,
+                                     self.__amortization_value_int)
+
     def calculate_payment(self) -> float:
 
         """Calculates the payment of a mortgage including the details of the amount rate frequency and amortization,
         returns the mortgage payment amount""" 
 
-        #loan amount
-        principal_loan_amount = self.__loan_amount_float
+        #the annuity factor for these terms is precomputed in the lookup table,
+        #so the payment is the loan amount multiplied by that factor
+        return self.__loan_amount_float * annuity_factor(
+            self.__rate, self.__frequency, self.__amortization_value_int)
+
+    def calculate_payment_exact(self):
+
+        """Calculates the payment as a Decimal rounded to the cent, halves to the even cent"""
 
-        #annual rate
-        annual_rate = self.__rate.value
+        #imported here so Mortgage does not load numpy and decimal unless exact payments are used
+        from mortgage.precision import exact_payment
+        return exact_payment(self.__loan_amount_float, self.__rate, self.__frequency, self.__amortization_value_int)
 
-        #frequency
-        frequency = self.__frequency.value
+    def amortization_schedule(self):
 
-        #amortization (years)
-        amortization_period = self.__amortization_value_int
+        """Yields a SchedulePeriod for each payment of the mortgage, one at a time,
+        using the loan details as they were when iteration started"""
+
+        principal_loan_amount = self.__loan_amount_float
+        payment = self.calculate_payment()
 
         #interest rate (annual rate / frequency)
-        interest_rate = annual_rate / frequency
+        interest_rate = self.__rate.annual_rate / self.__frequency.value
 
         #number of payments (amortization * frequency)
-        number_of_payments = amortization_period * frequency
+        number_of_payments = self.__amortization_value_int * self.__frequency.value
 
-        #using the formula provided in the assignment instructions
-        payment = principal_loan_amount *( 
-            (interest_rate * (1 + interest_rate) ** number_of_payments ) 
-            / ((1 + interest_rate) ** number_of_payments - 1 ) )
-        
-        return payment 
+        total_growth = (1 + interest_rate) ** number_of_payments
+        opening_balance = principal_loan_amount
+
+        for period in range(1, number_of_payments + 1):
+            #the remaining balance is worked out in closed form so no rounding error builds up
+            balance = (principal_loan_amount * (total_growth - (1 + interest_rate) ** period) 
+                       / (total_growth - 1))
+            interest = opening_balance * interest_rate
+            yield SchedulePeriod(period, payment, interest, payment - interest, balance)
+            opening_balance = balance
+
+    def amortization_schedule_arrays(self):
+
+        """Returns the full amortization schedule as numpy arrays in a ScheduleArrays"""
+
+        #imported here so creating a Mortgage does not require numpy
+        from mortgage.schedule import schedule_arrays
+
+        return schedule_arrays(self.__loan_amount_float, self.__rate, 
+                               self.__frequency, self.__amortization_value_int)
 
     def __str__(self):
 
         """Returns the string representation of the Mortgage object"""
 
         return(f"Mortgage Amount: ${self.loan_amount:,.2f}\n"
-               f"Rate: {self.rate.value * 100 :.2f}%\n"
+               f"Rate: {self.rate.annual_rate * 100 :.2f}%\n"
                f"Amortization: {self.amortization}\n"
                f"Frequency: {self.frequency.name.capitalize()} -- "
                f"Calculated Payment: ${self.calculate_payment():,.2f}")
@@ -166,5 +335,5 @@ class Mortgage:
 
         """Returns a string representation of a Mortgage object without formatting"""
 
-        return(f"Mortgage({self.loan_amount}, {self.rate.value}, {self.frequency.value}, {self.amortization})")
+        return(f"Mortgage({self.loan_amount}, {self.rate.annual_rate}, {self.frequency.value}, {self.amortization})")
 
@@ -0,0 +1,97 @@
+"""
+Description: Prices portfolio files across several processes.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Call process_file_parallel, or run python -m mortgage.pipeline with
+--workers, to split a portfolio file into byte-range shards that are
+validated and priced by a pool of worker processes. Results and rejects
+are written back in input order.
+"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from mortgage.pipeline import PipelineSummary, render_chunk
+
+DEFAULT_SHARD_BYTES = 16 * 1024 * 1024
+
+def shard_ranges(input_path: str, shard_bytes: int = DEFAULT_SHARD_BYTES):
+
+    """Returns a list of (start, end) byte ranges of roughly shard_bytes each,
+    every range starting at the beginning of a line"""
+
+    if shard_bytes <= 0:
+        raise ValueError("Shard size must be positive.")
+
+    size = os.path.getsize(input_path)
+    boundaries = [0]
+
+    with open(input_path, "rb") as input_file:
+        while boundaries[-1] + shard_bytes < size:
+            #move to the end of the line the shard would otherwise split
+            input_file.seek(boundaries[-1] + shard_bytes)
+            input_file.readline()
+            boundaries.append(input_file.tell())
+
+    if boundaries[-1] < size:
+        boundaries.append(size)
+
+    return list(zip(boundaries, boundaries[1:]))
+
+def price_shard(input_path: str, start: int, end: int):
+
+    """Prices the lines between two byte offsets of a portfolio file, returns a tuple of
+    (priced_text, reject_text, priced_count, rejected_count) for that shard"""
+
+    with open(input_path, "rb") as input_file:
+        input_file.seek(start)
+        lines = input_file.read(end - start).decode().splitlines()
+
+    return render_chunk(lines)
+
+def process_file_parallel(input_path: str, output_file, reject_file, workers: int = None,
+                          shard_bytes: int = DEFAULT_SHARD_BYTES) -> PipelineSummary:
+
+    """
+    Prices a portfolio file with a pool of worker processes
+
+    Arguments:
+    input_path(str): the portfolio file to price
+    output_file: open stream the priced rows are written to, in input order
+    reject_file: open stream the rejected rows are written to, in input order
+    workers(int): number of worker processes, defaults to the number of CPUs
+    shard_bytes(int): approximate size of the piece of the file each task prices
+
+    Raises:
+        ValueError: the number of workers or the shard size is not positive
+        FileNotFoundError: the input file does not exist
+
+    Returns a summary of the run.
+    """
+
+    workers = workers or os.cpu_count() or 1
+    if workers <= 0:
+        raise ValueError("Number of workers must be positive.")
+
+    summary = PipelineSummary()
+    ranges = iter(shard_ranges(input_path, shard_bytes))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        #keep a bounded number of shards in flight so memory does not grow with the file
+        pending = deque()
+        for start, end in ranges:
+            pending.append(executor.submit(price_shard, input_path, start, end))
+            if len(pending) >= workers * 2:
+                break
+
+        while pending:
+            priced_text, reject_text, priced, rejected = pending.popleft().result()
+            output_file.write(priced_text)
+            reject_file.write(reject_text)
+            summary.add(priced, rejected)
+
+            next_range = next(ranges, None)
+            if next_range is not None:
+                pending.append(executor.submit(price_shard, input_path, *next_range))
+
+    return summary
@@ -0,0 +1,266 @@
+"""
+Description: A streaming pipeline that prices portfolio files in bounded-size chunks.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Run python -m mortgage.pipeline INPUT -o OUTPUT --rejects REJECTS to
+price a portfolio file. Each line holds an amount, rate, amortization and
+frequency separated by commas. Priced rows are written to the output and
+malformed rows are written to the reject stream, one chunk at a time, so
+memory use does not grow with the size of the input.
+"""
+import argparse
+import sys
+from itertools import islice
+
+from mortgage.batch import calculate_payments_from_codes
+from mortgage.pixell_lookup import FREQUENCY_CODES, RATE_CODES, VALID_AMORTIZATION
+from mortgage.validation import ERROR_MESSAGES, validate_record
+
+DEFAULT_CHUNK_SIZE = 65536
+
+_AMORTIZATION_BY_TEXT = {str(amortization): amortization for amortization in VALID_AMORTIZATION}
+
+class PipelineSummary:
+
+    """Keeps count of the rows read, priced and rejected by the pipeline"""
+
+    def __init__(self):
+
+        """Initializing an empty PipelineSummary object"""
+
+        self.rows = 0
+        self.priced = 0
+        self.rejected = 0
+
+    def add(self, priced: int, rejected: int):
+
+        """Adds the counts of one processed chunk to the summary"""
+
+        self.rows += priced + rejected
+        self.priced += priced
+        self.rejected += rejected
+
+    def __repr__(self):
+
+        """Returns a string representation of a PipelineSummary object without formatting"""
+
+        return f"PipelineSummary(rows={self.rows}, priced={self.priced}, rejected={self.rejected})"
+
+def read_chunks(input_file, chunk_size: int = DEFAULT_CHUNK_SIZE):
+
+    """Yields lists of at most chunk_size lines from an open input file"""
+
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive.")
+
+    while True:
+        lines = list(islice(input_file, chunk_size))
+        if not lines:
+            return
+        yield lines
+
+def parse_chunk(lines):
+
+    """
+    Parses and validates a chunk of portfolio lines
+
+    Arguments:
+    lines(list of str): the lines read from the portfolio file
+
+    Returns a tuple of (records, rejects). records holds the columns
+    (rows, amounts, rate_codes, frequency_codes, amortizations) of the valid lines,
+    where each row is the list of fields split from the line,
+    rejects is a list of (row, message) pairs using the same messages as the Mortgage class.
+    """
+
+    rows, amounts, rate_codes, frequency_codes, amortizations = [], [], [], [], []
+    rejects = []
+
+    for line in lines:
+        row = line.strip()
+        if not row:
+            continue
+        items = row.split(",")
+
+        if len(items) < 4:
+            rejects.append((row, "list index out of range"))
+            continue
+
+        try:
+            amount = float(items[0])
+        except ValueError as e:
+            rejects.append((row, str(e)))
+            continue
+
+        #valid periods are found without parsing, anything else is parsed for the error message
+        amortization = _AMORTIZATION_BY_TEXT.get(items[2])
+        if amortization is None:
+            try:
+                amortization = int(items[2])
+            except ValueError as e:
+                rejects.append((row, str(e)))
+                continue
+
+        #float parses nan and inf, which are rejected here row by row like any amount that is not positive
+        error = validate_record(amount, items[1], items[3], amortization)
+        if error:
+            rejects.append((row, ERROR_MESSAGES[error]))
+        else:
+            rows.append(items)
+            amounts.append(amount)
+            rate_codes.append(RATE_CODES[items[1]])
+            frequency_codes.append(FREQUENCY_CODES[items[3]])
+            amortizations.append(amortization)
+
+    return (rows, amounts, rate_codes, frequency_codes, amortizations), rejects
+
+def price_chunk(lines):
+
+    """Parses a chunk of lines and calculates the payments of its valid rows,
+    returns a tuple of (rows, payments, rejects)"""
+
+    (rows, amounts, rate_codes, frequency_codes, amortizations), rejects = parse_chunk(lines)
+
+    if rows:
+        payments = calculate_payments_from_codes(amounts, rate_codes, frequency_codes, amortizations)
+    else:
+        payments = ()
+
+    return rows, payments, rejects
+
+def format_rejects(rejects) -> str:
+
+    """Returns the reject stream lines for a list of (row, message) pairs"""
+
+    return "".join(f"Data: {row} caused Exception: {message}\n" for row, message in rejects)
+
+def render_results(rows, payments, rejects) -> tuple:
+
+    """Renders priced rows and rejects as the text of the output and reject streams,
+    returns a tuple of (priced_text, reject_text)"""
+
+    priced_text = "".join(f"{','.join(row[:4])},{payment:.2f}\n"
+                          for row, payment in zip(rows, payments))
+    return priced_text, format_rejects(rejects)
+
+def render_chunk(lines):
+
+    """Prices a chunk of lines and renders its output, returns a tuple of
+    (priced_text, reject_text, priced_count, rejected_count)"""
+
+    rows, payments, rejects = price_chunk(lines)
+    priced_text, reject_text = render_results(rows, payments, rejects)
+    return priced_text, reject_text, len(rows), len(rejects)
+
+def process_stream(input_file, output_file, reject_file, chunk_size: int = DEFAULT_CHUNK_SIZE) -> PipelineSummary:
+
+    """Prices every line of an open input file chunk by chunk, writing the results
+    and rejects as each chunk completes, returns a summary of the run"""
+
+    summary = PipelineSummary()
+
+    for lines in read_chunks(input_file, chunk_size):
+        priced_text, reject_text, priced, rejected = render_chunk(lines)
+        output_file.write(priced_text)
+        reject_file.write(reject_text)
+        summary.add(priced, rejected)
+
+    return summary
+
+def open_output(path: str, default):
+
+    """Opens a file for writing, using the default stream when the path is - """
+
+    if path == "-":
+        return default
+    return open(path, "w", newline="")
+
+def process_file(input_path: str, output_path: str = "-", reject_path: str = "-",
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, workers: int = 1,
+                 shard_bytes: int = None) -> PipelineSummary:
+
+    """Prices a portfolio file, writing the results to output_path and the rejects
+    to reject_path (stdout and stderr when -), returns a summary of the run.
+    When workers is more than one the file is priced by a process pool in shards
+    of shard_bytes instead of chunks of chunk_size lines."""
+
+    with open(input_path, "r") as input_file:
+        output_file = open_output(output_path, sys.stdout)
+        reject_file = open_output(reject_path, sys.stderr)
+
+        try:
+            if workers == 1:
+                return process_stream(input_file, output_file, reject_file, chunk_size)
+
+            #imported here so the serial path does not load the process pool machinery
+            from mortgage.parallel import DEFAULT_SHARD_BYTES, process_file_parallel
+            return process_file_parallel(input_path, output_file, reject_file, workers,
+                                         shard_bytes or DEFAULT_SHARD_BYTES)
+        finally:
+            for stream in (output_file, reject_file):
+                if stream is not sys.stdout and stream is not sys.stderr:
+                    stream.close()
+
+def run_instrumented(args, function, *function_args):
+
+    """Runs a command's function, profiling it and recording its metrics when the
+    --profile and --metrics options ask for it, returns the function's result"""
+
+    if not (args.profile or args.metrics):
+        return function(*function_args)
+
+    #imported here so runs without these options do not load the instrumentation
+    from mortgage import instrumentation
+
+    if args.metrics:
+        instrumentation.enable()
+    try:
+        if args.profile:
+            return instrumentation.profile_call(args.profile, function, *function_args)
+        return function(*function_args)
+    finally:
+        if args.metrics:
+            instrumentation.disable()
+            instrumentation.write_prometheus(args.metrics)
+
+def build_parser() -> argparse.ArgumentParser:
+
+    """Returns the command line parser for the pipeline"""
+
+    parser = argparse.ArgumentParser(description="Price a mortgage portfolio file in chunks.")
+    parser.add_argument("input", help="portfolio file to price")
+    parser.add_argument("-o", "--output", default="-", help="file for priced rows (default: stdout)")
+    parser.add_argument("--rejects", default="-", help="file for rejected rows (default: stderr)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="lines per chunk")
+    parser.add_argument("--workers", type=int, default=1, 
+                        help="worker processes, 0 for one per CPU (default: 1, no pool)")
+    parser.add_argument("--shard-bytes", type=int, default=None, 
+                        help="approximate bytes of input per worker task")
+    parser.add_argument("--profile", metavar="PATH", help="save cProfile stats of the run to PATH")
+    parser.add_argument("--metrics", metavar="PATH", help="time each stage and save the metrics to PATH "
+                                                          "in the Prometheus text format")
+    return parser
+
+def main(argv=None) -> int:
+
+    """Runs the pipeline from the command line, returns the exit code"""
+
+    args = build_parser().parse_args(argv)
+
+    try:
+        summary = run_instrumented(args, process_file, args.input, args.output, args.rejects,
+                                   args.chunk_size, args.workers, args.shard_bytes)
+    except FileNotFoundError:
+        print("File was not found", file=sys.stderr)
+        return 1
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    print(f"Priced {summary.priced} of {summary.rows} rows, rejected {summary.rejected}.", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    #runs the imported module rather than __main__, so --metrics times the functions this run calls
+    from mortgage import pipeline
+    sys.exit(pipeline.main())
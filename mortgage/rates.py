@@ -0,0 +1,152 @@
+"""
+Description: Loads mortgage rates from a file and swaps them in while the program runs.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Create a RateTableProvider for a JSON file such as {"FIXED_5": 0.0519, ...}
+or a CSV file with NAME,RATE lines, and call load() to put its rates into
+effect. Call reload_if_changed() or watch() to pick up later edits. Every
+load installs a new versioned RateTable snapshot in one assignment, with
+its own annuity factors, so payment calculations never take a lock and
+derived tables and caches see the new rates. Rates can only be set for the
+existing MortgageRate names, so MortgageRate[...] validation is unchanged.
+"""
+import csv
+import json
+import os
+import threading
+
+from mortgage.pixell_lookup import RateTable, current_rate_table, install_rate_table, lookup_rate
+
+def _is_number(text: str) -> bool:
+
+    """Returns True if the text can be read as a float"""
+
+    try:
+        float(text)
+    except ValueError:
+        return False
+    return True
+
+def read_rates(path: str) -> dict:
+
+    """
+    Reads annual rates keyed by MortgageRate from a JSON or CSV file
+
+    Raises:
+        ValueError: the file can not be read as rates, or names an invalid rate
+        FileNotFoundError: the file does not exist
+    """
+
+    with open(path, "r", newline="") as rate_file:
+        if path.lower().endswith(".json"):
+            try:
+                entries = json.load(rate_file)
+            except ValueError:
+                raise ValueError("Rate file is not valid JSON.")
+            if not isinstance(entries, dict):
+                raise ValueError("Rate file must map rate names to rates.")
+            entries = list(entries.items())
+        else:
+            entries = [row for row in csv.reader(rate_file) if row and not row[0].startswith("#")]
+            #a first row without a numeric rate, such as "name,rate", is a header
+            if entries and len(entries[0]) == 2 and not _is_number(entries[0][1]):
+                entries = entries[1:]
+            if any(len(row) != 2 for row in entries):
+                raise ValueError("Rate file rows must hold a name and a rate.")
+
+    rates = {}
+    for name, value in entries:
+        rate = lookup_rate(name.strip() if isinstance(name, str) else name)
+        if rate is None:
+            raise ValueError("Rate provided is invalid.")
+        try:
+            rates[rate] = float(value)
+        except (TypeError, ValueError):
+            raise ValueError("Rate file rates must be numbers.")
+
+    return rates
+
+class RateTableProvider:
+
+    """Keeps the rates in effect in step with a rate file"""
+
+    def __init__(self, path: str):
+
+        """Initializing a RateTableProvider object for the rate file at path"""
+
+        self.path = path
+        self.__modified = None
+        #only writers take the lock, readers use the installed snapshot directly
+        self.__lock = threading.Lock()
+        self.__stop = threading.Event()
+        self.__watcher = None
+
+    def load(self) -> RateTable:
+
+        """
+        Reads the rate file and puts its rates into effect, rates missing from
+        the file keep their current value
+
+        Raises:
+            ValueError: the file is not a valid rate file, the rates in effect are not changed
+            FileNotFoundError: the file does not exist
+
+        Returns the new rate table.
+        """
+
+        with self.__lock:
+            modified = os.stat(self.path).st_mtime_ns
+            current = current_rate_table()
+            rates = dict(current.rates)
+            rates.update(read_rates(self.path))
+
+            table = RateTable(rates, current.version + 1, self.path)
+            install_rate_table(table)
+            self.__modified = modified
+            return table
+
+    def reload_if_changed(self) -> bool:
+
+        """Loads the rate file again if it was modified since it was last loaded,
+        returns True when new rates were put into effect"""
+
+        if os.stat(self.path).st_mtime_ns == self.__modified:
+            return False
+        self.load()
+        return True
+
+    def watch(self, interval: float = 5.0, on_error=None) -> threading.Thread:
+
+        """Starts a background thread that checks the rate file for changes every interval seconds.
+        A file that fails to load leaves the rates in effect and is passed to on_error if given."""
+
+        def run():
+            while not self.__stop.wait(interval):
+                try:
+                    self.reload_if_changed()
+                except (OSError, ValueError) as e:
+                    if on_error is not None:
+                        on_error(e)
+
+        self.__stop.clear()
+        self.__watcher = threading.Thread(target=run, name="rate-table-watcher", daemon=True)
+        self.__watcher.start()
+        return self.__watcher
+
+    def stop(self):
+
+        """Stops the background thread started by watch"""
+
+        self.__stop.set()
+        if self.__watcher is not None:
+            self.__watcher.join()
+            self.__watcher = None
+
+def reset_rates() -> RateTable:
+
+    """Puts the rates defined in MortgageRate back into effect, returns the new rate table"""
+
+    current = current_rate_table()
+    table = RateTable({rate: rate.value for rate in current.rates}, current.version + 1)
+    install_rate_table(table)
+    return table
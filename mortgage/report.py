@@ -0,0 +1,235 @@
+"""
+Description: Writes mortgage payment reports in bulk to a buffered output stream.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Create a ReportWriter over an open output stream, or over a file from
+open_report(path), and pass it chunks of rows with their already calculated
+payments, or chunks of input lines to price. The text format renders the
+same layout as printing each Mortgage, the csv and jsonl formats write one
+record per line. Paths ending in .gz are written with gzip. Run
+python -m mortgage.report INPUT -o OUTPUT --format csv to report a portfolio file.
+"""
+import argparse
+import gzip
+import json
+import sys
+
+from mortgage.pipeline import DEFAULT_CHUNK_SIZE, PipelineSummary, price_chunk, read_chunks
+from mortgage.pixell_lookup import RATE_BY_NAME
+
+FORMATS = ("text", "csv", "jsonl")
+
+#the size of the write buffer of report files, so each write call is not a system call
+BUFFER_SIZE = 1024 * 1024
+
+CSV_HEADER = "amount,rate,amortization,frequency,payment\n"
+
+def _text_records(rows, payments, separator: str) -> list:
+
+    """Returns the text report record of each row, laid out like the string of a Mortgage"""
+
+    #rates and frequencies repeat, so each is formatted once per chunk
+    rate_text = {}
+    frequency_text = {}
+    records = []
+    end = f"\n{separator}\n" if separator else "\n"
+
+    for row, payment in zip(rows, payments):
+        rate, frequency = row[1], row[3]
+        if rate not in rate_text:
+            rate_text[rate] = f"{RATE_BY_NAME[rate].annual_rate * 100 :.2f}%"
+        if frequency not in frequency_text:
+            frequency_text[frequency] = frequency.capitalize()
+        records.append(f"Mortgage Amount: ${float(row[0]):,.2f}\n"
+                       f"Rate: {rate_text[rate]}\n"
+                       f"Amortization: {int(row[2])}\n"
+                       f"Frequency: {frequency_text[frequency]} -- "
+                       f"Calculated Payment: ${payment:,.2f}{end}")
+
+    return records
+
+def _csv_records(rows, payments, separator: str) -> list:
+
+    """Returns the csv report line of each row"""
+
+    #validated rate and frequency names never hold commas or quotes
+    return [f"{float(row[0])!r},{row[1]},{int(row[2])},{row[3]},{payment:.2f}\n"
+            for row, payment in zip(rows, payments)]
+
+def _jsonl_records(rows, payments, separator: str) -> list:
+
+    """Returns the JSON Lines report line of each row"""
+
+    return [f'{{"amount": {float(row[0])!r}, "rate": "{row[1]}", "amortization": {int(row[2])}, '
+            f'"frequency": "{row[3]}", "payment": {round(payment, 2)!r}}}\n'
+            for row, payment in zip(rows, payments)]
+
+def _payment_list(payments) -> list:
+
+    """Returns payments as a list of Python floats, which format faster than numpy scalars"""
+
+    return payments.tolist() if hasattr(payments, "tolist") else list(payments)
+
+_RENDERERS = {"text": _text_records, "csv": _csv_records, "jsonl": _jsonl_records}
+
+class ReportWriter:
+
+    """Renders batches of priced rows and rejected rows to an output stream"""
+
+    def __init__(self, output_file, report_format: str = "text", separator: str = ""):
+
+        """
+        Initializing a ReportWriter object
+
+        Arguments:
+        output_file: the open text stream the report is written to
+        report_format(str): one of text, csv or jsonl
+        separator(str): a line written before the first record and after every record of a text report
+
+        Raises:
+            ValueError: the report format provided is invalid
+        """
+
+        if report_format not in _RENDERERS:
+            raise ValueError("Report format provided is invalid.")
+
+        self.output_file = output_file
+        self.report_format = report_format
+        self.separator = separator
+        self.summary = PipelineSummary()
+        self.__render = _RENDERERS[report_format]
+        self.__started = False
+
+    def _start(self):
+
+        """Writes the report header before the first record"""
+
+        if self.__started:
+            return
+        self.__started = True
+
+        if self.report_format == "csv":
+            self.output_file.write(CSV_HEADER)
+        elif self.report_format == "text" and self.separator:
+            self.output_file.write(f"{self.separator}\n")
+
+    def _reject_records(self, rejects) -> list:
+
+        """Returns the report record of each (row, message) reject, csv reports leave rejects out"""
+
+        if self.report_format == "text":
+            end = f"\n{self.separator}\n" if self.separator else "\n"
+            return [f"Data: {row} caused Exception: {message}{end}" for row, message in rejects]
+        if self.report_format == "jsonl":
+            return [json.dumps({"data": row, "error": message}) + "\n" for row, message in rejects]
+        return []
+
+    def write(self, rows, payments, rejects=()):
+
+        """Writes a batch of rows with their calculated payments, then any rejected (row, message) pairs"""
+
+        self._start()
+        records = self.__render(rows, _payment_list(payments), self.separator)
+        records.extend(self._reject_records(rejects))
+        self.output_file.write("".join(records))
+        self.summary.add(len(rows), len(rejects))
+
+    def write_lines(self, lines):
+
+        """Prices a chunk of input lines and writes their records in the order of the lines"""
+
+        rows, payments, rejects = price_chunk(lines)
+        if not rejects:
+            self.write(rows, payments)
+            return
+
+        self._start()
+        priced = iter(self.__render(rows, _payment_list(payments), self.separator))
+        rejected = self._reject_records(rejects)
+        records = []
+        next_reject = 0
+
+        #each non-blank line was either priced or rejected, and a rejected row is its stripped line
+        for line in lines:
+            row = line.strip()
+            if not row:
+                continue
+            if next_reject < len(rejects) and rejects[next_reject][0] == row:
+                if rejected:
+                    records.append(rejected[next_reject])
+                next_reject += 1
+            else:
+                records.append(next(priced))
+
+        self.output_file.write("".join(records))
+        self.summary.add(len(rows), len(rejects))
+
+def open_report(path: str, compress: bool = None):
+
+    """Opens a buffered text stream for a report, writing stdout when the path is -
+    and gzip when compress is True or, by default, when the path ends in .gz"""
+
+    if path == "-":
+        return sys.stdout
+    if compress is None:
+        compress = path.endswith(".gz")
+    if compress:
+        return gzip.open(path, "wt", newline="")
+    return open(path, "w", buffering=BUFFER_SIZE, newline="")
+
+def write_report(input_path: str, output_path: str = "-", report_format: str = "text",
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, compress: bool = None,
+                 separator: str = "") -> PipelineSummary:
+
+    """Prices a portfolio file and writes its report to output_path, returns a summary of the rows"""
+
+    if report_format not in _RENDERERS:
+        raise ValueError("Report format provided is invalid.")
+
+    with open(input_path, "r") as input_file:
+        output_file = open_report(output_path, compress)
+        writer = ReportWriter(output_file, report_format, separator)
+        try:
+            for lines in read_chunks(input_file, chunk_size):
+                writer.write_lines(lines)
+        finally:
+            if output_file is sys.stdout:
+                output_file.flush()
+            else:
+                output_file.close()
+
+    return writer.summary
+
+def build_parser() -> argparse.ArgumentParser:
+
+    """Returns the command line parser for the report command"""
+
+    parser = argparse.ArgumentParser(description="Write a payment report for a portfolio file.")
+    parser.add_argument("input", help="portfolio file with one amount,rate,amortization,frequency per line")
+    parser.add_argument("-o", "--output", default="-", help="report file, gzip when it ends in .gz (default: stdout)")
+    parser.add_argument("--format", choices=FORMATS, default="text", help="report format")
+    parser.add_argument("--gzip", action="store_true", default=None, help="compress the report with gzip")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="lines per chunk")
+    parser.add_argument("--separator", default="", help="line written between the records of a text report")
+    return parser
+
+def main(argv=None) -> int:
+
+    """Writes a report from the command line, returns the exit code"""
+
+    args = build_parser().parse_args(argv)
+
+    try:
+        summary = write_report(args.input, args.output, args.format, args.chunk_size, args.gzip, args.separator)
+    except FileNotFoundError:
+        print("File was not found", file=sys.stderr)
+        return 1
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    print(f"Reported {summary.priced} of {summary.rows} rows, rejected {summary.rejected}.", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+"""
+Description: Re-prices a whole portfolio under many rate scenarios at once.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Build scenarios as maps from MortgageRate members or names to annual
+rates, for example with rate_shock(25) for +25bp on every rate, then call
+price_scenarios(portfolio, scenarios) to get a payment matrix with one row
+per loan and one column per scenario. Annuity factors are worked out once
+per scenario for each of the possible terms and shared by every loan on
+that term. Pass workers to spread blocks of scenarios over processes.
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from mortgage.batch import check_frequency_codes, check_rate_codes
+from mortgage.pixell_lookup import (FREQUENCIES, RATES, VALID_AMORTIZATION, MortgageRate,
+                                    calculate_annuity_factor, lookup_rate)
+
+DEFAULT_SCENARIOS_PER_BLOCK = 16
+
+#term index layout: rate code, then frequency code, then amortization in years
+_AMORTIZATION_SLOTS = max(VALID_AMORTIZATION) + 1
+
+#the amounts and term indexes priced by a worker process, set by _share_book when it starts
+_book = None
+
+def rate_shock(basis_points: float) -> dict:
+
+    """Returns a scenario moving every rate by the given number of basis points"""
+
+    return {rate: rate.annual_rate + basis_points / 10000 for rate in MortgageRate}
+
+def scenario_rates(scenario: dict) -> list:
+
+    """
+    Returns the annual rate of each MortgageRate, in code order, under a scenario
+
+    Arguments:
+    scenario(dict): annual rates keyed by MortgageRate member or name, rates that are
+    not in the scenario keep their current value
+
+    Raises:
+        ValueError:
+        the rate provided must be valid,
+        scenario rates must not be negative
+    """
+
+    rates = [rate.annual_rate for rate in RATES]
+
+    for key, annual_rate in scenario.items():
+        rate = key if isinstance(key, MortgageRate) else lookup_rate(key)
+        if rate is None:
+            raise ValueError("Rate provided is invalid.")
+        if annual_rate < 0:
+            raise ValueError("Scenario rate must not be negative.")
+        rates[RATES.index(rate)] = annual_rate
+
+    return rates
+
+def scenario_factors(rates: list) -> np.ndarray:
+
+    """Returns the annuity factor of every term under one set of rates, indexed by term index"""
+
+    factors = np.full(len(RATES) * len(FREQUENCIES) * _AMORTIZATION_SLOTS, np.nan)
+
+    for rate_code, annual_rate in enumerate(rates):
+        for frequency_code, frequency in enumerate(FREQUENCIES):
+            for amortization in VALID_AMORTIZATION:
+                index = (rate_code * len(FREQUENCIES) + frequency_code) * _AMORTIZATION_SLOTS + amortization
+                if annual_rate == 0:
+                    #with no interest the loan is repaid in equal parts
+                    factors[index] = 1 / (amortization * frequency.value)
+                else:
+                    factors[index] = calculate_annuity_factor(annual_rate, frequency.value, amortization)
+
+    return factors
+
+def term_indexes(rate_codes, frequency_codes, amortizations) -> np.ndarray:
+
+    """
+    Returns the term index of each loan, shared by every loan with the same rate, frequency and amortization
+
+    Raises:
+        ValueError: a rate code, frequency code or amortization period is not valid
+    """
+
+    rate_codes = np.asarray(rate_codes, dtype=np.intp)
+    frequency_codes = np.asarray(frequency_codes, dtype=np.intp)
+    amortizations = np.asarray(amortizations, dtype=np.intp)
+
+    #codes outside the tables would give the term index of another loan
+    check_rate_codes(rate_codes)
+    check_frequency_codes(frequency_codes)
+
+    if not np.all(np.isin(amortizations, tuple(VALID_AMORTIZATION))):
+        raise ValueError("Amortization provided is invalid.")
+
+    return (rate_codes * len(FREQUENCIES) + frequency_codes) * _AMORTIZATION_SLOTS + amortizations
+
+def price_block(amounts: np.ndarray, terms: np.ndarray, scenario_block: list) -> np.ndarray:
+
+    """Returns the payments of every loan under each set of rates in a block of scenarios"""
+
+    factors = np.stack([scenario_factors(rates) for rates in scenario_block])
+    return amounts[:, None] * factors[:, terms].T
+
+def _share_book(book: tuple):
+
+    """Keeps the amounts and term indexes of the book in a worker process, so they are sent
+    once to each worker instead of once with every block"""
+
+    global _book
+    _book = book
+
+def _price_shared_block(scenario_block: list) -> np.ndarray:
+
+    """Prices a block of scenarios for the book shared with this worker process"""
+
+    return price_block(*_book, scenario_block)
+
+def price_scenarios(portfolio, scenarios, workers: int = 1,
+                    scenarios_per_block: int = DEFAULT_SCENARIOS_PER_BLOCK) -> np.ndarray:
+
+    """
+    Prices every loan in a portfolio under every scenario
+
+    Arguments:
+    portfolio: a MortgagePortfolio, BinaryPortfolio or any object with amounts, rate_codes,
+    frequency_codes and amortizations columns
+    scenarios(list of dict): the rate override maps, see scenario_rates
+    workers(int): processes used to price blocks of scenarios, 1 prices them in this process
+    scenarios_per_block(int): scenarios priced together by one worker task
+
+    Raises:
+        ValueError: the number of workers or block size is not positive, a loan amount or
+        amortization is invalid, or a scenario is invalid
+
+    Returns an array of payments with one row per loan and one column per scenario.
+    """
+
+    if workers <= 0 or scenarios_per_block <= 0:
+        raise ValueError("Workers and scenarios per block must be positive.")
+
+    amounts = np.asarray(portfolio.amounts, dtype=np.float64)
+    if not np.all((amounts > 0) & (amounts < np.inf)):
+        raise ValueError("Loan Amount must be positive.")
+
+    terms = term_indexes(portfolio.rate_codes, portfolio.frequency_codes, portfolio.amortizations)
+    rates = [scenario_rates(scenario) for scenario in scenarios]
+    blocks = [rates[start:start + scenarios_per_block] for start in range(0, len(rates), scenarios_per_block)]
+
+    if not blocks:
+        return np.empty((len(amounts), 0))
+
+    if workers == 1 or len(blocks) == 1:
+        return np.hstack([price_block(amounts, terms, block) for block in blocks])
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_share_book, initargs=((amounts, terms),)) as executor:
+        #map keeps the blocks, and so the scenario columns, in order
+        return np.hstack(list(executor.map(_price_shared_block, blocks)))
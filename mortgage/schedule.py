@@ -0,0 +1,98 @@
+"""
+Description: Vectorized amortization schedules for single mortgages and whole portfolios.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Call schedule_arrays for the full schedule of one mortgage as numpy
+arrays, or iterate over portfolio_schedules to build the schedules of a
+whole book a block of loans at a time. The balance after each period is
+worked out in closed form, so no error builds up from repeated subtraction.
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+from mortgage.batch import factor_array
+from mortgage.pixell_lookup import FREQUENCIES, RATES
+
+DEFAULT_LOANS_PER_BLOCK = 512
+
+class ScheduleArrays(NamedTuple):
+
+    """The period numbers, payments, interest, principal and remaining balances of a schedule.
+    For a block of loans each array has one row per loan, padded with zeros past its last period."""
+
+    period: np.ndarray
+    payment: np.ndarray
+    interest: np.ndarray
+    principal: np.ndarray
+    balance: np.ndarray
+
+def _schedule(amounts, interest_rates, payments, number_of_payments, periods) -> ScheduleArrays:
+
+    """Builds the schedule arrays for columns of loans over the given period numbers"""
+
+    growth = 1 + interest_rates[:, None]
+    total_growth = growth ** number_of_payments[:, None]
+
+    #balance after k payments: P * ((1 + i) ** n - (1 + i) ** k) / ((1 + i) ** n - 1)
+    opening = amounts[:, None] * (total_growth - growth ** (periods - 1)) / (total_growth - 1)
+    balance = amounts[:, None] * (total_growth - growth ** periods) / (total_growth - 1)
+    interest = opening * interest_rates[:, None]
+    payment = np.broadcast_to(payments[:, None], balance.shape).copy()
+
+    #periods past the end of a shorter loan are left as zeros
+    active = periods <= number_of_payments[:, None]
+    for column in (payment, interest, balance):
+        column[~active] = 0.0
+
+    return ScheduleArrays(np.where(active, periods, 0), payment, interest, payment - interest, balance)
+
+def schedule_arrays(loan_amount: float, rate, frequency, amortization: int) -> ScheduleArrays:
+
+    """
+    Builds the full amortization schedule of one mortgage
+
+    Arguments:
+    loan_amount(float): the loan amount
+    rate(MortgageRate): the rate of the mortgage
+    frequency(PaymentFrequency): the payment frequency
+    amortization(int): the amortization period in years
+
+    Returns a ScheduleArrays holding one entry per payment period.
+    """
+
+    schedule = portfolio_schedule([loan_amount], [RATES.index(rate)], [FREQUENCIES.index(frequency)], [amortization])
+    return ScheduleArrays(*(column[0] for column in schedule))
+
+def portfolio_schedule(amounts, rate_codes, frequency_codes, amortizations) -> ScheduleArrays:
+
+    """Builds the amortization schedules of a block of loans given as encoded columns,
+    returns a ScheduleArrays with one row per loan"""
+
+    amounts = np.asarray(amounts, dtype=np.float64)
+    rate_codes = np.asarray(rate_codes, dtype=np.intp)
+    frequency_codes = np.asarray(frequency_codes, dtype=np.intp)
+    amortizations = np.asarray(amortizations, dtype=np.intp)
+
+    annual_rates = np.array([rate.annual_rate for rate in RATES])[rate_codes]
+    frequencies = np.array([frequency.value for frequency in FREQUENCIES])[frequency_codes]
+    number_of_payments = amortizations * frequencies
+
+    payments = amounts * factor_array()[rate_codes, frequency_codes, amortizations]
+    periods = np.arange(1, number_of_payments.max(initial=0) + 1)
+
+    return _schedule(amounts, annual_rates / frequencies, payments, number_of_payments, periods)
+
+def portfolio_schedules(amounts, rate_codes, frequency_codes, amortizations,
+                        loans_per_block: int = DEFAULT_LOANS_PER_BLOCK):
+
+    """Yields (first_loan_index, ScheduleArrays) for consecutive blocks of at most loans_per_block loans,
+    so the schedules of a whole portfolio can be produced without holding them all in memory"""
+
+    if loans_per_block <= 0:
+        raise ValueError("Loans per block must be positive.")
+
+    for start in range(0, len(amounts), loans_per_block):
+        end = start + loans_per_block
+        yield start, portfolio_schedule(amounts[start:end], rate_codes[start:end],
+                                        frequency_codes[start:end], amortizations[start:end])
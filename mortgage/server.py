@@ -0,0 +1,278 @@
+"""
+Description: An asyncio quoting service that returns mortgage payments over a line protocol.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Run python -m mortgage.server --port 8650 to listen on localhost. Each
+request is one line of JSON, either a single quote such as
+    {"amount": 500000, "rate": "FIXED_1", "frequency": "MONTHLY", "amortization": 10}
+or a batch {"quotes": [...]} of them, and gets one line of JSON back holding
+{"payment": ...} or {"error": ...} for each quote, using the validation
+messages of the Mortgage class. Single quotes arriving at the same time from
+different clients are coalesced into one vectorized calculation.
+"""
+import argparse
+import asyncio
+import json
+import math
+import sys
+from numbers import Real
+
+from mortgage.batch import calculate_payments_from_codes
+from mortgage.pixell_lookup import FREQUENCY_CODES, RATE_CODES
+from mortgage.validation import ERROR_MESSAGES, validate_record
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8650
+DEFAULT_MAX_CONNECTIONS = 1024
+DEFAULT_MAX_BATCH = 4096
+DEFAULT_MAX_PENDING = 16384
+DEFAULT_BATCH_WINDOW = 0.001
+MAX_LINE_BYTES = 1024 * 1024
+
+def parse_quote(request) -> tuple:
+
+    """Validates one quote request with the Mortgage rules, returns a tuple of
+    (error message, None) when it is invalid or (None, encoded terms) when it is valid"""
+
+    if not isinstance(request, dict):
+        return "Quote must be an object.", None
+
+    amount = request.get("amount")
+    if not isinstance(amount, Real) or isinstance(amount, bool):
+        return "Loan Amount must be a number.", None
+    try:
+        amount = float(amount)
+    except OverflowError:
+        #integers too large for a float are out of range like infinity
+        amount = math.inf
+
+    rate = request.get("rate")
+    frequency = request.get("frequency")
+    amortization = request.get("amortization")
+
+    #JSON NaN and Infinity are numbers too, validate_record rejects them as amounts that are not positive
+    error = validate_record(amount, rate, frequency, amortization)
+    if error:
+        return ERROR_MESSAGES[error], None
+
+    return None, (amount, RATE_CODES[rate], FREQUENCY_CODES[frequency], int(amortization))
+
+def price_terms(terms) -> list:
+
+    """Calculates the payments of a list of encoded terms in one vectorized pass"""
+
+    amounts, rate_codes, frequency_codes, amortizations = zip(*terms)
+    return calculate_payments_from_codes(amounts, rate_codes, frequency_codes, amortizations).tolist()
+
+class QuoteServer:
+
+    """Serves mortgage payment quotes to many concurrent clients"""
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                 max_connections: int = DEFAULT_MAX_CONNECTIONS, max_batch: int = DEFAULT_MAX_BATCH,
+                 max_pending: int = DEFAULT_MAX_PENDING, batch_window: float = DEFAULT_BATCH_WINDOW):
+
+        """
+        Initializing a QuoteServer object
+
+        Arguments:
+        host(str), port(int): the address to listen on, port 0 picks a free port
+        max_connections(int): the most clients served at once, others wait to be served
+        max_batch(int): the most single quotes priced in one vectorized calculation
+        max_pending(int): the most single quotes waiting to be priced, readers wait when it is reached
+        batch_window(float): seconds to wait for more single quotes before pricing a batch
+
+        Raises:
+            ValueError: any of the limits is not positive
+        """
+
+        if min(max_connections, max_batch, max_pending) <= 0:
+            raise ValueError("Server limits must be positive.")
+
+        self.host = host
+        self.port = port
+        self.max_batch = max_batch
+        self.batch_window = batch_window
+        self.requests = 0
+        self.batches = 0
+        self.__max_pending = max_pending
+        self.__connections = asyncio.Semaphore(max_connections)
+        self.__pending = None
+        self.__server = None
+        self.__batcher = None
+
+    async def start(self):
+
+        """Starts listening and pricing, sets port to the port actually bound"""
+
+        self.__pending = asyncio.Queue(self.__max_pending)
+        self.__batcher = asyncio.create_task(self._price_pending())
+        self.__server = await asyncio.start_server(self._handle, self.host, self.port, limit=MAX_LINE_BYTES)
+        self.port = self.__server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+
+        """Serves clients until the server is closed"""
+
+        await self.__server.serve_forever()
+
+    async def close(self):
+
+        """Stops listening and pricing"""
+
+        self.__server.close()
+        await self.__server.wait_closed()
+        self.__batcher.cancel()
+
+    async def quote(self, terms) -> float:
+
+        """Queues one set of encoded terms to be priced with other pending quotes, returns its payment"""
+
+        future = asyncio.get_running_loop().create_future()
+        #waits here when too many quotes are pending, which stops the client's reads
+        await self.__pending.put((terms, future))
+        return await future
+
+    async def respond(self, request) -> dict:
+
+        """Returns the response to one decoded request"""
+
+        if isinstance(request, dict) and "quotes" in request:
+            quotes = request["quotes"]
+            if not isinstance(quotes, list):
+                return {"error": "Quotes must be a list."}
+            return {"results": self._price_batch(quotes)}
+
+        error, terms = parse_quote(request)
+        if error:
+            return {"error": error}
+        return {"payment": await self.quote(terms)}
+
+    def _price_batch(self, quotes) -> list:
+
+        """Prices a batch request in one vectorized pass, returns a result for each quote"""
+
+        parsed = [parse_quote(quote) for quote in quotes]
+        valid_terms = [terms for error, terms in parsed if error is None]
+        payments = iter(price_terms(valid_terms) if valid_terms else ())
+        self.batches += 1
+
+        return [{"error": error} if error else {"payment": next(payments)} for error, _ in parsed]
+
+    async def _price_pending(self):
+
+        """Prices the queued single quotes in batches for as long as the server runs"""
+
+        while True:
+            batch = [await self.__pending.get()]
+            if self.batch_window > 0:
+                #gives quotes arriving at about the same time a chance to join the batch
+                await asyncio.sleep(self.batch_window)
+            while len(batch) < self.max_batch and not self.__pending.empty():
+                batch.append(self.__pending.get_nowait())
+
+            try:
+                payments = price_terms([terms for terms, _ in batch])
+            except Exception:
+                #quotes from other clients are priced one by one, so only the quote that fails gets the error
+                self._price_each(batch)
+                continue
+
+            self.batches += 1
+            for (_, future), payment in zip(batch, payments):
+                if not future.done():
+                    future.set_result(payment)
+
+    def _price_each(self, batch):
+
+        """Prices the quotes of a failed batch one at a time, passing each failure to its own client"""
+
+        for terms, future in batch:
+            if future.done():
+                continue
+            try:
+                [payment] = price_terms([terms])
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                future.set_result(payment)
+
+    async def _handle(self, reader, writer):
+
+        """Answers each request line from one client until it disconnects"""
+
+        async with self.__connections:
+            try:
+                while True:
+                    try:
+                        line = await reader.readline()
+                    except ValueError:
+                        writer.write(b'{"error": "Request is too long."}\n')
+                        break
+                    if not line:
+                        break
+
+                    self.requests += 1
+                    try:
+                        request = json.loads(line)
+                    except ValueError:
+                        response = {"error": "Request is not valid JSON."}
+                    else:
+                        try:
+                            response = await self.respond(request)
+                        except Exception as e:
+                            #a request that can not be priced gets an error, the connection stays open
+                            response = {"error": str(e)}
+
+                    writer.write(json.dumps(response).encode() + b"\n")
+                    #waits while the client is slow to read its responses
+                    await writer.drain()
+            except ConnectionError:
+                pass
+            finally:
+                writer.close()
+
+def build_parser() -> argparse.ArgumentParser:
+
+    """Returns the command line parser for the quoting server"""
+
+    parser = argparse.ArgumentParser(description="Serve mortgage payment quotes.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="address to listen on")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="port to listen on")
+    parser.add_argument("--max-connections", type=int, default=DEFAULT_MAX_CONNECTIONS,
+                        help="clients served at once")
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH,
+                        help="single quotes priced together")
+    parser.add_argument("--max-pending", type=int, default=DEFAULT_MAX_PENDING,
+                        help="single quotes waiting before reads pause")
+    parser.add_argument("--batch-window", type=float, default=DEFAULT_BATCH_WINDOW,
+                        help="seconds to gather single quotes into a batch")
+    return parser
+
+async def serve(args):
+
+    """Starts a QuoteServer with the command line options and serves until interrupted"""
+
+    server = QuoteServer(args.host, args.port, args.max_connections, args.max_batch,
+                         args.max_pending, args.batch_window)
+    await server.start()
+    print(f"Serving quotes on {server.host}:{server.port}", file=sys.stderr)
+    await server.serve_forever()
+
+def main(argv=None) -> int:
+
+    """Runs the quoting server from the command line"""
+
+    args = build_parser().parse_args(argv)
+
+    try:
+        asyncio.run(serve(args))
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
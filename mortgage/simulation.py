@@ -0,0 +1,380 @@
+"""
+Description: Monte Carlo simulation of variable rates and prepayments over a whole book.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Call simulate(portfolio, VasicekRates(volatility=0.01), PrepaymentModel(0.05, 0.1),
+paths=1000, seed=7) to simulate the balances and cash flows of every loan of
+a portfolio along random paths of market rates. A rate model draws monthly
+paths of the shift of market rates from today's rates. Every loan starts at
+today's rate, then VARIABLE loans follow the shift every month and FIXED
+loans take it when their term renews, with the payment re-amortized over the
+remaining periods whenever the rate can change. Borrowers prepay in full at
+the end of a month with the probability set by a PrepaymentModel. Loans are
+stepped at their own payment frequency, and every step is vectorized across
+paths and loans, a chunk of loans at a time to bound memory. Blocks of paths
+are simulated by worker processes when workers is not 1. The same seed, block
+size and chunk size always give the same result, whatever the workers.
+"""
+import argparse
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+
+from mortgage.pipeline import DEFAULT_CHUNK_SIZE, parse_chunk, read_chunks
+from mortgage.pixell_lookup import FREQUENCIES, RATES, VALID_AMORTIZATION
+
+DEFAULT_PATHS_PER_BLOCK = 128
+DEFAULT_LOANS_PER_CHUNK = 512
+
+MONTHS = max(VALID_AMORTIZATION) * 12
+
+#months between rate changes of each rate code: every month for VARIABLE, the term for FIXED
+_RESET_MONTHS = np.array([1 if rate.name.startswith("VARIABLE") else int(rate.name.split("_")[1]) * 12
+                          for rate in RATES])
+
+#the loan columns, rates and models simulated by a worker process, set by _share_book when it starts
+_book = None
+
+class ConstantRates:
+
+    """Rate paths that shift market rates by the same amount from the first month on"""
+
+    def __init__(self, shift: float = 0.0):
+
+        """Initializing a ConstantRates object with the shift from today's rates, 0.01 for +1%"""
+
+        self.shift = shift
+
+    def __call__(self, generator: np.random.Generator, paths: int, months: int) -> np.ndarray:
+
+        """Returns the shift of market rates in each month of each path"""
+
+        return np.full((paths, months), self.shift)
+
+class VasicekRates:
+
+    """Rate paths whose shift from today's rates is mean reverting with normal monthly shocks (Vasicek)"""
+
+    def __init__(self, volatility: float = 0.01, speed: float = 0.1, long_term_shift: float = 0.0):
+
+        """
+        Initializing a VasicekRates object
+
+        Arguments:
+        volatility(float): yearly standard deviation of the shocks, 0.01 for 1%
+        speed(float): yearly rate at which the shift reverts to its long term value
+        long_term_shift(float): the shift the paths revert to
+
+        Raises:
+            ValueError: the volatility or speed is negative
+        """
+
+        if volatility < 0 or speed < 0:
+            raise ValueError("Volatility and speed must not be negative.")
+
+        self.volatility = volatility
+        self.speed = speed
+        self.long_term_shift = long_term_shift
+
+    def __call__(self, generator: np.random.Generator, paths: int, months: int) -> np.ndarray:
+
+        """Returns the shift of market rates in each month of each path, starting from today's rates"""
+
+        step = 1 / 12
+        shocks = generator.standard_normal((paths, months)) * (self.volatility * np.sqrt(step))
+        shifts = np.empty((paths, months))
+        shift = np.zeros(paths)
+
+        for month in range(months):
+            shifts[:, month] = shift
+            shift = shift + self.speed * (self.long_term_shift - shift) * step + shocks[:, month]
+
+        return shifts
+
+class PrepaymentModel(NamedTuple):
+
+    """The yearly probability that a loan is repaid in full: base_rate for every loan plus
+    incentive for each percentage point its rate is above the market rate of a new loan"""
+
+    base_rate: float = 0.0
+    incentive: float = 0.0
+
+class PortfolioColumns(NamedTuple):
+
+    """The encoded columns of the valid rows of a portfolio file"""
+
+    amounts: np.ndarray
+    rate_codes: np.ndarray
+    frequency_codes: np.ndarray
+    amortizations: np.ndarray
+
+class SimulationResult(NamedTuple):
+
+    """Totals of the book in each month of each path, arrays of shape (paths, months), and
+    the total interest of each loan averaged over the paths"""
+
+    balance: np.ndarray
+    payments: np.ndarray
+    interest: np.ndarray
+    prepayments: np.ndarray
+    loan_interest: np.ndarray
+
+def _simulate_frequency(totals: SimulationResult, amounts, base_rates, resets, frequency: int, periods,
+                        rate_paths: np.ndarray, prepayment: PrepaymentModel, generator: np.random.Generator):
+
+    """Steps loans with the same payment frequency through every period along every path, adding
+    their monthly totals to the totals, returns the interest of each loan summed over the paths"""
+
+    #loans with the most periods first, so the loans still being repaid are always the first columns
+    order = np.argsort(periods, kind="stable")[::-1]
+    amounts, base_rates, resets, periods = amounts[order], base_rates[order], resets[order], periods[order]
+
+    paths = len(rate_paths)
+    balance = np.repeat(amounts[None, :], paths, axis=0)
+    interest_rates = np.empty_like(balance)
+    payment = np.empty_like(balance)
+    #payments and prepayments of each loan along each path, for the interest of each loan
+    cash = np.zeros_like(balance)
+
+    prepaying = bool(prepayment.base_rate or prepayment.incentive)
+    if prepaying:
+        #a loan is prepaid once the hazard it has built up passes an exponential draw, one draw per loan and path
+        thresholds = generator.standard_exponential(balance.shape)
+
+    active = len(amounts)
+    month = -1
+
+    for step in range(int(periods[0])):
+        while periods[active - 1] <= step:
+            active -= 1
+        previous_month, month = month, step * 12 // frequency
+
+        if month != previous_month:
+            #rates change at most once a month, VARIABLE loans every month and FIXED loans when their term renews
+            resetting = np.flatnonzero(month % resets[:active] == 0)
+            if len(resetting):
+                #every loan starts at today's rate, the rate it was priced at
+                shifts = rate_paths[:, [month]] if month else 0.0
+                rates = np.maximum(base_rates[resetting] + shifts, 0.0) / frequency
+                remaining = periods[resetting] - step
+                growth = (1 + rates) ** remaining
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    factors = np.where(rates > 0, rates * growth / (growth - 1), 1 / remaining)
+                interest_rates[:, resetting] = rates
+                #the payment is re-amortized over the remaining periods at the new rate
+                payment[:, resetting] = balance[:, resetting] * factors
+
+
+        loan_balance = balance[:, :active]
+        interest = loan_balance * interest_rates[:, :active]
+        loan_balance += interest
+        #the last payment only clears what is left, and loans that were prepaid pay nothing
+        paid = np.minimum(payment[:, :active], loan_balance)
+        loan_balance -= paid
+        cash[:, :active] += paid
+
+        totals.payments[:, month] += paid.sum(axis=1)
+        totals.interest[:, month] += interest.sum(axis=1)
+
+        if (step + 1) * 12 // frequency == month and step + 1 < periods[0]:
+            continue
+
+        #borrowers decide whether to prepay once a month, after the month's last payment
+        if prepaying:
+            #the incentive is how far, in percentage points, the loan's rate is above a new loan's rate
+            market_rates = np.maximum(base_rates[:active] + rate_paths[:, [month]], 0.0)
+            incentive = np.maximum(interest_rates[:, :active] * frequency - market_rates, 0.0) * 100
+            yearly = np.minimum(prepayment.base_rate + prepayment.incentive * incentive, 1.0)
+            loan_thresholds = thresholds[:, :active]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                loan_thresholds += np.log1p(-yearly) / 12
+            prepaid = np.where(loan_thresholds < 0, loan_balance, 0.0)
+            loan_balance -= prepaid
+            cash[:, :active] += prepaid
+            totals.prepayments[:, month] += prepaid.sum(axis=1)
+
+        totals.balance[:, month] += loan_balance.sum(axis=1)
+
+    loan_interest = np.empty(len(amounts))
+    #whatever was paid beyond the amount borrowed is interest, less any rounding left in the balance
+    loan_interest[order] = cash.sum(axis=0) + balance.sum(axis=0) - paths * amounts
+    return loan_interest
+
+def simulate_block(amounts, rate_codes, frequency_codes, amortizations, annual_rates, rate_model,
+                   prepayment: PrepaymentModel, paths: int, seed: int, block: int,
+                   loans_per_chunk: int = DEFAULT_LOANS_PER_CHUNK):
+
+    """
+    Simulates one block of paths for every loan, with random streams seeded by the seed and block number
+
+    annual_rates holds today's annual rate of each rate code, worked out once by the caller so
+    worker processes use the same rates as the process that started them.
+
+    Returns a SimulationResult whose loan_interest holds the interest summed over the paths of the block.
+    """
+
+    generator = np.random.default_rng((seed, block))
+    rate_paths = rate_model(generator, paths, MONTHS)
+    totals = SimulationResult(*(np.zeros((paths, MONTHS)) for _ in range(4)), np.zeros(len(amounts)))
+
+    for start in range(0, len(amounts), loans_per_chunk):
+        chunk = slice(start, start + loans_per_chunk)
+        for frequency_code in np.unique(frequency_codes[chunk]).tolist():
+            loans = start + np.flatnonzero(frequency_codes[chunk] == frequency_code)
+            frequency = FREQUENCIES[frequency_code].value
+            totals.loan_interest[loans] = _simulate_frequency(
+                totals, amounts[loans], annual_rates[rate_codes[loans]], _RESET_MONTHS[rate_codes[loans]],
+                frequency, amortizations[loans] * frequency, rate_paths, prepayment, generator)
+
+    return totals
+
+def _share_book(book: tuple):
+
+    """Keeps the loan columns and models of the book in a worker process, so they are sent
+    once to each worker instead of once with every block"""
+
+    global _book
+    _book = book
+
+def _simulate_shared_block(paths: int, seed: int, block: int, loans_per_chunk: int):
+
+    """Simulates one block of paths for the book shared with this worker process"""
+
+    return simulate_block(*_book, paths, seed, block, loans_per_chunk)
+
+def simulate(portfolio, rate_model, prepayment: PrepaymentModel = PrepaymentModel(), paths: int = 1000,
+             seed: int = 0, workers: int = 1, paths_per_block: int = DEFAULT_PATHS_PER_BLOCK,
+             loans_per_chunk: int = DEFAULT_LOANS_PER_CHUNK) -> SimulationResult:
+
+    """
+    Simulates the balances and cash flows of every loan of a portfolio along random rate paths
+
+    Arguments:
+    portfolio: a MortgagePortfolio, BinaryPortfolio or any object with amounts, rate_codes,
+    frequency_codes and amortizations columns
+    rate_model: a callable of (generator, paths, months) returning the shift of market rates
+    from today's in each month of each path, such as VasicekRates or ConstantRates
+    prepayment(PrepaymentModel): the prepayment assumptions
+    paths(int): the number of rate paths
+    seed(int): the seed of the random streams
+    workers(int): processes that simulate blocks of paths, 1 simulates them in this process
+    paths_per_block(int): paths simulated together by one worker task
+    loans_per_chunk(int): loans stepped together, which bounds memory to a few arrays of
+    paths_per_block by loans_per_chunk values
+
+    Raises:
+        ValueError: a count is not positive, a loan amount or amortization is invalid,
+        or a prepayment rate is out of range
+
+    Returns a SimulationResult with one row per path and one column per month.
+    """
+
+    if paths <= 0 or workers <= 0 or paths_per_block <= 0 or loans_per_chunk <= 0:
+        raise ValueError("Paths, workers, paths per block and loans per chunk must be positive.")
+
+    amounts = np.asarray(portfolio.amounts, dtype=np.float64)
+    rate_codes = np.asarray(portfolio.rate_codes, dtype=np.intp)
+    frequency_codes = np.asarray(portfolio.frequency_codes, dtype=np.intp)
+    amortizations = np.asarray(portfolio.amortizations, dtype=np.intp)
+
+    if not np.all((amounts > 0) & (amounts < np.inf)):
+        raise ValueError("Loan Amount must be positive.")
+
+    if not np.all(np.isin(amortizations, tuple(VALID_AMORTIZATION))):
+        raise ValueError("Amortization provided is invalid.")
+
+    if not 0 <= prepayment.base_rate <= 1 or prepayment.incentive < 0:
+        raise ValueError("Prepayment rates must be between 0 and 1.")
+
+    sizes = [min(paths_per_block, paths - start) for start in range(0, paths, paths_per_block)]
+    #today's rates are read here, so workers use the rates of this process whatever it has set
+    annual_rates = np.array([rate.annual_rate for rate in RATES])
+    book = (amounts, rate_codes, frequency_codes, amortizations, annual_rates, rate_model, prepayment)
+
+    if workers == 1 or len(sizes) == 1:
+        blocks = [simulate_block(*book, size, seed, block, loans_per_chunk) for block, size in enumerate(sizes)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_share_book, initargs=(book,)) as executor:
+            #map keeps the blocks, and so the paths, in order
+            blocks = list(executor.map(_simulate_shared_block, sizes, [seed] * len(sizes), range(len(sizes)),
+                                       [loans_per_chunk] * len(sizes)))
+
+    return SimulationResult(*(np.vstack([getattr(block, name) for block in blocks])
+                              for name in SimulationResult._fields[:4]),
+                            sum(block.loan_interest for block in blocks) / paths)
+
+def read_portfolio(input_file, chunk_size: int = DEFAULT_CHUNK_SIZE) -> tuple:
+
+    """Reads the valid rows of an open portfolio file, returns a tuple of (PortfolioColumns, rejected row count)"""
+
+    columns, rejected = [[], [], [], []], 0
+
+    for lines in read_chunks(input_file, chunk_size):
+        (_, *records), rejects = parse_chunk(lines)
+        for column, values in zip(columns, records):
+            column.extend(values)
+        rejected += len(rejects)
+
+    return PortfolioColumns(*(np.array(column) for column in columns)), rejected
+
+def format_yearly(result: SimulationResult) -> str:
+
+    """Returns the book balance at each year end, as the mean and 5th and 95th percentiles over the
+    paths, with the mean interest and prepayments of each year, as an aligned text table"""
+
+    year_ends = result.balance[:, 11::12]
+    low, high = np.percentile(year_ends, [5, 95], axis=0)
+    interest = result.interest.reshape(len(result.interest), -1, 12).sum(axis=2).mean(axis=0)
+    prepayments = result.prepayments.reshape(len(result.prepayments), -1, 12).sum(axis=2).mean(axis=0)
+
+    lines = [f"{'year':>4}  {'mean balance':>18}  {'5% balance':>18}  {'95% balance':>18}  {'interest':>16}  "
+             f"{'prepayments':>16}"]
+    for year in range(year_ends.shape[1]):
+        lines.append(f"{year + 1:>4}  {year_ends[:, year].mean():>18,.2f}  {low[year]:>18,.2f}  "
+                     f"{high[year]:>18,.2f}  {interest[year]:>16,.2f}  {prepayments[year]:>16,.2f}")
+
+    return "\n".join(lines)
+
+def build_parser() -> argparse.ArgumentParser:
+
+    """Returns the command line parser for the simulate command"""
+
+    parser = argparse.ArgumentParser(description="Simulate variable rates and prepayments over a portfolio file.")
+    parser.add_argument("input", help="portfolio file with one amount,rate,amortization,frequency per line")
+    parser.add_argument("--paths", type=int, default=1000, help="number of rate paths")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random paths")
+    parser.add_argument("--volatility", type=float, default=0.01, help="yearly volatility of market rates")
+    parser.add_argument("--speed", type=float, default=0.1, help="yearly mean reversion speed of market rates")
+    parser.add_argument("--prepayment", type=float, default=0.05, help="yearly base prepayment rate")
+    parser.add_argument("--incentive", type=float, default=0.1,
+                        help="added yearly prepayment rate per point the loan's rate is above the market")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes simulating blocks of paths")
+    return parser
+
+def main(argv=None) -> int:
+
+    """Prints the yearly simulated totals of a portfolio file from the command line, returns the exit code"""
+
+    args = build_parser().parse_args(argv)
+
+    try:
+        with open(args.input, "r") as input_file:
+            portfolio, rejected = read_portfolio(input_file)
+        result = simulate(portfolio, VasicekRates(args.volatility, args.speed),
+                          PrepaymentModel(args.prepayment, args.incentive), args.paths, args.seed, args.workers)
+    except FileNotFoundError:
+        print("File was not found", file=sys.stderr)
+        return 1
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    print(format_yearly(result))
+    print(f"Mean total interest: {result.loan_interest.sum():,.2f}")
+    print(f"Rejected rows: {rejected}", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+"""
+Description: Deterministic synthetic portfolio files for tests and benchmarks.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Call write_portfolio(path, rows, seed, invalid_ratio) to stream a
+portfolio in the pixell_river_mortgages.txt format to disk, or iterate over
+generate_chunks(rows, seed, invalid_ratio) for its lines a chunk at a time.
+Valid rows end with their expected payment. The given fraction of rows is
+made invalid with one of the faults in INVALID_KINDS, which cover every error
+the Mortgage class raises, amounts that parse as NaN or infinity, and the
+parsing errors of a bad amount, period or row. Invalid rows end with
+EXCEPTION in place of the payment, as in the sample file, except rows cut
+short by the missing_fields fault. Each chunk of
+CHUNK_ROWS rows has its own random stream seeded by the seed and the chunk
+number, so the same seed always gives the same file and memory use does not
+grow with the number of rows. From the command line run
+python -m mortgage.synthetic OUTPUT --rows 100000000 --invalid-ratio 0.01.
+"""
+import argparse
+import sys
+
+import numpy as np
+
+from mortgage.batch import calculate_payments_from_codes
+from mortgage.pixell_lookup import FREQUENCIES, RATES, VALID_AMORTIZATION
+
+CHUNK_ROWS = 100_000
+MAX_ROWS = 100_000_000
+
+MIN_AMOUNT = 10_000
+MAX_AMOUNT = 1_000_000
+
+AMORTIZATIONS = np.array(sorted(VALID_AMORTIZATION))
+
+#fault: replacement values for the faulty field, the first four raise the errors of Mortgage.__init__
+INVALID_KINDS = {
+    "amount": ("0", "-1500.00", "-0.01"),
+    "rate": ("FIXED_7", "fixed_5", "VARIABLE"),
+    "frequency": ("DAILY", "monthly", "ANNUALLY"),
+    "amortization": ("0", "11", "35"),
+    "amount_text": ("N/A", "", "12O000.00"),
+    "amount_not_finite": ("nan", "inf", "1e400"),
+    "amortization_text": ("ten", "10.5", ""),
+    "missing_fields": (None,),
+}
+
+INVALID_KIND_NAMES = tuple(INVALID_KINDS)
+
+#position of the field each fault replaces in amount,rate,amortization,frequency,payment
+_FIELD = {"amount": 0, "rate": 1, "frequency": 3, "amortization": 2, "amount_text": 0, "amount_not_finite": 0,
+          "amortization_text": 2}
+
+def _invalid_line(fields: list, kind: str, choice: int) -> str:
+
+    """Returns the line of a row with one fault, chosen by the kind and its replacement value"""
+
+    if kind == "missing_fields":
+        #cut after the amortization period, as a truncated line would be
+        return ",".join(fields[:3]) + "\n"
+
+    fields = list(fields)
+    replacements = INVALID_KINDS[kind]
+    fields[_FIELD[kind]] = replacements[choice % len(replacements)]
+    #marked the way the sample file marks rows that are expected to be rejected
+    fields[4] = "EXCEPTION"
+    return ",".join(fields) + "\n"
+
+def generate_chunk(chunk: int, rows: int, seed: int = 0, invalid_ratio: float = 0.0,
+                   kinds=INVALID_KIND_NAMES) -> list:
+
+    """Returns the lines of one chunk of a synthetic portfolio, the same for the same chunk number and seed"""
+
+    generator = np.random.default_rng((seed, chunk))
+
+    amounts = np.round(generator.uniform(MIN_AMOUNT, MAX_AMOUNT, rows), 2)
+    rate_codes = generator.integers(0, len(RATES), rows)
+    frequency_codes = generator.integers(0, len(FREQUENCIES), rows)
+    amortizations = generator.choice(AMORTIZATIONS, rows)
+    payments = calculate_payments_from_codes(amounts, rate_codes, frequency_codes, amortizations)
+
+    rate_names = [rate.name for rate in RATES]
+    frequency_names = [frequency.name for frequency in FREQUENCIES]
+    lines = [f"{amount:.2f},{rate_names[rate]},{amortization},{frequency_names[frequency]},{payment:.2f}\n"
+             for amount, rate, frequency, amortization, payment
+             in zip(amounts.tolist(), rate_codes.tolist(), frequency_codes.tolist(), amortizations.tolist(),
+                    payments.tolist())]
+
+    if invalid_ratio > 0:
+        #faults are drawn for every row so the valid rows do not depend on the ratio
+        invalid = np.flatnonzero(generator.random(rows) < invalid_ratio)
+        faults = generator.integers(0, len(kinds), rows)
+        choices = generator.integers(0, 3, rows)
+        for index in invalid.tolist():
+            lines[index] = _invalid_line(lines[index].rstrip("\n").split(","), kinds[faults[index]],
+                                         int(choices[index]))
+
+    return lines
+
+def generate_chunks(rows: int, seed: int = 0, invalid_ratio: float = 0.0, kinds=INVALID_KIND_NAMES):
+
+    """
+    Yields the lines of a synthetic portfolio a chunk of CHUNK_ROWS lines at a time
+
+    Arguments:
+    rows(int): the number of rows, at most MAX_ROWS
+    seed(int): the seed of the random streams
+    invalid_ratio(float): the fraction of rows made invalid, from 0 to 1
+    kinds(sequence of str): the faults invalid rows are given, from INVALID_KINDS
+
+    Raises:
+        ValueError: the number of rows, ratio or kinds are not valid
+    """
+
+    if not 0 <= rows <= MAX_ROWS:
+        raise ValueError(f"Number of rows must be between 0 and {MAX_ROWS}.")
+    if not 0 <= invalid_ratio <= 1:
+        raise ValueError("Invalid row ratio must be between 0 and 1.")
+    if not kinds or any(kind not in INVALID_KINDS for kind in kinds):
+        raise ValueError("Invalid row kind provided is invalid.")
+
+    kinds = tuple(kinds)
+    for chunk, start in enumerate(range(0, rows, CHUNK_ROWS)):
+        yield generate_chunk(chunk, min(CHUNK_ROWS, rows - start), seed, invalid_ratio, kinds)
+
+def write_portfolio(path: str, rows: int, seed: int = 0, invalid_ratio: float = 0.0,
+                    kinds=INVALID_KIND_NAMES) -> int:
+
+    """Streams a synthetic portfolio file to disk, see generate_chunks for the arguments,
+    returns the number of rows written"""
+
+    with open(path, "w") as output_file:
+        for lines in generate_chunks(rows, seed, invalid_ratio, kinds):
+            output_file.writelines(lines)
+    return rows
+
+def build_parser() -> argparse.ArgumentParser:
+
+    """Returns the command line parser for the generate command"""
+
+    parser = argparse.ArgumentParser(description="Write a synthetic portfolio file in the PiXELL River format.")
+    parser.add_argument("output", help="path of the portfolio file to write")
+    parser.add_argument("--rows", type=int, default=1_000_000, help=f"number of rows, at most {MAX_ROWS}")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random rows")
+    parser.add_argument("--invalid-ratio", type=float, default=0.0, help="fraction of rows made invalid")
+    parser.add_argument("--kinds", nargs="+", choices=INVALID_KIND_NAMES, default=list(INVALID_KIND_NAMES),
+                        help="faults given to invalid rows")
+    return parser
+
+def main(argv=None) -> int:
+
+    """Writes a synthetic portfolio from the command line, returns the exit code"""
+
+    args = build_parser().parse_args(argv)
+
+    try:
+        write_portfolio(args.output, args.rows, args.seed, args.invalid_ratio, args.kinds)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
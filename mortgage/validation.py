@@ -0,0 +1,73 @@
+"""
+Description: Validation of mortgage records that reports errors as codes instead of raising.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Call validate_records with columns of loan amounts, rate names,
+frequency names and amortization periods to get an error code for every
+row, VALID for rows the Mortgage class would accept. ERROR_MESSAGES holds
+the message the Mortgage class raises for each code, so invalid rows can
+be filtered out at full speed and reported exactly as before.
+"""
+from math import inf
+
+from mortgage.pixell_lookup import FREQUENCY_CODES, RATE_CODES, VALID_AMORTIZATION
+
+VALID = 0
+INVALID_AMOUNT = 1
+INVALID_RATE = 2
+INVALID_FREQUENCY = 3
+INVALID_AMORTIZATION = 4
+
+ERROR_MESSAGES = {
+    INVALID_AMOUNT: "Loan Amount must be positive.",
+    INVALID_RATE: "Rate provided is invalid.",
+    INVALID_FREQUENCY: "Frequency provided is invalid.",
+    INVALID_AMORTIZATION: "Amortization provided is invalid.",
+}
+
+def _is_valid_name(name, codes: dict) -> bool:
+
+    """Returns True if the name is a key of the codes, without raising for unhashable values"""
+
+    try:
+        return name in codes
+    except TypeError:
+        return False
+
+def validate_record(loan_amount, rate_name, frequency_name, amortization) -> int:
+
+    """Returns the error code of one record, checked in the same order as Mortgage.__init__"""
+
+    #NaN, infinite and non-numeric amounts are not positive amounts either
+    try:
+        if not 0 < loan_amount < inf:
+            return INVALID_AMOUNT
+    except (TypeError, ArithmeticError):
+        return INVALID_AMOUNT
+    if not _is_valid_name(rate_name, RATE_CODES):
+        return INVALID_RATE
+    if not _is_valid_name(frequency_name, FREQUENCY_CODES):
+        return INVALID_FREQUENCY
+    if not _is_valid_name(amortization, VALID_AMORTIZATION):
+        return INVALID_AMORTIZATION
+    return VALID
+
+def validate_records(loan_amounts, rate_names, frequency_names, amortizations) -> list:
+
+    """
+    Validates columns of mortgage records without raising
+
+    Arguments:
+    loan_amounts(sequence of float): the loan amounts
+    rate_names(sequence of str): the names of the rates
+    frequency_names(sequence of str): the names of the payment frequencies
+    amortizations(sequence of int): the amortization periods in years
+
+    Raises:
+        ValueError: the columns do not all have the same length
+
+    Returns a list holding the error code of each row, VALID when the row is valid.
+    """
+
+    return [validate_record(*record)
+            for record in zip(loan_amounts, rate_names, frequency_names, amortizations, strict=True)]
@@ -0,0 +1,189 @@
+"""
+Description: Checks calculated payments against the expected payments in a portfolio file.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Run python -m mortgage.verify INPUT --tolerance 0.005 to compare the
+payment of every row with the expected payment in its fifth column. Rows
+marked EXCEPTION, and rows cut short before the frequency, are expected to
+be rejected. The command prints a report
+and exits with a non-zero code when any row does not match.
+"""
+import argparse
+import heapq
+import sys
+import time
+
+import numpy as np
+
+from mortgage.pipeline import DEFAULT_CHUNK_SIZE, price_chunk, read_chunks, run_instrumented
+
+#expected payments in the file are rounded to the cent
+DEFAULT_TOLERANCE = 0.005
+DEFAULT_WORST = 10
+
+EXCEPTION_MARKER = "EXCEPTION"
+
+class VerificationReport:
+
+    """Keeps the results of verifying a portfolio file"""
+
+    def __init__(self, tolerance: float, worst_count: int = DEFAULT_WORST):
+
+        """Initializing an empty VerificationReport object"""
+
+        self.tolerance = tolerance
+        self.worst_count = worst_count
+        self.rows = 0
+        self.checked = 0
+        self.mismatches = 0
+        self.expected_rejects = 0
+        self.unexpected_rejects = 0
+        self.unexpected_prices = 0
+        self.elapsed = 0.0
+        #(deviation, row, calculated payment, expected payment) of the largest deviations
+        self.worst = []
+
+    @property
+    def failures(self) -> int:
+
+        """Returns the number of rows that did not verify"""
+
+        return self.mismatches + self.unexpected_rejects + self.unexpected_prices
+
+    @property
+    def passed(self) -> bool:
+
+        """Returns True when every row verified"""
+
+        return self.failures == 0
+
+    @property
+    def rows_per_second(self) -> float:
+
+        """Returns the verification throughput"""
+
+        return self.rows / self.elapsed if self.elapsed > 0 else 0.0
+
+    def __str__(self):
+
+        """Returns the string representation of the VerificationReport object"""
+
+        lines = [f"Rows: {self.rows:,} ({self.rows_per_second:,.0f} rows/s)",
+                 f"Payments checked: {self.checked:,} (tolerance ${self.tolerance})",
+                 f"Payment mismatches: {self.mismatches:,}",
+                 f"Expected rejects: {self.expected_rejects:,}",
+                 f"Unexpected rejects: {self.unexpected_rejects:,}",
+                 f"Unexpected prices: {self.unexpected_prices:,}",
+                 f"Result: {'PASSED' if self.passed else 'FAILED'}"]
+
+        if self.worst:
+            lines.append("Worst deviations:")
+            lines.extend(f"  {deviation:.6f} -- Data: {row} -- Calculated Payment: {payment:.6f}"
+                         for deviation, row, payment, _ in self.worst)
+
+        return "\n".join(lines)
+
+def _expected_payment(row) -> float:
+
+    """Returns the expected payment in the fifth column of a row, or NaN when there is none"""
+
+    if len(row) < 5 or EXCEPTION_MARKER in row[4:]:
+        return np.nan
+    try:
+        return float(row[4])
+    except ValueError:
+        return np.nan
+
+def verify_chunk(lines, report: VerificationReport):
+
+    """Prices a chunk of lines and adds the comparison with the expected payments to the report"""
+
+    rows, payments, rejects = price_chunk(lines)
+
+    for row, _ in rejects:
+        fields = row.split(",")
+        #rows cut short before the frequency can not be priced and have no column to be marked in
+        if len(fields) < 4 or EXCEPTION_MARKER in fields[4:]:
+            report.expected_rejects += 1
+        else:
+            report.unexpected_rejects += 1
+
+    report.rows += len(rows) + len(rejects)
+    if not rows:
+        return
+
+    expected = np.array([_expected_payment(row) for row in rows])
+    has_expected = ~np.isnan(expected)
+    deviations = np.where(has_expected, np.abs(payments - expected), 0.0)
+
+    report.checked += int(has_expected.sum())
+    report.unexpected_prices += int(len(rows) - has_expected.sum())
+    report.mismatches += int((deviations > report.tolerance).sum())
+
+    #only the largest deviations of the chunk can make it into the overall worst list
+    candidates = np.argsort(deviations)[-report.worst_count:] if report.worst_count else ()
+    report.worst = heapq.nlargest(
+        report.worst_count,
+        report.worst + [(float(deviations[index]), ",".join(rows[index]), float(payments[index]),
+                         float(expected[index])) for index in candidates if has_expected[index]])
+
+def verify_stream(input_file, tolerance: float = DEFAULT_TOLERANCE, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                  worst_count: int = DEFAULT_WORST) -> VerificationReport:
+
+    """Verifies every line of an open portfolio file chunk by chunk, returns the report"""
+
+    if tolerance < 0:
+        raise ValueError("Tolerance must not be negative.")
+
+    report = VerificationReport(tolerance, worst_count)
+    start = time.perf_counter()
+
+    for lines in read_chunks(input_file, chunk_size):
+        verify_chunk(lines, report)
+
+    report.elapsed = time.perf_counter() - start
+    return report
+
+def verify_file(input_path: str, tolerance: float = DEFAULT_TOLERANCE, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                worst_count: int = DEFAULT_WORST) -> VerificationReport:
+
+    """Verifies a portfolio file, returns the report"""
+
+    with open(input_path, "r") as input_file:
+        return verify_stream(input_file, tolerance, chunk_size, worst_count)
+
+def build_parser() -> argparse.ArgumentParser:
+
+    """Returns the command line parser for the verify command"""
+
+    parser = argparse.ArgumentParser(description="Verify calculated payments against a portfolio file.")
+    parser.add_argument("input", help="portfolio file with the expected payment in the fifth column")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="largest allowed deviation in dollars")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="lines per chunk")
+    parser.add_argument("--worst", type=int, default=DEFAULT_WORST, help="number of worst deviations to report")
+    parser.add_argument("--profile", metavar="PATH", help="save cProfile stats of the run to PATH")
+    parser.add_argument("--metrics", metavar="PATH", help="time each stage and save the metrics to PATH "
+                                                          "in the Prometheus text format")
+    return parser
+
+def main(argv=None) -> int:
+
+    """Runs the verification from the command line, returns 0 when every row verified"""
+
+    args = build_parser().parse_args(argv)
+
+    try:
+        report = run_instrumented(args, verify_file, args.input, args.tolerance, args.chunk_size, args.worst)
+    except FileNotFoundError:
+        print("File was not found", file=sys.stderr)
+        return 2
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    print(report)
+    return 0 if report.passed else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+Description: Tests for the affordability solvers.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Use the tests encapsulated within this class to test the affordability module.
+"""
+from itertools import product
+from unittest import TestCase
+
+from mortgage.affordability import max_principal, max_principals, min_amortization, min_amortizations
+from mortgage.mortgage import Mortgage
+from mortgage.pixell_lookup import VALID_AMORTIZATION, MortgageRate, PaymentFrequency
+
+class AffordabilityTests(TestCase):
+
+    """Test cases for the scalar and batch affordability solvers"""
+
+    def test_max_principal_inverts_payment(self):
+
+        """Tests that a Mortgage for the maximum principal has the payment that was asked for"""
+
+        #Arrange
+        terms = list(product(MortgageRate, PaymentFrequency, sorted(VALID_AMORTIZATION)))
+
+        for rate, frequency, amortization in terms:
+            #Act
+            principal = max_principal(2500.0, rate.name, frequency.name, amortization)
+            payment = Mortgage(principal, rate.name, frequency.name, amortization).calculate_payment()
+
+            #Assert
+            self.assertAlmostEqual(payment, 2500.0, places=6)
+
+    def test_max_principals_matches_scalar(self):
+
+        """Tests that the batch solver gives the same principals as the scalar one"""
+
+        #Arrange
+        payments = [7578.30, 445.22, 1000.0]
+        rates = ["FIXED_1", "FIXED_5", MortgageRate.VARIABLE_3]
+        frequencies = ["MONTHLY", "WEEKLY", PaymentFrequency.BI_WEEKLY]
+        amortizations = [10, 25, 20]
+
+        #Act
+        principals = max_principals(payments, rates, frequencies, amortizations)
+
+        #Assert
+        expected = [max_principal(*terms) for terms in zip(payments, rates, frequencies, amortizations)]
+        self.assertEqual(principals.tolist(), expected)
+        self.assertAlmostEqual(principals[0], 682912.43, delta=0.5)
+
+    def test_min_amortization(self):
+
+        """Tests that the shortest affordable period is chosen, or None when nothing is affordable"""
+
+        #Arrange
+        payments = {amortization: Mortgage(500000, "FIXED_5", "MONTHLY", amortization).calculate_payment()
+                    for amortization in VALID_AMORTIZATION}
+
+        #Act
+        exact = min_amortization(500000, payments[15], "FIXED_5", "MONTHLY")
+        between = min_amortization(500000, payments[15] - 1, "FIXED_5", "MONTHLY")
+        unaffordable = min_amortization(500000, payments[max(VALID_AMORTIZATION)] - 1, "FIXED_5", "MONTHLY")
+
+        #Assert
+        self.assertEqual((exact, between, unaffordable), (15, 20, None))
+
+    def test_min_amortizations_matches_scalar(self):
+
+        """Tests that the batch solver gives the same periods as the scalar one, 0 for none"""
+
+        #Arrange
+        amounts = [500000, 500000, 500000, 100000]
+        budgets = [10000, 3500, 100, 2000]
+        rates = ["FIXED_5"] * 4
+        frequencies = ["MONTHLY", "MONTHLY", "MONTHLY", "WEEKLY"]
+
+        #Act
+        periods = min_amortizations(amounts, budgets, rates, frequencies)
+
+        #Assert
+        expected = [min_amortization(*terms) or 0 for terms in zip(amounts, budgets, rates, frequencies)]
+        self.assertEqual(periods.tolist(), expected)
+        self.assertEqual(periods[2], 0)
+
+    def test_invalid_input(self):
+
+        """Tests that the solvers raise the same errors as the Mortgage class"""
+
+        #Act and Assert
+        with self.assertRaises(ValueError) as context:
+            max_principal(0, "FIXED_5", "MONTHLY", 25)
+        self.assertEqual(str(context.exception), "Payment must be positive.")
+
+        with self.assertRaises(ValueError) as context:
+            min_amortization(1000, 100, "FIXED_9", "MONTHLY")
+        self.assertEqual(str(context.exception), "Rate provided is invalid.")
+
+        with self.assertRaises(ValueError) as context:
+            max_principals([100], ["FIXED_5"], ["MONTHLY"], [7])
+        self.assertEqual(str(context.exception), "Amortization provided is invalid.")
+
+        with self.assertRaises(ValueError) as context:
+            min_amortizations([1000], [100, 200], ["FIXED_5"], ["MONTHLY"])
+        self.assertEqual(str(context.exception), "Columns provided must have the same length.")
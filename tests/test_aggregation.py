@@ -0,0 +1,112 @@
+"""
+Description: Tests for the portfolio aggregation.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Use the tests encapsulated within this class to test the aggregation module.
+"""
+import io
+import os
+import tempfile
+from unittest import TestCase
+
+from mortgage.aggregation import PortfolioAggregate, aggregate_file, aggregate_stream
+from mortgage.mortgage import Mortgage
+from mortgage.pixell_lookup import MortgageRate, PaymentFrequency
+
+LINES = ["100000,FIXED_1,10,MONTHLY\n",
+         "300000,FIXED_1,25,WEEKLY\n",
+         "200000,FIXED_5,10,MONTHLY\n",
+         "-5,FIXED_5,10,MONTHLY\n"]
+
+TERMS = [(100000, "FIXED_1", "MONTHLY", 10), (300000, "FIXED_1", "WEEKLY", 25), (200000, "FIXED_5", "MONTHLY", 10)]
+
+class AggregationTests(TestCase):
+
+    """Test cases for the PortfolioAggregate class and the aggregation functions"""
+
+    def test_group_by_rate_matches_mortgages(self):
+
+        """Tests that grouped totals match the same totals worked out from Mortgage objects"""
+
+        #Arrange
+        mortgages = [Mortgage(*terms) for terms in TERMS]
+
+        #Act
+        aggregate = aggregate_stream(io.StringIO("".join(LINES)))
+        rows = aggregate.group_by("rate")
+
+        #Assert
+        fixed_1 = [mortgage for mortgage in mortgages if mortgage.rate is MortgageRate.FIXED_1]
+        self.assertEqual([row["rate"] for row in rows], [MortgageRate.FIXED_5, MortgageRate.FIXED_1])
+        self.assertEqual(rows[1]["count"], 2)
+        self.assertAlmostEqual(rows[1]["principal"], 400000)
+        self.assertAlmostEqual(rows[1]["payments"], sum(mortgage.calculate_payment() for mortgage in fixed_1))
+        self.assertAlmostEqual(rows[1]["annual_cash_flow"],
+                               sum(mortgage.calculate_payment() * mortgage.frequency.value for mortgage in fixed_1))
+        self.assertAlmostEqual(rows[1]["weighted_average_rate"], MortgageRate.FIXED_1.annual_rate)
+        self.assertEqual(aggregate.rejected, 1)
+
+    def test_totals_and_multiple_keys(self):
+
+        """Tests the portfolio total and grouping on frequency and amortization together"""
+
+        #Arrange
+        aggregate = aggregate_stream(io.StringIO("".join(LINES)))
+
+        #Act
+        totals = aggregate.totals()
+        rows = aggregate.group_by("frequency", "amortization")
+
+        #Assert
+        self.assertEqual(totals["count"], 3)
+        self.assertAlmostEqual(totals["weighted_average_rate"],
+                               (400000 * MortgageRate.FIXED_1.annual_rate + 200000 * MortgageRate.FIXED_5.annual_rate)
+                               / 600000)
+        self.assertEqual([(row["frequency"], row["amortization"], row["count"]) for row in rows],
+                         [(PaymentFrequency.MONTHLY, 10, 2), (PaymentFrequency.WEEKLY, 25, 1)])
+
+    def test_merge_partials(self):
+
+        """Tests that merging the aggregates of two halves gives the aggregate of the whole"""
+
+        #Arrange
+        whole = aggregate_stream(io.StringIO("".join(LINES)))
+        first = aggregate_stream(io.StringIO("".join(LINES[:2])))
+        second = aggregate_stream(io.StringIO("".join(LINES[2:])))
+
+        #Act
+        merged = PortfolioAggregate().merge(first).merge(second)
+
+        #Assert
+        self.assertEqual(merged.rejected, whole.rejected)
+        for merged_row, whole_row in zip(merged.group_by(), whole.group_by()):
+            for key, value in whole_row.items():
+                self.assertAlmostEqual(merged_row[key], value)
+
+    def test_parallel_file_matches_serial(self):
+
+        """Tests that totalling a file in shards with worker processes gives the serial totals"""
+
+        with tempfile.TemporaryDirectory() as directory:
+            #Arrange
+            path = os.path.join(directory, "portfolio.txt")
+            with open(path, "w") as input_file:
+                input_file.writelines(LINES * 50)
+
+            #Act
+            serial = aggregate_file(path)
+            parallel = aggregate_file(path, workers=2, shard_bytes=256)
+
+            #Assert
+            self.assertEqual(parallel.count.tolist(), serial.count.tolist())
+            self.assertAlmostEqual(parallel.totals()["payments"], serial.totals()["payments"], places=6)
+            self.assertEqual(parallel.rejected, 50)
+
+    def test_invalid_group_key(self):
+
+        """Tests that an unknown group key is rejected"""
+
+        #Act and Assert
+        with self.assertRaises(ValueError) as context:
+            PortfolioAggregate().group_by("province")
+        self.assertEqual(str(context.exception), "Group key provided is invalid.")
@@ -0,0 +1,168 @@
+"""
+Description: Tests for the vectorized batch payment calculations.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Use the tests encapsulated within this class to test the batch module.
+"""
+from itertools import product
+from unittest import TestCase
+
+import numpy as np
+
+from mortgage.batch import calculate_payments, calculate_payments_from_codes, encode_rates
+from mortgage.mortgage import Mortgage
+from mortgage.pixell_lookup import MortgageRate, PaymentFrequency, VALID_AMORTIZATION
+
+class BatchTests(TestCase):
+
+    """Test cases for the calculate_payments function"""
+
+    def test_matches_scalar_payment_for_every_term(self):
+
+        """Tests that every rate, frequency and amortization combination matches the Mortgage class to the cent"""
+
+        #Arrange
+        terms = list(product(MortgageRate, PaymentFrequency, sorted(VALID_AMORTIZATION)))
+        amounts = [682912.43] * len(terms)
+        rates = [rate.name for rate, _, _ in terms]
+        frequencies = [frequency.name for _, frequency, _ in terms]
+        amortizations = [amortization for _, _, amortization in terms]
+
+        #Act
+        actual_payments = calculate_payments(amounts, rates, frequencies, amortizations)
+
+        #Assert
+        expected_payments = [Mortgage(682912.43, rate.name, frequency.name, amortization).calculate_payment()
+                             for rate, frequency, amortization in terms]
+        np.testing.assert_allclose(actual_payments, expected_payments, rtol=0, atol=0.005)
+
+    def test_accepts_enum_members_and_arrays(self):
+
+        """Tests that enum members and numpy columns are accepted as inputs"""
+
+        #Arrange
+        amounts = np.array([682912.43, 10000.0])
+        rates = [MortgageRate.FIXED_1, MortgageRate.FIXED_5]
+        frequencies = np.array(["MONTHLY", "MONTHLY"])
+        amortizations = np.array([10, 10])
+
+        #Act
+        actual_payments = calculate_payments(amounts, rates, frequencies, amortizations)
+
+        #Assert
+        np.testing.assert_allclose(actual_payments, [7578.30, 106.997], rtol=0, atol=0.005)
+
+    def test_invalid_loan_amount_value(self):
+
+        """Tests that a value error is raised when any loan amount is not positive"""
+
+        #Act
+        with self.assertRaises(ValueError) as context:
+            calculate_payments([1000, 0], ["FIXED_5", "FIXED_5"], ["WEEKLY", "WEEKLY"], [10, 10])
+
+        #Assert
+        self.assertEqual(str(context.exception), "Loan Amount must be positive.")
+
+    def test_non_finite_loan_amount_value(self):
+
+        """Tests that a value error is raised when any loan amount is NaN or infinite, as Mortgage raises"""
+
+        for amount in (float("nan"), float("inf")):
+            #Act
+            with self.assertRaises(ValueError) as context:
+                calculate_payments([1000, amount], ["FIXED_5", "FIXED_5"], ["WEEKLY", "WEEKLY"], [10, 10])
+
+            #Assert
+            self.assertEqual(str(context.exception), "Loan Amount must be positive.")
+
+    def test_invalid_rate_value(self):
+
+        """Tests that a value error is raised when any rate is invalid"""
+
+        #Act
+        with self.assertRaises(ValueError) as context:
+            calculate_payments([1000, 1000], ["FIXED_5", "INVALID_RATE"], ["WEEKLY", "WEEKLY"], [10, 10])
+
+        #Assert
+        self.assertEqual(str(context.exception), "Rate provided is invalid.")
+
+    def test_invalid_frequency_value(self):
+
+        """Tests that a value error is raised when any frequency is invalid"""
+
+        #Act
+        with self.assertRaises(ValueError) as context:
+            calculate_payments([1000], ["FIXED_5"], ["INVALID_FREQUENCY"], [10])
+
+        #Assert
+        self.assertEqual(str(context.exception), "Frequency provided is invalid.")
+
+    def test_invalid_amortization_value(self):
+
+        """Tests that a value error is raised when any amortization is invalid"""
+
+        #Act
+        with self.assertRaises(ValueError) as context:
+            calculate_payments([1000], ["FIXED_5"], ["WEEKLY"], [22])
+
+        #Assert
+        self.assertEqual(str(context.exception), "Amortization provided is invalid.")
+
+    def test_codes_out_of_range(self):
+
+        """Tests that negative and too large rate and frequency codes raise the Mortgage messages instead of wrapping"""
+
+        #Arrange
+        cases = [((-1, 0), "Rate provided is invalid."), ((len(MortgageRate), 0), "Rate provided is invalid."),
+                 ((0, -1), "Frequency provided is invalid."),
+                 ((0, len(PaymentFrequency)), "Frequency provided is invalid.")]
+
+        for (rate_code, frequency_code), message in cases:
+            #Act
+            with self.assertRaises(ValueError) as context:
+                calculate_payments_from_codes([1000, 1000], [0, rate_code], [0, frequency_code], [10, 10])
+
+            #Assert
+            self.assertEqual(str(context.exception), message)
+
+    def test_encode_names_arrays_and_members(self):
+
+        """Tests that columns of names, arrays of names and members encode alike, and that bytes are not names"""
+
+        #Arrange
+        names = ["FIXED_5", "FIXED_1", "FIXED_5"]
+        members = [MortgageRate[name] for name in names]
+
+        #Act
+        codes = [encode_rates(names), encode_rates(np.array(names)), encode_rates(members)]
+
+        #Assert
+        for actual_codes in codes:
+            np.testing.assert_array_equal(actual_codes, [list(MortgageRate).index(rate) for rate in members])
+        for column in (["FIXED_5", b"FIXED_5"], [b"FIXED_5"], ["FIXED_5", 5], ["FIXED_5", ["FIXED_5"]]):
+            with self.assertRaises(ValueError):
+                encode_rates(column)
+
+    def test_mismatched_column_lengths(self):
+
+        """Tests that a value error is raised when the columns have different lengths"""
+
+        #Act
+        with self.assertRaises(ValueError) as context:
+            calculate_payments([1000, 2000], ["FIXED_5"], ["WEEKLY"], [10])
+
+        #Assert
+        self.assertEqual(str(context.exception), "Columns provided must have the same length.")
+
+    def test_matches_scalar_payment_exactly(self):
+
+        """Tests that the batch and scalar paths share the annuity factors and give identical payments"""
+
+        #Arrange
+        mortgage = Mortgage(690334.22, "FIXED_3", "BI_WEEKLY", 20)
+
+        #Act
+        actual_payments = calculate_payments([690334.22], ["FIXED_3"], ["BI_WEEKLY"], [20])
+
+        #Assert
+        self.assertEqual(actual_payments[0], mortgage.calculate_payment())
@@ -0,0 +1,106 @@
+"""
+Description: Tests for the binary portfolio format.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Use the tests encapsulated within this class to test the binary module.
+"""
+import io
+import os
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+
+from mortgage.binary import HEADER_SIZE, RECORD_DTYPE, convert_text, open_portfolio, price_stream
+from mortgage.pipeline import process_stream
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), "..", "data", "pixell_river_mortgages.txt")
+
+class BinaryPortfolioTests(TestCase):
+
+    """Test cases for converting and reading binary portfolio files"""
+
+    def setUp(self):
+
+        """Converts the sample file into a temporary binary file for each test"""
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.binary_path = os.path.join(self.directory.name, "portfolio.bin")
+        self.summary = convert_text(DATA_FILE, self.binary_path, os.path.join(self.directory.name, "rejects.txt"))
+
+    def tearDown(self):
+
+        """Removes the temporary binary file"""
+
+        self.directory.cleanup()
+
+    def test_fixed_width_records(self):
+
+        """Tests that each valid row is stored as one 11 byte record after the header"""
+
+        #Act
+        size = os.path.getsize(self.binary_path)
+
+        #Assert
+        self.assertEqual(RECORD_DTYPE.itemsize, 11)
+        self.assertEqual((self.summary.priced, self.summary.rejected), (16, 6))
+        self.assertEqual(size, HEADER_SIZE + 16 * 11)
+
+    def test_memory_mapped_columns(self):
+
+        """Tests that the columns are memory-mapped views holding the parsed values"""
+
+        #Act
+        portfolio = open_portfolio(self.binary_path)
+
+        #Assert
+        self.assertEqual(len(portfolio), 16)
+        self.assertIsInstance(portfolio.records, np.memmap)
+        self.assertEqual(portfolio.amounts[1], 690334.22)
+        self.assertEqual(portfolio.amortizations[1], 20)
+
+    def test_payments_match_text_pipeline(self):
+
+        """Tests that pricing the binary file gives the same payments as pricing the text file"""
+
+        #Arrange
+        text_output = io.StringIO()
+        with open(DATA_FILE) as input_file:
+            process_stream(input_file, text_output, io.StringIO())
+        binary_output = io.StringIO()
+
+        #Act
+        price_stream(open_portfolio(self.binary_path), binary_output, chunk_size=5)
+
+        #Assert
+        text_payments = [line.rsplit(",", 1)[1] for line in text_output.getvalue().splitlines()]
+        binary_payments = [line.rsplit(",", 1)[1] for line in binary_output.getvalue().splitlines()]
+        self.assertEqual(binary_payments, text_payments)
+
+    def test_not_a_binary_portfolio(self):
+
+        """Tests that a value error is raised when opening a text file"""
+
+        #Act
+        with self.assertRaises(ValueError) as context:
+            open_portfolio(DATA_FILE)
+
+        #Assert
+        self.assertEqual(str(context.exception), "File is not a binary portfolio.")
+
+    def test_empty_portfolio(self):
+
+        """Tests that a binary file with no records opens as an empty portfolio"""
+
+        #Arrange
+        empty_text = os.path.join(self.directory.name, "empty.txt")
+        empty_binary = os.path.join(self.directory.name, "empty.bin")
+        open(empty_text, "w").close()
+        convert_text(empty_text, empty_binary)
+
+        #Act
+        portfolio = open_portfolio(empty_binary)
+
+        #Assert
+        self.assertEqual(len(portfolio), 0)
+        self.assertEqual(len(portfolio.calculate_payments()), 0)
@@ -0,0 +1,112 @@
+"""
+Description: Tests for the optional payment cache.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Use the tests encapsulated within this class to test the cache module.
+"""
+from unittest import TestCase
+
+from mortgage.cache import PaymentCache, disable_payment_cache, enable_payment_cache, payment_cache, quote_payment
+from mortgage.mortgage import Mortgage
+
+class PaymentCacheTests(TestCase):
+
+    """Test cases for the PaymentCache class and its use by quote_payment"""
+
+    def tearDown(self):
+
+        """Disables the shared cache after each test"""
+
+        disable_payment_cache()
+
+    def test_hits_and_misses(self):
+
+        """Tests that repeated requests are served from the cache"""
+
+        #Arrange
+        cache = enable_payment_cache(8)
+
+        #Act
+        first_payment = quote_payment(682912.43, "FIXED_1", "MONTHLY", 10)
+        second_payment = quote_payment(682912.43, "FIXED_1", "MONTHLY", 10)
+
+        #Assert
+        self.assertEqual(first_payment, second_payment)
+        self.assertEqual(first_payment, Mortgage(682912.43, "FIXED_1", "MONTHLY", 10).calculate_payment())
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_invalid_requests_are_not_cached(self):
+
+        """Tests that invalid requests raise the Mortgage errors every time and are not stored"""
+
+        #Arrange
+        cache = enable_payment_cache(8)
+
+        #Act and Assert
+        for _ in range(2):
+            with self.assertRaises(ValueError) as context:
+                quote_payment(1000, "FIXED_7", "MONTHLY", 10)
+            self.assertEqual(str(context.exception), "Rate provided is invalid.")
+
+        with self.assertRaises(ValueError) as context:
+            quote_payment(1000, ["FIXED_5"], "MONTHLY", 10)
+        self.assertEqual(str(context.exception), "Rate provided is invalid.")
+
+        self.assertEqual(cache.stats(), {"hits": 0, "misses": 2, "evictions": 0, "size": 0, "maxsize": 8})
+
+    def test_mortgage_setters_do_not_use_cache(self):
+
+        """Tests that a Mortgage changed through its setters gives the payment for the new terms"""
+
+        #Arrange
+        cache = enable_payment_cache(8)
+        mortgage = Mortgage(10000, "FIXED_5", "MONTHLY", 10)
+        quote_payment(10000, "FIXED_5", "MONTHLY", 10)
+
+        #Act
+        mortgage.loan_amount = 682912.43
+        mortgage.rate = "FIXED_3"
+        mortgage.frequency = "WEEKLY"
+        mortgage.amortization = 30
+        payment = mortgage.calculate_payment()
+
+        #Assert
+        self.assertEqual(payment, quote_payment(682912.43, "FIXED_3", "WEEKLY", 30))
+        self.assertAlmostEqual(payment, 933.11, places=2)
+        self.assertEqual(cache.misses, 2)
+
+    def test_least_recently_used_is_evicted(self):
+
+        """Tests that the least recently used payment is evicted once the cache is full"""
+
+        #Arrange
+        cache = PaymentCache(2)
+
+        #Act
+        for amount in (1000, 2000, 1000, 3000, 1000):
+            cache.payment(amount, "FIXED_5", "MONTHLY", 10)
+        cache.clear()
+
+        #Assert
+        self.assertEqual(cache.stats(), {"hits": 2, "misses": 3, "evictions": 1, "size": 0, "maxsize": 2})
+
+    def test_disabled_by_default(self):
+
+        """Tests that no cache is used until one is enabled"""
+
+        #Act
+        cache = payment_cache()
+
+        #Assert
+        self.assertIsNone(cache)
+
+    def test_invalid_size(self):
+
+        """Tests that a value error is raised when the cache size is not positive"""
+
+        #Act
+        with self.assertRaises(ValueError) as context:
+            PaymentCache(0)
+
+        #Assert
+        self.assertEqual(str(context.exception), "Cache size must be positive.")
@@ -0,0 +1,74 @@
+"""
+Description: Tests for the mortgage command and the lazy package imports.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Use the tests encapsulated within this class to test the cli module.
+"""
+import contextlib
+import io
+import os
+import subprocess
+import sys
+from unittest import TestCase
+
+import mortgage
+from mortgage.cli import main
+from mortgage.mortgage import Mortgage
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+class CliTests(TestCase):
+
+    """Test cases for the mortgage command and package imports"""
+
+    def test_mortgage_import_does_not_load_numpy(self):
+
+        """Tests that importing the package and the Mortgage class loads neither numpy nor the other modules"""
+
+        #Arrange
+        statement = ("import sys; import mortgage; from mortgage.mortgage import Mortgage; "
+                     "print('numpy' in sys.modules, 'mortgage.pipeline' in sys.modules, 'typing' in sys.modules)")
+
+        #Act
+        completed = subprocess.run([sys.executable, "-c", statement], cwd=ROOT,
+                                   capture_output=True, text=True, check=True)
+
+        #Assert
+        self.assertEqual(completed.stdout.split(), ["False", "False", "False"])
+
+    def test_package_exports_load_on_use(self):
+
+        """Tests that a name exported by the package is the object defined in its module"""
+
+        #Act and Assert
+        self.assertIs(mortgage.Mortgage, Mortgage)
+        self.assertIn("calculate_payments", dir(mortgage))
+        with self.assertRaises(AttributeError):
+            mortgage.NotAName
+
+    def test_default_command_prints_sample_report(self):
+
+        """Tests that running the command with no arguments prints the report main.py printed"""
+
+        #Arrange
+        output = io.StringIO()
+
+        #Act
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(io.StringIO()):
+            exit_code = main([])
+
+        #Assert
+        self.assertEqual(exit_code, 0)
+        self.assertTrue(output.getvalue().startswith("*" * 50 + "\nMortgage Amount: $500,000.00\n"))
+
+    def test_dispatches_to_command(self):
+
+        """Tests that a command's arguments are passed to that command and its exit code is returned"""
+
+        #Act
+        with contextlib.redirect_stdout(io.StringIO()) as output, contextlib.redirect_stderr(io.StringIO()):
+            exit_code = main(["verify", os.path.join(ROOT, "data", "pixell_river_mortgages.txt")])
+
+        #Assert
+        self.assertEqual(exit_code, 0)
+        self.assertIn("Result:", output.getvalue())
@@ -0,0 +1,137 @@
+"""
+Description: Tests for the payment frequency comparison.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Use the tests encapsulated within this class to test the comparison module.
+"""
+import contextlib
+import io
+from unittest import TestCase
+
+from mortgage.comparison import PLAN_NAMES, compare_frequencies, compare_loan, compare_portfolio, main
+from mortgage.mortgage import Mortgage
+from mortgage.pixell_lookup import RATES, MortgageRate, PaymentFrequency
+from mortgage.portfolio import MortgagePortfolio
+
+def simulate_plan(loan_amount: float, annual_rate: float, frequency: int, payment: float) -> tuple:
+
+    """Returns the number of payments and total paid when repaying a loan one period at a time"""
+
+    balance, periods, total = loan_amount, 0, 0.0
+    while balance > 1e-7:
+        balance *= 1 + annual_rate / frequency
+        paid = min(payment, balance)
+        balance -= paid
+        total += paid
+        periods += 1
+    return periods, total
+
+class ComparisonTests(TestCase):
+
+    """Test cases for compare_frequencies, compare_portfolio and compare_loan"""
+
+    def test_regular_plans_match_mortgage(self):
+
+        """Tests that the regular plans have the payments of Mortgage objects with those frequencies"""
+
+        #Act
+        comparison = compare_loan(682912.43, "FIXED_1", 10)
+
+        #Assert
+        for frequency in PaymentFrequency:
+            plan = PLAN_NAMES.index(frequency.name)
+            payment = Mortgage(682912.43, "FIXED_1", frequency.name, 10).calculate_payment()
+            self.assertEqual(comparison.payment[0, plan], payment)
+            self.assertEqual(comparison.number_of_payments[0, plan], 10 * frequency.value)
+            self.assertAlmostEqual(comparison.total_paid[0, plan], payment * 10 * frequency.value, places=6)
+            self.assertAlmostEqual(comparison.total_interest[0, plan],
+                                   payment * 10 * frequency.value - 682912.43, places=6)
+
+    def test_accelerated_plans_match_simulation(self):
+
+        """Tests that accelerated plans pay a fraction of the monthly payment and repay the loan early"""
+
+        #Arrange
+        monthly = Mortgage(300000, "FIXED_5", "MONTHLY", 25).calculate_payment()
+
+        #Act
+        comparison = compare_loan(300000, MortgageRate.FIXED_5, 25)
+
+        #Assert
+        for name, frequency, fraction in (("ACCELERATED_BI_WEEKLY", 26, 2), ("ACCELERATED_WEEKLY", 52, 4)):
+            plan = PLAN_NAMES.index(name)
+            periods, total = simulate_plan(300000, MortgageRate.FIXED_5.annual_rate, frequency, monthly / fraction)
+            self.assertAlmostEqual(comparison.payment[0, plan], monthly / fraction)
+            self.assertEqual(comparison.number_of_payments[0, plan], periods)
+            self.assertAlmostEqual(comparison.total_paid[0, plan], total, places=4)
+            self.assertLess(periods, 25 * frequency)
+
+    def test_portfolio_rows_match_single_loans(self):
+
+        """Tests that comparing a portfolio in one pass gives each loan's own comparison"""
+
+        #Arrange
+        terms = [(100000, "FIXED_1", "MONTHLY", 10), (250000.5, "VARIABLE_3", "WEEKLY", 30),
+                 (400000, "FIXED_3", "BI_WEEKLY", 5)]
+        portfolio = MortgagePortfolio()
+        for row in terms:
+            portfolio.append(*row)
+
+        #Act
+        comparison = compare_portfolio(portfolio)
+
+        #Assert
+        self.assertEqual(comparison.payment.shape, (3, len(PLAN_NAMES)))
+        for row, (amount, rate, _, amortization) in enumerate(terms):
+            single = compare_loan(amount, rate, amortization)
+            self.assertEqual(comparison.payment[row].tolist(), single.payment[0].tolist())
+            self.assertEqual(comparison.total_paid[row].tolist(), single.total_paid[0].tolist())
+
+    def test_invalid_terms(self):
+
+        """Tests that invalid loans raise the same errors as the Mortgage class"""
+
+        #Act and Assert
+        with self.assertRaises(ValueError) as context:
+            compare_frequencies([100000, -1], [0, 0], [10, 10])
+        self.assertEqual(str(context.exception), "Loan Amount must be positive.")
+
+        for amount in (float("nan"), float("inf")):
+            with self.assertRaises(ValueError) as context:
+                compare_loan(amount, "FIXED_1", 10)
+            self.assertEqual(str(context.exception), "Loan Amount must be positive.")
+
+        with self.assertRaises(ValueError) as context:
+            compare_loan(100000, "FIXED_7", 10)
+        self.assertEqual(str(context.exception), "Rate provided is invalid.")
+
+        with self.assertRaises(ValueError) as context:
+            compare_frequencies([100000], [RATES.index(MortgageRate.FIXED_1)], [11])
+        self.assertEqual(str(context.exception), "Amortization provided is invalid.")
+
+    def test_invalid_rate_codes(self):
+
+        """Tests that rate codes outside MortgageRate raise instead of wrapping around to another rate"""
+
+        #Act and Assert
+        for rate_code in (-1, len(RATES)):
+            with self.assertRaises(ValueError) as context:
+                compare_frequencies([1000.0], [rate_code], [5])
+            self.assertEqual(str(context.exception), "Rate provided is invalid.")
+
+    def test_command_prints_table(self):
+
+        """Tests that the command prints one line per plan after the header"""
+
+        #Arrange
+        output = io.StringIO()
+
+        #Act
+        with contextlib.redirect_stdout(output):
+            exit_code = main(["682912.43", "FIXED_1", "10"])
+
+        #Assert
+        lines = output.getvalue().splitlines()
+        self.assertEqual(exit_code, 0)
+        self.assertEqual([line.split()[0] for line in lines[1:]], list(PLAN_NAMES))
+        self.assertIn("7,578.30", lines[1])
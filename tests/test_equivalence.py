@@ -0,0 +1,144 @@
+"""
+Description: Equivalence of every payment path with the Mortgage class.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Use the tests encapsulated within this class to check the alternative payment
+paths against Mortgage with the equivalence module.
+"""
+from unittest import TestCase
+
+import numpy as np
+
+from mortgage.batch import calculate_payments, encode_frequencies, encode_rates, factor_array
+from mortgage.comparison import PLAN_NAMES, compare_frequencies
+from mortgage.equivalence import check_lines, check_payments, random_terms
+from mortgage.mortgage import MortgageTerms
+from mortgage.pipeline import price_chunk
+from mortgage.pixell_lookup import MortgageRate, RateTable, current_rate_table, install_rate_table
+from mortgage.portfolio import MortgagePortfolio
+from mortgage.precision import calculate_payment_cents
+
+class EquivalenceTests(TestCase):
+
+    """Test cases comparing the batch, portfolio, precision, snapshot and pipeline paths with Mortgage"""
+
+    def test_batch_payments(self):
+
+        """Tests that vectorized payments match Mortgage payments"""
+
+        #Act and Assert
+        self.assertEqual(check_payments(calculate_payments, examples=2000, seed=1), 2000)
+
+    def test_portfolio_payments(self):
+
+        """Tests that the payments of a columnar portfolio match Mortgage payments"""
+
+        #Arrange
+        def portfolio_payments(*columns):
+            portfolio = MortgagePortfolio()
+            for terms in zip(*columns):
+                portfolio.append(*terms)
+            return portfolio.calculate_payments()
+
+        #Act and Assert
+        check_payments(portfolio_payments, examples=1000, seed=2)
+
+    def test_cent_payments(self):
+
+        """Tests that exact cent payments round Mortgage payments to the cent"""
+
+        #Arrange
+        def cents(amounts, rates, frequencies, amortizations):
+            return calculate_payment_cents(amounts, encode_rates(rates), encode_frequencies(frequencies),
+                                           amortizations) / 100
+
+        #Act and Assert
+        check_payments(cents, examples=2000, seed=3)
+
+    def test_snapshot_and_comparison_payments(self):
+
+        """Tests that MortgageTerms and the regular plans of a frequency comparison match Mortgage payments"""
+
+        #Arrange
+        def snapshots(*columns):
+            return [MortgageTerms(*terms).calculate_payment() for terms in zip(*columns)]
+
+        def compared(amounts, rates, frequencies, amortizations):
+            comparison = compare_frequencies(amounts, encode_rates(rates), amortizations)
+            plans = [PLAN_NAMES.index(frequency) for frequency in frequencies]
+            return comparison.payment[np.arange(len(amounts)), plans]
+
+        #Act and Assert
+        check_payments(snapshots, examples=1000, seed=4)
+        check_payments(compared, examples=1000, seed=5)
+
+    def test_pipeline_lines(self):
+
+        """Tests that the chunked pipeline rejects and prices lines exactly as one Mortgage per line does"""
+
+        #Act and Assert
+        self.assertEqual(check_lines(lambda lines: price_chunk(lines)[1:], rows=5000, seed=6, invalid_ratio=0.3),
+                         5000)
+
+    def test_invalid_terms_are_checked(self):
+
+        """Tests that the random terms include invalid rows and that a path accepting them fails the check"""
+
+        #Arrange
+        terms = random_terms(np.random.default_rng(10), 2000)
+
+        def skips_amount_check(amounts, rates, frequencies, amortizations):
+            return np.asarray(amounts) * factor_array()[encode_rates(rates), encode_frequencies(frequencies),
+                                                        np.asarray(amortizations, dtype=np.intp)]
+
+        #Act
+        with self.assertRaises(AssertionError) as context:
+            check_payments(skips_amount_check, examples=2000, seed=10)
+
+        #Assert
+        amounts = np.array(terms[0])
+        self.assertTrue(np.isnan(amounts).any() and np.isinf(amounts).any())
+        self.assertTrue(any(not isinstance(rate, str) for rate in terms[1]))
+        self.assertTrue(any(isinstance(amortization, float) for amortization in terms[3]))
+        self.assertIn("Mortgage raises 'Loan Amount must be positive.'", str(context.exception))
+
+    def test_wrong_factor_table_is_caught(self):
+
+        """Tests that payments read from a wrong factor table fail the check, as the reference does not use the table"""
+
+        #Arrange
+        table = current_rate_table()
+        rates = dict(table.rates)
+        rates[MortgageRate.FIXED_5] += 0.0001
+        install_rate_table(RateTable(rates, version=table.version + 1, source="test"))
+
+        #Act
+        try:
+            with self.assertRaises(AssertionError) as context:
+                check_payments(calculate_payments, examples=500, seed=12)
+        finally:
+            install_rate_table(table)
+
+        #Assert
+        self.assertIn("FIXED_5", str(context.exception))
+
+    def test_differences_are_reported(self):
+
+        """Tests that a path off by more than a cent, or rejecting differently, fails with the seed"""
+
+        #Arrange
+        def off_by_two_cents(*columns):
+            return calculate_payments(*columns) + 0.02
+
+        def accepts_everything(lines):
+            _, payments, _ = price_chunk(lines)
+            return payments, []
+
+        #Act and Assert
+        with self.assertRaises(AssertionError) as context:
+            check_payments(off_by_two_cents, examples=10, seed=8)
+        self.assertIn("seed 8", str(context.exception))
+
+        with self.assertRaises(AssertionError) as context:
+            check_lines(accepts_everything, rows=100, seed=9, invalid_ratio=0.5)
+        self.assertIn("Mortgage rejects", str(context.exception))
@@ -0,0 +1,104 @@
+"""
+Description: Tests for incremental re-pricing.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Use the tests encapsulated within this class to test the incremental module.
+"""
+import os
+import tempfile
+from unittest import TestCase
+
+from mortgage.incremental import load_index, process_file_incremental
+from mortgage.pipeline import process_file
+from mortgage.pixell_lookup import MortgageRate, RateTable, current_rate_table, install_rate_table
+from mortgage.rates import reset_rates
+
+LINES = ["682912.43,FIXED_1,10,MONTHLY,7578.30\n",
+         "500000,FIXED_5,25,WEEKLY\n",
+         "-1,FIXED_1,10,MONTHLY\n",
+         "250000,VARIABLE_3,20,BI_WEEKLY\n"]
+
+class IncrementalTests(TestCase):
+
+    """Test cases for process_file_incremental and the payment index"""
+
+    def setUp(self):
+
+        """Creates a directory for the portfolio, output and index files"""
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.input_path = os.path.join(self.directory.name, "portfolio.txt")
+
+    def tearDown(self):
+
+        """Removes the files and puts back the built-in rates"""
+
+        self.directory.cleanup()
+        reset_rates()
+
+    def run_incremental(self, lines):
+
+        """Writes the lines as the portfolio and prices it incrementally, returns the summary and output text"""
+
+        with open(self.input_path, "w") as input_file:
+            input_file.writelines(lines)
+
+        output_path = os.path.join(self.directory.name, "priced.csv")
+        reject_path = os.path.join(self.directory.name, "rejects.txt")
+        summary = process_file_incremental(self.input_path, output_path, reject_path)
+
+        with open(output_path) as output_file, open(reject_path) as reject_file:
+            return summary, output_file.read(), reject_file.read()
+
+    def test_matches_pipeline_output(self):
+
+        """Tests that the incremental output and rejects are the same as the pipeline's"""
+
+        #Arrange
+        self.run_incremental(LINES)
+        expected_output = os.path.join(self.directory.name, "expected.csv")
+        expected_rejects = os.path.join(self.directory.name, "expected.txt")
+        process_file(self.input_path, expected_output, expected_rejects)
+
+        #Act
+        summary, output, rejects = self.run_incremental(LINES)
+
+        #Assert
+        with open(expected_output) as output_file, open(expected_rejects) as reject_file:
+            self.assertEqual(output, output_file.read())
+            self.assertEqual(rejects, reject_file.read())
+        self.assertEqual((summary.priced, summary.rejected), (3, 1))
+
+    def test_reprices_only_changed_rows(self):
+
+        """Tests that a second run prices only the new, changed and rejected rows"""
+
+        #Arrange
+        first, _, _ = self.run_incremental(LINES)
+        changed = LINES[:3] + ["250001,VARIABLE_3,20,BI_WEEKLY\n", "100000,FIXED_3,5,MONTHLY\n"]
+
+        #Act
+        second, output, _ = self.run_incremental(changed)
+
+        #Assert
+        self.assertEqual(first.computed, 4)
+        self.assertEqual((second.computed, second.reused), (3, 2))
+        self.assertEqual(len(output.splitlines()), 4)
+        self.assertEqual(len(load_index(f"{self.input_path}.index")), 4)
+
+    def test_rate_change_clears_index(self):
+
+        """Tests that the index is not used once the rates in effect change"""
+
+        #Arrange
+        self.run_incremental(LINES)
+        rates = dict(current_rate_table().rates)
+        rates[MortgageRate.FIXED_1] = 0.05
+        install_rate_table(RateTable(rates, version=1, source="test"))
+
+        #Act
+        summary, output, _ = self.run_incremental(LINES)
+
+        #Assert
+        self.assertEqual(summary.reused, 0)
+        self.assertNotIn("7578.30", output)
@@ -0,0 +1,167 @@
+"""
+Description: Tests for the opt-in instrumentation and profiling hooks.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Use the tests encapsulated within this class to test the instrumentation module.
+"""
+import io
+import os
+import pstats
+import subprocess
+import sys
+import tempfile
+from unittest import TestCase
+
+from mortgage import instrumentation, pipeline
+from mortgage.mortgage import Mortgage
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+class InstrumentationTests(TestCase):
+
+    """Test cases for the instrumentation module"""
+
+    def tearDown(self):
+
+        """Removes the instrumentation and its measurements after each test"""
+
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def test_disable_restores_targets(self):
+
+        """Tests that disabling puts back the exact functions that were wrapped"""
+
+        #Arrange
+        originals = [getattr(owner, attribute) for owner, attribute, _ in instrumentation.TARGETS]
+
+        #Act
+        instrumentation.enable()
+        wrapped = [getattr(owner, attribute) for owner, attribute, _ in instrumentation.TARGETS]
+        instrumentation.disable()
+
+        #Assert
+        self.assertFalse(instrumentation.enabled())
+        self.assertTrue(all(before is not during for before, during in zip(originals, wrapped)))
+        self.assertEqual([getattr(owner, attribute) for owner, attribute, _ in instrumentation.TARGETS], originals)
+
+    def test_records_mortgage_calls_and_errors(self):
+
+        """Tests that calls and failed calls of the Mortgage methods are counted"""
+
+        #Arrange
+        instrumentation.enable()
+
+        #Act
+        mortgage = Mortgage(682912.43, "FIXED_1", "MONTHLY", 10)
+        payment = mortgage.calculate_payment()
+        with self.assertRaises(ValueError):
+            Mortgage(-1, "FIXED_1", "MONTHLY", 10)
+        metrics = instrumentation.snapshot()
+
+        #Assert
+        self.assertAlmostEqual(payment, 7578.30, places=2)
+        self.assertEqual(metrics["mortgage_init"]["count"], 2)
+        self.assertEqual(metrics["mortgage_init"]["errors"], 1)
+        self.assertEqual(metrics["mortgage_calculate_payment"]["count"], 1)
+        self.assertEqual(sum(metrics["mortgage_init"]["buckets"].values()), 2)
+
+    def test_records_pipeline_stages(self):
+
+        """Tests that each stage of the pipeline is timed once per chunk"""
+
+        #Arrange
+        input_file = io.StringIO("682912.43,FIXED_1,10,MONTHLY\n500000,FIXED_5,25,WEEKLY\n"
+                                 "-1,FIXED_1,10,MONTHLY\n250000,VARIABLE_3,20,BI_WEEKLY\n")
+        instrumentation.enable()
+
+        #Act
+        summary = pipeline.process_stream(input_file, io.StringIO(), io.StringIO(), chunk_size=2)
+        metrics = instrumentation.snapshot()
+
+        #Assert
+        self.assertEqual((summary.priced, summary.rejected), (3, 1))
+        self.assertEqual(metrics["mortgage_pipeline_parse"]["count"], 2)
+        self.assertEqual(metrics["mortgage_pipeline_price"]["count"], 2)
+        self.assertEqual(metrics["mortgage_pipeline_render"]["count"], 2)
+
+    def test_prometheus_text(self):
+
+        """Tests that the export holds cumulative buckets, the count and the errors of each metric"""
+
+        #Arrange
+        instrumentation.enable()
+        Mortgage(682912.43, "FIXED_1", "MONTHLY", 10).calculate_payment()
+
+        #Act
+        text = instrumentation.prometheus_text()
+
+        #Assert
+        self.assertIn("# TYPE mortgage_init_seconds histogram", text)
+        self.assertIn('mortgage_init_seconds_bucket{le="+Inf"} 1', text)
+        self.assertIn("mortgage_calculate_payment_seconds_count 1", text)
+        self.assertIn("mortgage_init_errors_total 0", text)
+        self.assertNotIn("mortgage_mortgage_", text)
+
+    def test_profile_call_writes_stats(self):
+
+        """Tests that a profiled call returns its result and saves stats pstats can read"""
+
+        #Arrange
+        mortgage = Mortgage(682912.43, "FIXED_1", "MONTHLY", 10)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "payment.prof")
+
+            #Act
+            payment = instrumentation.profile_call(path, mortgage.calculate_payment)
+            stats = pstats.Stats(path)
+
+            #Assert
+            self.assertAlmostEqual(payment, 7578.30, places=2)
+            self.assertGreater(stats.total_calls, 0)
+
+    def test_cli_writes_metrics_file(self):
+
+        """Tests that the --metrics option of the pipeline command saves the metrics and removes the hooks"""
+
+        with tempfile.TemporaryDirectory() as directory:
+            #Arrange
+            input_path = os.path.join(directory, "input.txt")
+            metrics_path = os.path.join(directory, "metrics.prom")
+            with open(input_path, "w") as input_file:
+                input_file.write("682912.43,FIXED_1,10,MONTHLY\n")
+
+            #Act
+            exit_code = pipeline.main([input_path, "-o", os.path.join(directory, "out.txt"),
+                                       "--metrics", metrics_path])
+            with open(metrics_path) as metrics_file:
+                text = metrics_file.read()
+
+            #Assert
+            self.assertEqual(exit_code, 0)
+            self.assertIn("mortgage_pipeline_parse_seconds_count 1", text)
+            self.assertFalse(instrumentation.enabled())
+
+    def test_module_entry_point_writes_metrics(self):
+
+        """Tests that python -m mortgage.pipeline --metrics records the stages it ran instead of zeros"""
+
+        with tempfile.TemporaryDirectory() as directory:
+            #Arrange
+            input_path = os.path.join(directory, "input.txt")
+            metrics_path = os.path.join(directory, "metrics.prom")
+            with open(input_path, "w") as input_file:
+                input_file.write("682912.43,FIXED_1,10,MONTHLY\n-1,FIXED_1,10,MONTHLY\n")
+
+            #Act
+            subprocess.run([sys.executable, "-m", "mortgage.pipeline", input_path, "-o",
+                            os.path.join(directory, "out.txt"), "--rejects", os.path.join(directory, "rejects.txt"),
+                            "--metrics", metrics_path], cwd=ROOT, capture_output=True, check=True)
+            with open(metrics_path) as metrics_file:
+                text = metrics_file.read()
+
+            #Assert
+            self.assertIn("mortgage_pipeline_parse_seconds_count 1", text)
+            self.assertIn("mortgage_pipeline_price_seconds_count 1", text)
+            self.assertIn("mortgage_pipeline_render_seconds_count 1", text)
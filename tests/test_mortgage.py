@@ -129,6 +129,22 @@ class MortgageTests(TestCase):
         #Assert
         self.assertEqual(str(context.exception), "Loan Amount must be positive.") 
 
+    def test_loan_amount_not_finite(self):
+
+        """Tests that a value error is raised when the loan amount is changed into NaN or infinity"""
+
+        #Arrange
+        mortgage = Mortgage(1000, "FIXED_5", "WEEKLY", 5) #all valid inputs
+
+        for value in (float("nan"), float("inf")):
+            #Act
+            with self.assertRaises(ValueError) as context:
+                mortgage.loan_amount = value
+
+            #Assert
+            self.assertEqual(str(context.exception), "Loan Amount must be positive.")
+        self.assertEqual(mortgage.loan_amount, 1000)
+
     def test_loan_amount_positive(self):
 
         """Tests when the loan amount is changed into another positive value"""
@@ -398,3 +414,49 @@ class MortgageTests(TestCase):
         expected_result = "Mortgage(682912.43, 0.0599, 12, 30)"
         self.assertEqual(actual_result, expected_result)
 
+
+    #AMORTIZATION SCHEDULE TESTS
+
+    def test_amortization_schedule_period_count(self):
+
+        """Tests that the schedule has one period for each payment and ends with a zero balance"""
+
+        #Arrange
+        mortgage = Mortgage(682912.43, "FIXED_3", "WEEKLY", 30)
+
+        #Act
+        schedule = list(mortgage.amortization_schedule())
+
+        #Assert
+        self.assertEqual(len(schedule), 30 * 52)
+        self.assertEqual(schedule[-1].period, 1560)
+        self.assertAlmostEqual(schedule[-1].balance, 0, places=6)
+
+    def test_amortization_schedule_first_period(self):
+
+        """Tests the interest and principal of the first period of the schedule"""
+
+        #Arrange
+        mortgage = Mortgage(10000, "FIXED_5", "MONTHLY", 10)
+
+        #Act
+        first_period = next(mortgage.amortization_schedule())
+
+        #Assert
+        self.assertAlmostEqual(first_period.payment, 106.997, places=2)
+        self.assertAlmostEqual(first_period.interest, 43.25, places=6)
+        self.assertAlmostEqual(first_period.principal, first_period.payment - 43.25, places=6)
+        self.assertAlmostEqual(first_period.balance, 10000 - first_period.principal, places=6)
+
+    def test_amortization_schedule_principal_repays_loan(self):
+
+        """Tests that the principal paid over the schedule adds up to the loan amount"""
+
+        #Arrange
+        mortgage = Mortgage(682912.43, "VARIABLE_1", "BI_WEEKLY", 25)
+
+        #Act
+        total_principal = sum(period.principal for period in mortgage.amortization_schedule())
+
+        #Assert
+        self.assertAlmostEqual(total_principal, 682912.43, places=4)
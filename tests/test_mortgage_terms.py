@@ -0,0 +1,156 @@
+"""
+Description: Tests for the immutable MortgageTerms snapshots.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Use the tests encapsulated within this class to test the MortgageTerms class.
+"""
+import gc
+import pickle
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from mortgage.mortgage import Mortgage, MortgageTerms
+from mortgage.pixell_lookup import MortgageRate, PaymentFrequency
+
+class MortgageTermsTests(TestCase):
+
+    """Test cases for MortgageTerms, Mortgage.snapshot and Mortgage.from_terms"""
+
+    def test_equal_terms_are_interned(self):
+
+        """Tests that equal terms give the same instance, whether given as names or members"""
+
+        #Act
+        first = MortgageTerms(682912.43, "FIXED_1", "MONTHLY", 10)
+        second = MortgageTerms(682912.43, MortgageRate.FIXED_1, PaymentFrequency.MONTHLY, 10)
+
+        #Assert
+        self.assertIs(first, second)
+        self.assertEqual(first.rate, MortgageRate.FIXED_1)
+        self.assertEqual(first.frequency, PaymentFrequency.MONTHLY)
+        self.assertIsNot(first, MortgageTerms(682912.43, "FIXED_1", "MONTHLY", 15))
+
+    def test_terms_can_not_be_changed(self):
+
+        """Tests that setting or deleting a field raises an AttributeError"""
+
+        #Arrange
+        terms = MortgageTerms(100000, "FIXED_5", "WEEKLY", 25)
+
+        #Act and Assert
+        with self.assertRaises(AttributeError):
+            terms.loan_amount = 200000
+        with self.assertRaises(AttributeError):
+            del terms.rate
+        with self.assertRaises(AttributeError):
+            terms.owner = "client"
+        self.assertEqual(terms.loan_amount, 100000)
+
+    def test_terms_as_dict_keys(self):
+
+        """Tests that terms hash and compare by value, so they can key a dict"""
+
+        #Arrange
+        payments = {MortgageTerms(100000, "FIXED_5", "WEEKLY", 25): 1.0}
+
+        #Act
+        found = payments.get(Mortgage(100000, "FIXED_5", "WEEKLY", 25).snapshot())
+
+        #Assert
+        self.assertEqual(found, 1.0)
+        self.assertNotEqual(MortgageTerms(100000, "FIXED_5", "WEEKLY", 25), (100000, "FIXED_5", "WEEKLY", 25))
+
+    def test_validation_matches_mortgage(self):
+
+        """Tests that invalid terms raise the same errors as the Mortgage class"""
+
+        #Arrange
+        cases = [((-5, "FIXED_5", "WEEKLY", 10), "Loan Amount must be positive."),
+                 ((1000, "FIXED_7", "WEEKLY", 10), "Rate provided is invalid."),
+                 ((1000, "FIXED_5", "DAILY", 10), "Frequency provided is invalid."),
+                 ((1000, "FIXED_5", "WEEKLY", 11), "Amortization provided is invalid.")]
+
+        for terms, message in cases:
+            #Act
+            with self.assertRaises(ValueError) as context:
+                MortgageTerms(*terms)
+
+            #Assert
+            self.assertEqual(str(context.exception), message)
+
+    def test_snapshot_and_from_terms(self):
+
+        """Tests that a snapshot keeps the terms of the time it was taken and converts back to a Mortgage"""
+
+        #Arrange
+        mortgage = Mortgage(682912.43, "FIXED_1", "MONTHLY", 10)
+
+        #Act
+        terms = mortgage.snapshot()
+        mortgage.loan_amount = 100000
+        copy = Mortgage.from_terms(terms)
+
+        #Assert
+        self.assertEqual(terms.loan_amount, 682912.43)
+        self.assertEqual(terms.calculate_payment(), copy.calculate_payment())
+        self.assertEqual((copy.loan_amount, copy.rate, copy.frequency, copy.amortization),
+                         (682912.43, MortgageRate.FIXED_1, PaymentFrequency.MONTHLY, 10))
+        self.assertIs(copy.snapshot(), terms)
+
+    def test_pickle_round_trip(self):
+
+        """Tests that unpickled terms are the interned instance"""
+
+        #Arrange
+        terms = MortgageTerms(250000, "VARIABLE_3", "BI_WEEKLY", 20)
+
+        #Act
+        loaded = pickle.loads(pickle.dumps(terms))
+
+        #Assert
+        self.assertIs(loaded, terms)
+
+    def test_shared_between_threads(self):
+
+        """Tests that threads snapshotting equal mortgages share one instance and read the same payment"""
+
+        #Arrange
+        terms = MortgageTerms(500000, "FIXED_3", "MONTHLY", 25)
+
+        def read(_):
+            snapshot = Mortgage(500000, "FIXED_3", "MONTHLY", 25).snapshot()
+            return snapshot, snapshot.calculate_payment()
+
+        #Act
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(read, range(200)))
+
+        #Assert
+        self.assertTrue(all(snapshot is terms for snapshot, _ in results))
+        self.assertEqual({payment for _, payment in results}, {terms.calculate_payment()})
+
+    def test_interning_while_garbage_is_collected(self):
+
+        """Tests that creating terms does not deadlock when the collector frees other terms in the middle of it"""
+
+        #Arrange
+        def create_cycles():
+            for amount in range(1, 2001):
+                #terms held only by a reference cycle are freed by the collector, not when the list is dropped
+                cycle = [MortgageTerms(amount, "FIXED_5", "MONTHLY", 25)]
+                cycle.append(cycle)
+
+        thresholds = gc.get_threshold()
+        thread = threading.Thread(target=create_cycles, daemon=True)
+
+        #Act
+        gc.set_threshold(4)
+        try:
+            thread.start()
+            thread.join(timeout=30)
+        finally:
+            gc.set_threshold(*thresholds)
+
+        #Assert
+        self.assertFalse(thread.is_alive())
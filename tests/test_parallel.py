@@ -0,0 +1,77 @@
+"""
+Description: Tests for the multi-process portfolio pricing.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Use the tests encapsulated within this class to test the parallel module.
+"""
+import io
+import os
+from unittest import TestCase
+
+from mortgage.parallel import process_file_parallel, shard_ranges
+from mortgage.pipeline import process_stream
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), "..", "data", "pixell_river_mortgages.txt")
+
+class ParallelTests(TestCase):
+
+    """Test cases for pricing portfolio files with a process pool"""
+
+    def test_shard_ranges_cover_file_on_line_boundaries(self):
+
+        """Tests that the shards cover the whole file and each one starts on a new line"""
+
+        #Arrange
+        with open(DATA_FILE, "rb") as input_file:
+            content = input_file.read()
+
+        #Act
+        ranges = shard_ranges(DATA_FILE, 100)
+
+        #Assert
+        self.assertEqual(ranges[0][0], 0)
+        self.assertEqual(ranges[-1][1], len(content))
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(end, start)
+            self.assertEqual(content[start - 1:start], b"\n")
+
+    def test_shard_ranges_invalid_size(self):
+
+        """Tests that a value error is raised when the shard size is not positive"""
+
+        #Act
+        with self.assertRaises(ValueError) as context:
+            shard_ranges(DATA_FILE, 0)
+
+        #Assert
+        self.assertEqual(str(context.exception), "Shard size must be positive.")
+
+    def test_parallel_matches_serial_order(self):
+
+        """Tests that the process pool writes the same results and rejects in the same order as the serial pipeline"""
+
+        #Arrange
+        serial_output, serial_rejects = io.StringIO(), io.StringIO()
+        with open(DATA_FILE) as input_file:
+            serial_summary = process_stream(input_file, serial_output, serial_rejects)
+        parallel_output, parallel_rejects = io.StringIO(), io.StringIO()
+
+        #Act
+        parallel_summary = process_file_parallel(DATA_FILE, parallel_output, parallel_rejects, 
+                                                 workers=2, shard_bytes=64)
+
+        #Assert
+        self.assertEqual(parallel_output.getvalue(), serial_output.getvalue())
+        self.assertEqual(parallel_rejects.getvalue(), serial_rejects.getvalue())
+        self.assertEqual(repr(parallel_summary), repr(serial_summary))
+
+    def test_invalid_worker_count(self):
+
+        """Tests that a value error is raised when the number of workers is negative"""
+
+        #Act
+        with self.assertRaises(ValueError) as context:
+            process_file_parallel(DATA_FILE, io.StringIO(), io.StringIO(), workers=-1)
+
+        #Assert
+        self.assertEqual(str(context.exception), "Number of workers must be positive.")
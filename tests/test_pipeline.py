@@ -0,0 +1,152 @@
+"""
+Description: Tests for the streaming portfolio pipeline.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Use the tests encapsulated within this class to test the pipeline module.
+"""
+import io
+import os
+import tempfile
+from unittest import TestCase
+
+from mortgage.pipeline import format_rejects, parse_chunk, process_file, process_stream, read_chunks
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), "..", "data", "pixell_river_mortgages.txt")
+
+class PipelineTests(TestCase):
+
+    """Test cases for the streaming portfolio pipeline"""
+
+    def test_read_chunks_bounded_size(self):
+
+        """Tests that lines are read in chunks no larger than the chunk size"""
+
+        #Arrange
+        input_file = io.StringIO("".join(f"{number}\n" for number in range(10)))
+
+        #Act
+        chunks = list(read_chunks(input_file, 4))
+
+        #Assert
+        self.assertEqual([len(chunk) for chunk in chunks], [4, 4, 2])
+
+    def test_read_chunks_invalid_size(self):
+
+        """Tests that a value error is raised when the chunk size is not positive"""
+
+        #Act
+        with self.assertRaises(ValueError) as context:
+            next(read_chunks(io.StringIO(""), 0))
+
+        #Assert
+        self.assertEqual(str(context.exception), "Chunk size must be positive.")
+
+    def test_parse_chunk_rejects_with_mortgage_messages(self):
+
+        """Tests that malformed rows are rejected with the same messages as the Mortgage class"""
+
+        #Arrange
+        lines = ["500000,FIXED_1,10,MONTHLY,5548.51\n",
+                 "0,FIXED_1,10,MONTHLY,EXCEPTION\n",
+                 "1000,FIXED_33,30,BI_WEEKLY\n",
+                 "1000,FIXED_1,30,BI_MONTHLY\n",
+                 "1000,FIXED_1,22,WEEKLY\n",
+                 "1000,FIXED_1\n"]
+
+        #Act
+        (rows, amounts, _, _, _), rejects = parse_chunk(lines)
+
+        #Assert
+        self.assertEqual(rows, [["500000", "FIXED_1", "10", "MONTHLY", "5548.51"]])
+        self.assertEqual(amounts, [500000.0])
+        self.assertEqual([message for _, message in rejects], [
+            "Loan Amount must be positive.",
+            "Rate provided is invalid.",
+            "Frequency provided is invalid.",
+            "Amortization provided is invalid.",
+            "list index out of range"])
+
+    def test_parse_chunk_rejects_non_finite_amounts(self):
+
+        """Tests that NaN and infinite amounts are rejected row by row instead of failing the chunk"""
+
+        #Arrange
+        lines = ["nan,FIXED_1,10,MONTHLY,EXCEPTION\n",
+                 "500000,FIXED_1,10,MONTHLY,5548.51\n",
+                 "inf,FIXED_5,25,WEEKLY,EXCEPTION\n",
+                 "1e400,FIXED_5,25,WEEKLY,EXCEPTION\n"]
+
+        #Act
+        (rows, _, _, _, _), rejects = parse_chunk(lines)
+
+        #Assert
+        self.assertEqual(rows, [["500000", "FIXED_1", "10", "MONTHLY", "5548.51"]])
+        self.assertEqual(format_rejects(rejects).splitlines(), [
+            "Data: nan,FIXED_1,10,MONTHLY,EXCEPTION caused Exception: Loan Amount must be positive.",
+            "Data: inf,FIXED_5,25,WEEKLY,EXCEPTION caused Exception: Loan Amount must be positive.",
+            "Data: 1e400,FIXED_5,25,WEEKLY,EXCEPTION caused Exception: Loan Amount must be positive."])
+
+    def test_process_stream_matches_expected_payments(self):
+
+        """Tests that every priced row of the sample file matches its expected payment"""
+
+        #Arrange
+        output_file, reject_file = io.StringIO(), io.StringIO()
+
+        #Act
+        with open(DATA_FILE) as input_file:
+            summary = process_stream(input_file, output_file, reject_file, chunk_size=3)
+
+        #Assert
+        with open(DATA_FILE) as input_file:
+            expected = [line.strip() for line in input_file if "EXCEPTION" not in line]
+        self.assertEqual(output_file.getvalue().splitlines(), expected)
+        self.assertEqual((summary.rows, summary.priced, summary.rejected), (22, 16, 6))
+        self.assertEqual(len(reject_file.getvalue().splitlines()), 6)
+
+    def test_process_file_writes_output_and_rejects(self):
+
+        """Tests that priced and rejected rows are written to separate files"""
+
+        #Arrange
+        with tempfile.TemporaryDirectory() as directory:
+            output_path = os.path.join(directory, "priced.csv")
+            reject_path = os.path.join(directory, "rejects.txt")
+
+            #Act
+            process_file(DATA_FILE, output_path, reject_path)
+
+            #Assert
+            with open(output_path) as output_file, open(reject_path) as reject_file:
+                self.assertEqual(len(output_file.readlines()), 16)
+                self.assertTrue(all("caused Exception" in line for line in reject_file))
+
+    def test_process_file_with_workers_rejects_non_finite_amounts(self):
+
+        """Tests that a process pool prices the rest of a file holding NaN and infinite amounts"""
+
+        #Arrange
+        with tempfile.TemporaryDirectory() as directory:
+            input_path = os.path.join(directory, "portfolio.txt")
+            output_path = os.path.join(directory, "priced.csv")
+            reject_path = os.path.join(directory, "rejects.txt")
+            with open(input_path, "w") as input_file:
+                input_file.write("500000,FIXED_1,10,MONTHLY,5548.51\nnan,FIXED_1,10,MONTHLY,EXCEPTION\n" * 50
+                                 + "inf,FIXED_5,25,WEEKLY,EXCEPTION\n")
+
+            #Act
+            summary = process_file(input_path, output_path, reject_path, workers=2, shard_bytes=256)
+
+            #Assert
+            self.assertEqual((summary.rows, summary.priced, summary.rejected), (101, 50, 51))
+            with open(reject_path) as reject_file:
+                self.assertTrue(all(line.endswith("caused Exception: Loan Amount must be positive.\n")
+                                    for line in reject_file))
+
+    def test_process_file_missing_input(self):
+
+        """Tests that a missing input file raises FileNotFoundError"""
+
+        #Act & Assert
+        with self.assertRaises(FileNotFoundError):
+            process_file("missing_portfolio.txt")
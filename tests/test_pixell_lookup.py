@@ -0,0 +1,63 @@
+"""
+Description: Tests for the annuity factor lookup table.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Use the tests encapsulated within this class to test the pixell_lookup module.
+"""
+from unittest import TestCase
+
+from mortgage.pixell_lookup import (MortgageRate, PaymentFrequency, annuity_factor, 
+                                    annuity_factors, invalidate_annuity_factors)
+
+class AnnuityFactorTests(TestCase):
+
+    """Test cases for the annuity factor table"""
+
+    def test_table_covers_every_term(self):
+
+        """Tests that the table holds one factor for each rate, frequency and amortization combination"""
+
+        #Act
+        factors = annuity_factors()
+
+        #Assert
+        self.assertEqual(len(factors), 108)
+
+    def test_factor_matches_assignment_formula(self):
+
+        """Tests that a factor is identical to the payment formula from the assignment instructions"""
+
+        #Arrange
+        interest_rate = MortgageRate.FIXED_1.value / PaymentFrequency.MONTHLY.value
+        number_of_payments = 10 * PaymentFrequency.MONTHLY.value
+
+        #Act
+        actual_factor = annuity_factor(MortgageRate.FIXED_1, PaymentFrequency.MONTHLY, 10)
+
+        #Assert
+        expected_factor = ((interest_rate * (1 + interest_rate) ** number_of_payments) 
+                           / ((1 + interest_rate) ** number_of_payments - 1))
+        self.assertEqual(actual_factor, expected_factor)
+
+    def test_invalidate_rebuilds_table(self):
+
+        """Tests that the table is rebuilt from the same rates after being invalidated"""
+
+        #Arrange
+        original_table = annuity_factors()
+
+        #Act
+        invalidate_annuity_factors()
+        rebuilt_table = annuity_factors()
+
+        #Assert
+        self.assertIsNot(rebuilt_table, original_table)
+        self.assertEqual(rebuilt_table, original_table)
+
+    def test_invalid_amortization_is_not_in_table(self):
+
+        """Tests that a lookup for an invalid amortization period raises a KeyError"""
+
+        #Act & Assert
+        with self.assertRaises(KeyError):
+            annuity_factor(MortgageRate.FIXED_1, PaymentFrequency.MONTHLY, 22)
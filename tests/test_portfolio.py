@@ -0,0 +1,135 @@
+"""
+Description: Tests for the compact mortgage representations.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Use the tests encapsulated within this class to test the portfolio module.
+"""
+from unittest import TestCase
+
+from mortgage.mortgage import Mortgage
+from mortgage.pixell_lookup import MortgageRate, PaymentFrequency
+from mortgage.portfolio import MortgagePortfolio, SlottedMortgage
+
+class SlottedMortgageTests(TestCase):
+
+    """Test cases for the SlottedMortgage class"""
+
+    def test_has_no_instance_dict(self):
+
+        """Tests that a SlottedMortgage does not carry a per-instance __dict__"""
+
+        #Act
+        mortgage = SlottedMortgage(1000, "FIXED_5", "WEEKLY", 5)
+
+        #Assert
+        self.assertFalse(hasattr(mortgage, "__dict__"))
+
+    def test_same_validation_as_mortgage(self):
+
+        """Tests that a value error with the Mortgage message is raised for an invalid rate"""
+
+        #Act
+        with self.assertRaises(ValueError) as context:
+            SlottedMortgage(1000, "INVALID_RATE", "WEEKLY", 5)
+
+        #Assert
+        self.assertEqual(str(context.exception), "Rate provided is invalid.")
+
+    def test_setters_and_payment_match_mortgage(self):
+
+        """Tests that changing attributes through the setters gives the same payment and string as Mortgage"""
+
+        #Arrange
+        mortgage = Mortgage(1000, "FIXED_5", "WEEKLY", 5)
+        slotted = SlottedMortgage(1000, "FIXED_5", "WEEKLY", 5)
+
+        #Act
+        for record in (mortgage, slotted):
+            record.loan_amount = 682912.43
+            record.rate = "FIXED_3"
+            record.frequency = "MONTHLY"
+            record.amortization = 30
+
+        #Assert
+        self.assertEqual(slotted.calculate_payment(), mortgage.calculate_payment())
+        self.assertEqual(str(slotted), str(mortgage))
+        self.assertEqual(repr(slotted), "SlottedMortgage(682912.43, 0.0589, 12, 30)")
+
+class MortgagePortfolioTests(TestCase):
+
+    """Test cases for the MortgagePortfolio class"""
+
+    def test_append_and_view(self):
+
+        """Tests that a stored record is read back through a view with the Mortgage properties"""
+
+        #Arrange
+        portfolio = MortgagePortfolio()
+
+        #Act
+        portfolio.append(682912.43, "FIXED_3", "BI_WEEKLY", 30)
+        view = portfolio[0]
+
+        #Assert
+        self.assertEqual(len(portfolio), 1)
+        self.assertEqual(view.loan_amount, 682912.43)
+        self.assertEqual(view.rate, MortgageRate.FIXED_3)
+        self.assertEqual(view.frequency, PaymentFrequency.BI_WEEKLY)
+        self.assertEqual(view.amortization, 30)
+        self.assertEqual(str(view), str(Mortgage(682912.43, "FIXED_3", "BI_WEEKLY", 30)))
+
+    def test_append_invalid_amortization(self):
+
+        """Tests that a value error is raised and nothing is stored when the amortization is invalid"""
+
+        #Arrange
+        portfolio = MortgagePortfolio()
+
+        #Act
+        with self.assertRaises(ValueError) as context:
+            portfolio.append(1000, "FIXED_5", "WEEKLY", 22)
+
+        #Assert
+        self.assertEqual(str(context.exception), "Amortization provided is invalid.")
+        self.assertEqual(len(portfolio), 0)
+
+    def test_append_float_amortization(self):
+
+        """Tests that a period such as 25.0 is stored as the integer period and every column keeps the same length"""
+
+        #Arrange
+        portfolio = MortgagePortfolio()
+
+        #Act
+        portfolio.append(1000, "FIXED_5", "WEEKLY", 25.0)
+        portfolio.append(2000, "FIXED_1", "MONTHLY", 10)
+
+        #Assert
+        columns = (portfolio.amounts, portfolio.rate_codes, portfolio.frequency_codes, portfolio.amortizations)
+        self.assertEqual([len(column) for column in columns], [2, 2, 2, 2])
+        self.assertEqual(list(portfolio.amortizations), [25, 10])
+        self.assertEqual(portfolio[0].calculate_payment(), Mortgage(1000, "FIXED_5", "WEEKLY", 25).calculate_payment())
+
+    def test_calculate_payments_matches_views(self):
+
+        """Tests that the vectorized payments match the payment of each view"""
+
+        #Arrange
+        portfolio = MortgagePortfolio()
+        portfolio.append(500000, "FIXED_1", "MONTHLY", 10)
+        portfolio.append(324124.33, "FIXED_5", "WEEKLY", 25)
+
+        #Act
+        payments = portfolio.calculate_payments()
+
+        #Assert
+        self.assertEqual(list(payments), [view.calculate_payment() for view in portfolio])
+        self.assertEqual(portfolio.nbytes(), 22)
+
+    def test_index_out_of_range(self):
+
+        """Tests that an index error is raised for a position past the end of the portfolio"""
+
+        #Act & Assert
+        with self.assertRaises(IndexError):
+            MortgagePortfolio()[0]
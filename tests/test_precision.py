@@ -0,0 +1,89 @@
+"""
+Description: Tests for the exact cent payments.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Use the tests encapsulated within this class to test the precision module.
+"""
+import os
+from decimal import Decimal
+from unittest import TestCase, mock
+
+import numpy as np
+
+from mortgage import precision
+from mortgage.mortgage import Mortgage
+from mortgage.pipeline import parse_chunk
+from mortgage.precision import calculate_payment_cents, exact_payment
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "pixell_river_mortgages.txt")
+
+class PrecisionTests(TestCase):
+
+    """Test cases for exact_payment, calculate_payment_cents and Mortgage.calculate_payment_exact"""
+
+    def test_matches_expected_payments_in_data_file(self):
+
+        """Tests that the cent payments equal the expected payments in the sample portfolio"""
+
+        #Arrange
+        with open(DATA_PATH) as input_file:
+            (rows, amounts, rate_codes, frequency_codes, amortizations), _ = parse_chunk(input_file.readlines())
+
+        #Act
+        cents = calculate_payment_cents(amounts, rate_codes, frequency_codes, amortizations)
+
+        #Assert
+        self.assertEqual(cents.dtype, np.int64)
+        self.assertEqual([Decimal(int(cent)).scaleb(-2) for cent in cents], [Decimal(row[4]) for row in rows])
+
+    def test_mortgage_exact_payment(self):
+
+        """Tests that a Mortgage gives its payment as a Decimal with two places"""
+
+        #Arrange
+        mortgage = Mortgage(682912.43, "FIXED_1", "MONTHLY", 10)
+
+        #Act
+        payment = mortgage.calculate_payment_exact()
+
+        #Assert
+        self.assertEqual(payment, Decimal("7578.30"))
+        self.assertEqual(payment.as_tuple().exponent, -2)
+        self.assertEqual(payment, exact_payment(Decimal("682912.43"), "FIXED_1", "MONTHLY", 10))
+
+    def test_fast_path_matches_decimal(self):
+
+        """Tests that rounding float payments gives the same cents as calculating every payment with Decimal"""
+
+        #Arrange
+        generator = np.random.default_rng(7)
+        size = 2000
+        columns = (np.round(generator.uniform(1000, 2_000_000, size), 2), generator.integers(0, 6, size),
+                   generator.integers(0, 3, size), generator.choice([5, 10, 15, 20, 25, 30], size))
+
+        #Act
+        fast = calculate_payment_cents(*columns)
+        #a tolerance of a half cent sends every payment through the Decimal calculation
+        with mock.patch.object(precision, "TIE_TOLERANCE", 0.5):
+            exact = calculate_payment_cents(*columns)
+
+        #Assert
+        self.assertEqual(fast.tolist(), exact.tolist())
+
+    def test_invalid_terms(self):
+
+        """Tests that exact payments raise the same errors as the Mortgage class"""
+
+        #Act and Assert
+        with self.assertRaises(ValueError) as context:
+            exact_payment(1000, "FIXED_1", "DAILY", 10)
+        self.assertEqual(str(context.exception), "Frequency provided is invalid.")
+
+        with self.assertRaises(ValueError) as context:
+            exact_payment(1000, "FIXED_1", "MONTHLY", 11)
+        self.assertEqual(str(context.exception), "Amortization provided is invalid.")
+
+        for amount in (float("nan"), float("inf")):
+            with self.assertRaises(ValueError) as context:
+                exact_payment(amount, "FIXED_1", "MONTHLY", 10)
+            self.assertEqual(str(context.exception), "Loan Amount must be positive.")
@@ -0,0 +1,148 @@
+"""
+Description: Tests for loading rate tables at runtime.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Use the tests encapsulated within this class to test the rates module.
+"""
+import json
+import os
+import tempfile
+from unittest import TestCase
+
+from mortgage.batch import calculate_payments
+from mortgage.cache import disable_payment_cache, enable_payment_cache, quote_payment
+from mortgage.mortgage import Mortgage
+from mortgage.pixell_lookup import MortgageRate, PaymentFrequency, annuity_factor, current_rate_table
+from mortgage.rates import RateTableProvider, reset_rates
+
+class RateTableProviderTests(TestCase):
+
+    """Test cases for the RateTableProvider class"""
+
+    def setUp(self):
+
+        """Creates a temporary directory for rate files"""
+
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+
+        """Puts the MortgageRate rates back into effect and removes the rate files"""
+
+        disable_payment_cache()
+        reset_rates()
+        self.directory.cleanup()
+
+    def write(self, name: str, content: str) -> str:
+
+        """Writes a rate file, returns its path"""
+
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w") as rate_file:
+            rate_file.write(content)
+        return path
+
+    def test_load_json_changes_payments(self):
+
+        """Tests that loading a JSON rate file changes the payments of existing and new mortgages"""
+
+        #Arrange
+        mortgage = Mortgage(10000, "FIXED_5", "MONTHLY", 10)
+        path = self.write("rates.json", json.dumps({"FIXED_5": 0.0599}))
+        version = current_rate_table().version
+
+        #Act
+        table = RateTableProvider(path).load()
+
+        #Assert
+        expected_payment = Mortgage(10000, "FIXED_1", "MONTHLY", 10).calculate_payment()
+        self.assertEqual(table.version, version + 1)
+        self.assertEqual(mortgage.calculate_payment(), expected_payment)
+        self.assertEqual(calculate_payments([10000], ["FIXED_5"], ["MONTHLY"], [10])[0], expected_payment)
+        self.assertEqual(MortgageRate.FIXED_5.annual_rate, 0.0599)
+        self.assertEqual(MortgageRate.FIXED_5.value, 0.0519)
+        self.assertIn("Rate: 5.99%", str(mortgage))
+
+    def test_load_csv_with_header(self):
+
+        """Tests that a CSV rate file with a header row is loaded and missing rates keep their value"""
+
+        #Arrange
+        path = self.write("rates.csv", "name,rate\nVARIABLE_1,0.07\n")
+
+        #Act
+        table = RateTableProvider(path).load()
+
+        #Assert
+        self.assertEqual(table.rates[MortgageRate.VARIABLE_1], 0.07)
+        self.assertEqual(table.rates[MortgageRate.FIXED_5], 0.0519)
+
+    def test_invalid_file_keeps_rates(self):
+
+        """Tests that a rate file naming an invalid rate raises a value error and changes nothing"""
+
+        #Arrange
+        path = self.write("rates.json", json.dumps({"FIXED_33": 0.05}))
+        table = current_rate_table()
+
+        #Act
+        with self.assertRaises(ValueError) as context:
+            RateTableProvider(path).load()
+
+        #Assert
+        self.assertEqual(str(context.exception), "Rate provided is invalid.")
+        self.assertIs(current_rate_table(), table)
+        self.assertEqual(Mortgage(1000, "FIXED_5", "WEEKLY", 5).rate, MortgageRate.FIXED_5)
+
+    def test_rates_must_be_positive(self):
+
+        """Tests that a value error is raised for a rate that is not positive"""
+
+        #Arrange
+        path = self.write("rates.csv", "FIXED_5,0\n")
+
+        #Act
+        with self.assertRaises(ValueError) as context:
+            RateTableProvider(path).load()
+
+        #Assert
+        self.assertEqual(str(context.exception), "Rate table rates must be positive.")
+
+    def test_reload_if_changed(self):
+
+        """Tests that the file is only loaded again once it has been modified"""
+
+        #Arrange
+        path = self.write("rates.csv", "FIXED_5,0.06\n")
+        provider = RateTableProvider(path)
+        provider.load()
+
+        #Act
+        unchanged = provider.reload_if_changed()
+        self.write("rates.csv", "FIXED_5,0.07\n")
+        os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+        changed = provider.reload_if_changed()
+
+        #Assert
+        self.assertFalse(unchanged)
+        self.assertTrue(changed)
+        self.assertEqual(annuity_factor(MortgageRate.FIXED_5, PaymentFrequency.MONTHLY, 10),
+                         current_rate_table().factors[(MortgageRate.FIXED_5, PaymentFrequency.MONTHLY, 10)])
+        self.assertEqual(MortgageRate.FIXED_5.annual_rate, 0.07)
+
+    def test_payment_cache_invalidated(self):
+
+        """Tests that payments cached before a rate change are not returned after it"""
+
+        #Arrange
+        cache = enable_payment_cache(8)
+        old_payment = quote_payment(10000, "FIXED_5", "MONTHLY", 10)
+        path = self.write("rates.json", json.dumps({"FIXED_5": 0.0599}))
+
+        #Act
+        RateTableProvider(path).load()
+        new_payment = quote_payment(10000, "FIXED_5", "MONTHLY", 10)
+
+        #Assert
+        self.assertGreater(new_payment, old_payment)
+        self.assertEqual(cache.misses, 2)
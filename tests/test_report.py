@@ -0,0 +1,111 @@
+"""
+Description: Tests for the bulk report writer.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Use the tests encapsulated within this class to test the report module.
+"""
+import gzip
+import io
+import json
+import os
+import tempfile
+from unittest import TestCase
+
+from mortgage.mortgage import Mortgage
+from mortgage.report import ReportWriter, write_report
+
+LINES = ["682912.43,FIXED_1,10,MONTHLY\n",
+         "-1,FIXED_1,10,MONTHLY\n",
+         "\n",
+         "500000,FIXED_5,25,WEEKLY,1234.00\n",
+         "1000,FIXED_9,10,MONTHLY\n"]
+
+class ReportWriterTests(TestCase):
+
+    """Test cases for the ReportWriter class and write_report"""
+
+    def test_text_matches_mortgage_string(self):
+
+        """Tests that the text report prints each row like a Mortgage, rejects in place, between separators"""
+
+        #Arrange
+        output = io.StringIO()
+        writer = ReportWriter(output, "text", "***")
+        expected = ("***\n"
+                    f"{Mortgage(682912.43, 'FIXED_1', 'MONTHLY', 10)}\n***\n"
+                    "Data: -1,FIXED_1,10,MONTHLY caused Exception: Loan Amount must be positive.\n***\n"
+                    f"{Mortgage(500000, 'FIXED_5', 'WEEKLY', 25)}\n***\n"
+                    "Data: 1000,FIXED_9,10,MONTHLY caused Exception: Rate provided is invalid.\n***\n")
+
+        #Act
+        writer.write_lines(LINES)
+
+        #Assert
+        self.assertEqual(output.getvalue(), expected)
+        self.assertEqual((writer.summary.priced, writer.summary.rejected), (2, 2))
+
+    def test_write_reuses_payments(self):
+
+        """Tests that write renders the payments it is given instead of calculating them"""
+
+        #Arrange
+        output = io.StringIO()
+        writer = ReportWriter(output, "csv")
+
+        #Act
+        writer.write([["1000", "FIXED_1", "10", "MONTHLY"]], [12.345])
+        writer.write([["2000", "FIXED_3", "5", "WEEKLY"]], [6.0])
+
+        #Assert
+        self.assertEqual(output.getvalue(), "amount,rate,amortization,frequency,payment\n"
+                                            "1000.0,FIXED_1,10,MONTHLY,12.35\n"
+                                            "2000.0,FIXED_3,5,WEEKLY,6.00\n")
+
+    def test_jsonl_records(self):
+
+        """Tests that each JSON line holds a priced row or a reject"""
+
+        #Arrange
+        output = io.StringIO()
+        writer = ReportWriter(output, "jsonl")
+
+        #Act
+        writer.write_lines(LINES)
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+
+        #Assert
+        self.assertEqual(len(records), 4)
+        self.assertEqual(records[0], {"amount": 682912.43, "rate": "FIXED_1", "amortization": 10,
+                                      "frequency": "MONTHLY", "payment": 7578.3})
+        self.assertEqual(records[1], {"data": "-1,FIXED_1,10,MONTHLY", "error": "Loan Amount must be positive."})
+
+    def test_invalid_format(self):
+
+        """Tests that an unknown report format is rejected"""
+
+        #Act and Assert
+        with self.assertRaises(ValueError) as context:
+            ReportWriter(io.StringIO(), "xml")
+        self.assertEqual(str(context.exception), "Report format provided is invalid.")
+
+    def test_write_report_gzip(self):
+
+        """Tests that a report path ending in .gz is compressed"""
+
+        with tempfile.TemporaryDirectory() as directory:
+            #Arrange
+            input_path = os.path.join(directory, "input.txt")
+            output_path = os.path.join(directory, "report.csv.gz")
+            with open(input_path, "w") as input_file:
+                input_file.writelines(LINES)
+
+            #Act
+            summary = write_report(input_path, output_path, "csv", chunk_size=2)
+            with gzip.open(output_path, "rt") as report_file:
+                lines = report_file.read().splitlines()
+
+            #Assert
+            self.assertEqual((summary.priced, summary.rejected), (2, 2))
+            self.assertEqual(lines[0], "amount,rate,amortization,frequency,payment")
+            self.assertEqual(lines[1], "682912.43,FIXED_1,10,MONTHLY,7578.30")
+            self.assertEqual(len(lines), 3)
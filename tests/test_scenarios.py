@@ -0,0 +1,141 @@
+"""
+Description: Tests for the rate scenario engine.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Use the tests encapsulated within this class to test the scenarios module.
+"""
+from types import SimpleNamespace
+from unittest import TestCase
+
+import numpy as np
+
+from mortgage.mortgage import Mortgage
+from mortgage.pixell_lookup import FREQUENCIES, RATES, MortgageRate
+from mortgage.portfolio import MortgagePortfolio
+from mortgage.scenarios import price_scenarios, rate_shock
+
+class ScenarioTests(TestCase):
+
+    """Test cases for pricing a portfolio under rate scenarios"""
+
+    def setUp(self):
+
+        """Builds a small portfolio for each test"""
+
+        self.portfolio = MortgagePortfolio()
+        self.portfolio.append(500000, "FIXED_1", "MONTHLY", 10)
+        self.portfolio.append(682912.43, "VARIABLE_3", "BI_WEEKLY", 25)
+        self.portfolio.append(10000, "FIXED_5", "WEEKLY", 5)
+
+    def test_base_scenario_matches_mortgage(self):
+
+        """Tests that an empty scenario gives exactly the payments of the Mortgage class"""
+
+        #Act
+        payments = price_scenarios(self.portfolio, [{}])
+
+        #Assert
+        expected = [Mortgage(view.loan_amount, view.rate.name, view.frequency.name, view.amortization).calculate_payment()
+                    for view in self.portfolio]
+        self.assertEqual(payments[:, 0].tolist(), expected)
+
+    def test_matrix_shape_and_shock(self):
+
+        """Tests that each scenario is a column and a rate shock matches a Mortgage priced at the shocked rate"""
+
+        #Arrange
+        scenarios = [{}, rate_shock(25), rate_shock(100)]
+
+        #Act
+        payments = price_scenarios(self.portfolio, scenarios)
+
+        #Assert
+        self.assertEqual(payments.shape, (3, 3))
+        self.assertTrue(np.all(payments[:, 1] > payments[:, 0]))
+        self.assertTrue(np.all(payments[:, 2] > payments[:, 1]))
+        interest_rate = (MortgageRate.FIXED_1.value + 0.01) / 12
+        expected = 500000 * interest_rate * (1 + interest_rate) ** 120 / ((1 + interest_rate) ** 120 - 1)
+        self.assertAlmostEqual(payments[0, 2], expected, places=6)
+
+    def test_custom_curve_by_name(self):
+
+        """Tests that a scenario can override single rates by name, leaving the others unchanged"""
+
+        #Act
+        payments = price_scenarios(self.portfolio, [{}, {"FIXED_1": 0.0799}])
+
+        #Assert
+        self.assertGreater(payments[0, 1], payments[0, 0])
+        self.assertEqual(payments[1, 1], payments[1, 0])
+        self.assertEqual(payments[2, 1], payments[2, 0])
+
+    def test_zero_rate(self):
+
+        """Tests that a zero rate repays the loan in equal parts"""
+
+        #Act
+        payments = price_scenarios(self.portfolio, [{MortgageRate.FIXED_1: 0}])
+
+        #Assert
+        self.assertAlmostEqual(payments[0, 0], 500000 / 120, places=9)
+
+    def test_parallel_blocks_match_serial(self):
+
+        """Tests that pricing blocks of scenarios in worker processes gives the same matrix"""
+
+        #Arrange
+        scenarios = [rate_shock(basis_points) for basis_points in range(0, 200, 25)]
+
+        #Act
+        serial = price_scenarios(self.portfolio, scenarios)
+        parallel = price_scenarios(self.portfolio, scenarios, workers=2, scenarios_per_block=3)
+
+        #Assert
+        np.testing.assert_array_equal(parallel, serial)
+
+    def test_invalid_scenario_rate(self):
+
+        """Tests that a value error is raised for an unknown rate name"""
+
+        #Act
+        with self.assertRaises(ValueError) as context:
+            price_scenarios(self.portfolio, [{"FIXED_33": 0.05}])
+
+        #Assert
+        self.assertEqual(str(context.exception), "Rate provided is invalid.")
+
+    def test_non_finite_amounts(self):
+
+        """Tests that NaN and infinite loan amounts raise the Mortgage message instead of being priced"""
+
+        for amount in (float("nan"), float("inf")):
+            #Arrange
+            portfolio = SimpleNamespace(amounts=[1000.0, amount], rate_codes=[0, 0], frequency_codes=[0, 0],
+                                        amortizations=[10, 10])
+
+            #Act
+            with self.assertRaises(ValueError) as context:
+                price_scenarios(portfolio, [{}])
+
+            #Assert
+            self.assertEqual(str(context.exception), "Loan Amount must be positive.")
+
+    def test_invalid_codes(self):
+
+        """Tests that rate and frequency codes outside the tables raise instead of pricing another loan"""
+
+        #Arrange
+        cases = [([-1], [0], "Rate provided is invalid."), ([len(RATES)], [0], "Rate provided is invalid."),
+                 ([0], [len(FREQUENCIES)], "Frequency provided is invalid."),
+                 ([0], [-1], "Frequency provided is invalid.")]
+
+        for rate_codes, frequency_codes, message in cases:
+            portfolio = SimpleNamespace(amounts=[1000.0], rate_codes=rate_codes, frequency_codes=frequency_codes,
+                                        amortizations=[5])
+
+            #Act
+            with self.assertRaises(ValueError) as context:
+                price_scenarios(portfolio, [{}])
+
+            #Assert
+            self.assertEqual(str(context.exception), message)
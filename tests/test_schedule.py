@@ -0,0 +1,72 @@
+"""
+Description: Tests for the vectorized amortization schedules.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Use the tests encapsulated within this class to test the schedule module.
+"""
+from unittest import TestCase
+
+import numpy as np
+
+from mortgage.mortgage import Mortgage
+from mortgage.schedule import portfolio_schedule, portfolio_schedules
+
+class ScheduleTests(TestCase):
+
+    """Test cases for the vectorized amortization schedules"""
+
+    def test_arrays_match_lazy_schedule(self):
+
+        """Tests that the array schedule matches the schedule yielded by the generator"""
+
+        #Arrange
+        mortgage = Mortgage(690334.22, "FIXED_3", "BI_WEEKLY", 20)
+        expected = np.array(list(mortgage.amortization_schedule()))
+
+        #Act
+        schedule = mortgage.amortization_schedule_arrays()
+
+        #Assert
+        actual = np.column_stack(schedule)
+        np.testing.assert_allclose(actual, expected, rtol=0, atol=1e-6)
+
+    def test_portfolio_schedule_pads_shorter_loans(self):
+
+        """Tests that loans with fewer periods are padded with zeros"""
+
+        #Act
+        schedule = portfolio_schedule([10000, 10000], [0, 0], [0, 2], [5, 5])
+
+        #Assert
+        self.assertEqual(schedule.balance.shape, (2, 260))
+        self.assertEqual(schedule.period[0, 59], 60)
+        self.assertTrue(np.all(schedule.payment[0, 60:] == 0))
+        self.assertAlmostEqual(schedule.principal[0].sum(), 10000, places=6)
+        self.assertAlmostEqual(schedule.principal[1].sum(), 10000, places=6)
+
+    def test_portfolio_schedules_in_blocks(self):
+
+        """Tests that portfolio schedules are produced in blocks of at most the requested size"""
+
+        #Arrange
+        amounts = np.full(5, 10000.0)
+        codes = np.zeros(5, dtype=int)
+        amortizations = np.full(5, 10)
+
+        #Act
+        blocks = list(portfolio_schedules(amounts, codes, codes, amortizations, loans_per_block=2))
+
+        #Assert
+        self.assertEqual([start for start, _ in blocks], [0, 2, 4])
+        self.assertEqual([len(schedule.balance) for _, schedule in blocks], [2, 2, 1])
+
+    def test_portfolio_schedules_invalid_block_size(self):
+
+        """Tests that a value error is raised when the block size is not positive"""
+
+        #Act
+        with self.assertRaises(ValueError) as context:
+            next(portfolio_schedules([1000], [0], [0], [5], loans_per_block=0))
+
+        #Assert
+        self.assertEqual(str(context.exception), "Loans per block must be positive.")
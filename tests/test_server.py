@@ -0,0 +1,155 @@
+"""
+Description: Tests for the asyncio quoting server.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Use the tests encapsulated within this class to test the server module.
+"""
+import asyncio
+import json
+from unittest import IsolatedAsyncioTestCase
+
+from mortgage.mortgage import Mortgage
+from mortgage.server import QuoteServer
+
+class QuoteServerTests(IsolatedAsyncioTestCase):
+
+    """Test cases for the QuoteServer class"""
+
+    async def asyncSetUp(self):
+
+        """Starts a server on a free localhost port for each test"""
+
+        self.server = QuoteServer(port=0)
+        await self.server.start()
+
+    async def asyncTearDown(self):
+
+        """Stops the server after each test"""
+
+        await self.server.close()
+
+    async def send(self, *requests) -> list:
+
+        """Sends request lines over one connection, returns the decoded responses"""
+
+        reader, writer = await asyncio.open_connection(self.server.host, self.server.port)
+        responses = []
+        for request in requests:
+            writer.write((request if isinstance(request, str) else json.dumps(request)).encode() + b"\n")
+            await writer.drain()
+            responses.append(json.loads(await reader.readline()))
+        writer.close()
+        await writer.wait_closed()
+        return responses
+
+    async def test_single_quote(self):
+
+        """Tests that a single quote returns the same payment as the Mortgage class"""
+
+        #Act
+        responses = await self.send({"amount": 682912.43, "rate": "FIXED_1", "frequency": "MONTHLY", "amortization": 10})
+
+        #Assert
+        expected_payment = Mortgage(682912.43, "FIXED_1", "MONTHLY", 10).calculate_payment()
+        self.assertEqual(responses, [{"payment": expected_payment}])
+
+    async def test_invalid_quote_uses_mortgage_message(self):
+
+        """Tests that an invalid quote returns the validation message of the Mortgage class"""
+
+        #Act
+        responses = await self.send({"amount": 1000, "rate": "FIXED_33", "frequency": "MONTHLY", "amortization": 10},
+                                    {"amount": "1000", "rate": "FIXED_1", "frequency": "MONTHLY", "amortization": 10},
+                                    "not json")
+
+        #Assert
+        self.assertEqual(responses, [{"error": "Rate provided is invalid."},
+                                     {"error": "Loan Amount must be a number."},
+                                     {"error": "Request is not valid JSON."}])
+
+    async def test_batch_quote(self):
+
+        """Tests that a batch request returns a result for each quote in order"""
+
+        #Arrange
+        quotes = [{"amount": 10000, "rate": "FIXED_5", "frequency": "MONTHLY", "amortization": 10},
+                  {"amount": 0, "rate": "FIXED_5", "frequency": "MONTHLY", "amortization": 10},
+                  {"amount": 10000, "rate": "FIXED_1", "frequency": "BI_WEEKLY", "amortization": 10}]
+
+        #Act
+        [response] = await self.send({"quotes": quotes})
+
+        #Assert
+        results = response["results"]
+        self.assertAlmostEqual(results[0]["payment"], 106.997, places=2)
+        self.assertEqual(results[1], {"error": "Loan Amount must be positive."})
+        self.assertAlmostEqual(results[2]["payment"], 51.167, places=2)
+
+    async def test_concurrent_quotes_are_coalesced(self):
+
+        """Tests that single quotes from concurrent clients are priced in fewer batches than requests"""
+
+        #Arrange
+        request = {"amount": 10000, "rate": "FIXED_5", "frequency": "MONTHLY", "amortization": 10}
+
+        #Act
+        responses = await asyncio.gather(*(self.send(request) for _ in range(20)))
+
+        #Assert
+        self.assertEqual(len(responses), 20)
+        self.assertLess(self.server.batches, 20)
+
+    async def test_non_finite_quotes_among_concurrent_quotes(self):
+
+        """Tests that NaN and infinite quotes get an error while concurrent clients still get their payments"""
+
+        #Arrange
+        good = {"amount": 10000, "rate": "FIXED_5", "frequency": "MONTHLY", "amortization": 10}
+        bad = [dict(good, amount=float("nan")), dict(good, amount=float("inf")), dict(good, amount=10 ** 400)]
+        batch = {"quotes": [good, dict(good, amount=float("nan")), good]}
+
+        #Act
+        responses = await asyncio.gather(*(self.send(good) for _ in range(10)), self.send(*bad),
+                                         *(self.send(good, batch) for _ in range(10)))
+
+        #Assert
+        expected_payment = Mortgage(10000, "FIXED_5", "MONTHLY", 10).calculate_payment()
+        self.assertEqual(responses[10], [{"error": "Loan Amount must be positive."}] * 3)
+        for response in responses[:10]:
+            self.assertEqual(response, [{"payment": expected_payment}])
+        for response in responses[11:]:
+            self.assertEqual(response, [{"payment": expected_payment},
+                                        {"results": [{"payment": expected_payment},
+                                                     {"error": "Loan Amount must be positive."},
+                                                     {"payment": expected_payment}]}])
+
+    async def test_failed_quote_does_not_fail_coalesced_quotes(self):
+
+        """Tests that a quote that fails to price only fails its own request, not the others priced with it"""
+
+        #Arrange
+        good = {"amount": 10000, "rate": "FIXED_5", "frequency": "MONTHLY", "amortization": 10}
+        #terms that pass no validation, as a bug in parsing would leave them
+        unpriceable = (10000.0, 0, 0, 99)
+        #long enough for every client to join the batch of the failing quote
+        self.server.batch_window = 0.2
+
+        #Act
+        results = await asyncio.gather(self.server.quote(unpriceable), *(self.send(good) for _ in range(10)),
+                                       return_exceptions=True)
+
+        #Assert
+        self.assertIsInstance(results[0], ValueError)
+        expected_payment = Mortgage(10000, "FIXED_5", "MONTHLY", 10).calculate_payment()
+        self.assertEqual(results[1:], [[{"payment": expected_payment}]] * 10)
+
+    def test_invalid_limits(self):
+
+        """Tests that a value error is raised when a limit is not positive"""
+
+        #Act
+        with self.assertRaises(ValueError) as context:
+            QuoteServer(max_batch=0)
+
+        #Assert
+        self.assertEqual(str(context.exception), "Server limits must be positive.")
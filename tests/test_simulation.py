@@ -0,0 +1,178 @@
+"""
+Description: Tests for the variable rate and prepayment simulation.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Use the tests encapsulated within this class to test the simulation module.
+"""
+import contextlib
+import io
+import os
+from unittest import TestCase
+
+import numpy as np
+
+from mortgage.mortgage import Mortgage
+from mortgage.pixell_lookup import MortgageRate, RateTable, current_rate_table, install_rate_table
+from mortgage.portfolio import MortgagePortfolio
+from mortgage.simulation import ConstantRates, PrepaymentModel, VasicekRates, main, simulate
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "pixell_river_mortgages.txt")
+
+TERMS = [(300000, "FIXED_5", "MONTHLY", 25), (200000, "VARIABLE_3", "WEEKLY", 10),
+         (150000, "FIXED_1", "BI_WEEKLY", 30), (100000, "VARIABLE_1", "MONTHLY", 5)]
+
+def build_portfolio(terms=TERMS) -> MortgagePortfolio:
+
+    """Returns a MortgagePortfolio holding the terms"""
+
+    portfolio = MortgagePortfolio()
+    for row in terms:
+        portfolio.append(*row)
+    return portfolio
+
+class SimulationTests(TestCase):
+
+    """Test cases for simulate and the rate and prepayment models"""
+
+    def test_unchanged_rates_follow_mortgage_schedules(self):
+
+        """Tests that with today's rates and no prepayment every path repays each loan on its schedule"""
+
+        #Arrange
+        mortgages = [Mortgage(*terms) for terms in TERMS]
+
+        #Act
+        result = simulate(build_portfolio(), ConstantRates(), paths=3)
+
+        #Assert
+        for loan, mortgage in enumerate(mortgages):
+            interest = sum(period.interest for period in mortgage.amortization_schedule())
+            self.assertAlmostEqual(result.loan_interest[loan], interest, places=4)
+        #payment k of a loan falls in month k * 12 // frequency, five weekly payments fall in month 12
+        payments_in_month = [sum(1 for period in range(mortgage.amortization * mortgage.frequency.value)
+                                 if period * 12 // mortgage.frequency.value == 12) for mortgage in mortgages]
+        self.assertAlmostEqual(result.payments[0, 12], sum(mortgage.calculate_payment() * count for mortgage, count
+                                                           in zip(mortgages, payments_in_month)), places=6)
+        self.assertEqual(result.balance.shape, (3, 360))
+        self.assertAlmostEqual(result.balance[0, -1], 0.0, places=6)
+        self.assertTrue(np.array_equal(result.payments[0], result.payments[2]))
+
+    def test_rate_shift_reaches_variable_then_fixed_loans(self):
+
+        """Tests that higher market rates change variable payments at once and fixed payments at renewal"""
+
+        #Arrange
+        portfolio = build_portfolio([(300000, "VARIABLE_5", "MONTHLY", 25), (300000, "FIXED_1", "MONTHLY", 25)])
+
+        #Act
+        base = simulate(portfolio, ConstantRates(), paths=1)
+        shifted = simulate(portfolio, ConstantRates(0.01), paths=1)
+
+        #Assert
+        self.assertAlmostEqual(shifted.payments[0, 0], base.payments[0, 0])
+        self.assertGreater(shifted.payments[0, 1], base.payments[0, 1])
+        self.assertAlmostEqual(shifted.payments[0, 11] - base.payments[0, 11],
+                               shifted.payments[0, 1] - base.payments[0, 1])
+        self.assertGreater(shifted.payments[0, 12] - base.payments[0, 12],
+                           shifted.payments[0, 11] - base.payments[0, 11])
+        self.assertGreater(shifted.loan_interest.sum(), base.loan_interest.sum())
+
+    def test_prepayments(self):
+
+        """Tests that certain prepayment repays everything in the first month and a partial rate repays some loans"""
+
+        #Arrange
+        portfolio = build_portfolio()
+
+        #Act
+        certain = simulate(portfolio, ConstantRates(), PrepaymentModel(base_rate=1.0), paths=4)
+        partial = simulate(portfolio, VasicekRates(), PrepaymentModel(0.1, 0.2), paths=200, seed=1)
+
+        #Assert
+        self.assertAlmostEqual(certain.payments[:, 0].sum() + certain.prepayments[:, 0].sum()
+                               - certain.interest[:, 0].sum(), 4 * sum(terms[0] for terms in TERMS), places=4)
+        self.assertEqual(certain.balance[:, 1:].sum(), 0.0)
+        #what is borrowed is repaid, as payments net of interest or as prepayments
+        repaid = partial.payments.sum(axis=1) - partial.interest.sum(axis=1) + partial.prepayments.sum(axis=1)
+        self.assertTrue(np.allclose(repaid, sum(terms[0] for terms in TERMS)))
+        self.assertTrue(0 < partial.prepayments.sum() < 200 * sum(terms[0] for terms in TERMS))
+
+    def test_seeded_and_parallel_results_match(self):
+
+        """Tests that a seed gives the same paths whether blocks run in this process or in workers"""
+
+        #Arrange
+        portfolio = build_portfolio(TERMS * 3)
+        arguments = dict(rate_model=VasicekRates(0.02), prepayment=PrepaymentModel(0.05, 0.1), paths=24, seed=3,
+                         paths_per_block=8, loans_per_chunk=8)
+
+        #Act
+        serial = simulate(portfolio, **arguments)
+        again = simulate(portfolio, **arguments)
+        parallel = simulate(portfolio, workers=2, **arguments)
+
+        #Assert
+        self.assertEqual(serial.balance.shape, (24, 360))
+        for name in serial._fields:
+            self.assertTrue(np.array_equal(getattr(serial, name), getattr(again, name)))
+            self.assertTrue(np.allclose(getattr(serial, name), getattr(parallel, name)))
+
+    def test_workers_use_the_rates_of_this_process(self):
+
+        """Tests that blocks simulated by workers start from the rates installed in this process"""
+
+        #Arrange
+        portfolio = build_portfolio()
+        arguments = dict(rate_model=ConstantRates(), prepayment=PrepaymentModel(0, 0), paths=4, paths_per_block=2)
+        default = simulate(portfolio, **arguments)
+        table = current_rate_table()
+        rates = dict(table.rates)
+        rates[MortgageRate.FIXED_5] = 0.08
+        install_rate_table(RateTable(rates, version=table.version + 1, source="test"))
+
+        #Act
+        try:
+            serial = simulate(portfolio, **arguments)
+            parallel = simulate(portfolio, workers=2, **arguments)
+        finally:
+            install_rate_table(table)
+
+        #Assert
+        self.assertGreater(serial.loan_interest[0], default.loan_interest[0])
+        self.assertTrue(np.allclose(serial.loan_interest, parallel.loan_interest))
+
+    def test_invalid_arguments(self):
+
+        """Tests that bad counts, prepayment rates and loans are rejected"""
+
+        #Arrange
+        portfolio = build_portfolio()
+
+        #Act and Assert
+        with self.assertRaises(ValueError):
+            simulate(portfolio, ConstantRates(), paths=0)
+
+        with self.assertRaises(ValueError) as context:
+            simulate(portfolio, ConstantRates(), PrepaymentModel(base_rate=1.5))
+        self.assertEqual(str(context.exception), "Prepayment rates must be between 0 and 1.")
+
+        with self.assertRaises(ValueError):
+            VasicekRates(volatility=-0.01)
+
+    def test_command_prints_yearly_table(self):
+
+        """Tests that the command prints one line per year and counts the rejected rows of the file"""
+
+        #Arrange
+        output, errors = io.StringIO(), io.StringIO()
+
+        #Act
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(errors):
+            exit_code = main([DATA_PATH, "--paths", "20", "--seed", "1"])
+
+        #Assert
+        lines = output.getvalue().splitlines()
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(len(lines), 1 + 30 + 1)
+        self.assertTrue(lines[-1].startswith("Mean total interest: "))
+        self.assertEqual(errors.getvalue().strip(), "Rejected rows: 6")
@@ -0,0 +1,109 @@
+"""
+Description: Tests for the synthetic portfolio generator.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Use the tests encapsulated within this class to test the synthetic module.
+"""
+import os
+import tempfile
+from unittest import TestCase, mock
+
+from mortgage import synthetic
+from mortgage.equivalence import reference_lines
+from mortgage.synthetic import generate_chunks, write_portfolio
+from mortgage.verify import verify_file
+from mortgage.validation import ERROR_MESSAGES
+
+class SyntheticTests(TestCase):
+
+    """Test cases for generate_chunks and write_portfolio"""
+
+    def test_same_seed_same_rows(self):
+
+        """Tests that a seed always gives the same rows and another seed gives different ones"""
+
+        #Act
+        first = [line for lines in generate_chunks(500, seed=3, invalid_ratio=0.2) for line in lines]
+        second = [line for lines in generate_chunks(500, seed=3, invalid_ratio=0.2) for line in lines]
+        other = [line for lines in generate_chunks(500, seed=4, invalid_ratio=0.2) for line in lines]
+
+        #Assert
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other)
+        self.assertEqual(len(first), 500)
+
+    def test_rows_are_streamed_in_chunks(self):
+
+        """Tests that rows are generated a chunk at a time and do not depend on the number of rows"""
+
+        #Arrange
+        with mock.patch.object(synthetic, "CHUNK_ROWS", 100):
+            #Act
+            chunks = list(generate_chunks(250, seed=1))
+            longer = list(generate_chunks(400, seed=1))
+
+        #Assert
+        self.assertEqual([len(lines) for lines in chunks], [100, 100, 50])
+        self.assertEqual(chunks[:2], longer[:2])
+
+    def test_invalid_rows_cover_every_error(self):
+
+        """Tests that invalid rows are rejected by the Mortgage class with every one of its messages"""
+
+        #Arrange
+        lines = [line for lines in generate_chunks(2000, seed=5, invalid_ratio=0.5) for line in lines]
+
+        #Act
+        payments, rejects = reference_lines(lines)
+
+        #Assert
+        messages = {message for _, message in rejects}
+        self.assertTrue(set(ERROR_MESSAGES.values()) <= messages)
+        self.assertIn("list index out of range", messages)
+        self.assertTrue(any(message.startswith("could not convert string to float") for message in messages))
+        self.assertTrue(any(message.startswith("invalid literal for int()") for message in messages))
+        self.assertAlmostEqual(len(rejects) / len(lines), 0.5, delta=0.05)
+        self.assertEqual(len(payments) + len(rejects), len(lines))
+
+    def test_non_finite_amount_rows(self):
+
+        """Tests that rows with NaN or infinite amount text are rejected with the Loan Amount message"""
+
+        #Arrange
+        lines = [line for lines in generate_chunks(300, seed=6, invalid_ratio=1.0, kinds=["amount_not_finite"])
+                 for line in lines]
+
+        #Act
+        payments, rejects = reference_lines(lines)
+
+        #Assert
+        self.assertEqual(payments, [])
+        self.assertEqual({row.split(",")[0] for row, _ in rejects}, {"nan", "inf", "1e400"})
+        self.assertEqual({message for _, message in rejects}, {"Loan Amount must be positive."})
+
+    def test_written_file_verifies(self):
+
+        """Tests that the expected payments and EXCEPTION markers of a written file pass verification"""
+
+        with tempfile.TemporaryDirectory() as directory:
+            #Arrange
+            path = os.path.join(directory, "portfolio.txt")
+
+            #Act
+            rows = write_portfolio(path, 3000, seed=2, invalid_ratio=0.1)
+            report = verify_file(path)
+
+            #Assert
+            self.assertEqual(rows, 3000)
+            self.assertEqual(report.rows, 3000)
+            self.assertTrue(report.passed)
+            self.assertGreater(report.expected_rejects, 0)
+
+    def test_invalid_arguments(self):
+
+        """Tests that bad row counts, ratios and kinds are rejected"""
+
+        #Act and Assert
+        for arguments in ((-1,), (synthetic.MAX_ROWS + 1,), (10, 0, 1.5), (10, 0, 0.1, ["typo"])):
+            with self.assertRaises(ValueError):
+                next(generate_chunks(*arguments), None)
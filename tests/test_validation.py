@@ -0,0 +1,88 @@
+"""
+Description: Tests for validating mortgage records without raising.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Use the tests encapsulated within this class to test the validation module.
+"""
+from unittest import TestCase
+
+from mortgage.mortgage import Mortgage
+from mortgage.validation import (ERROR_MESSAGES, INVALID_AMORTIZATION, INVALID_AMOUNT, INVALID_FREQUENCY,
+                                 INVALID_RATE, VALID, validate_records)
+
+class ValidationTests(TestCase):
+
+    """Test cases for the validate_records function"""
+
+    def test_error_code_per_row(self):
+
+        """Tests that each row gets the code of its first error, in the same order Mortgage checks them"""
+
+        #Arrange
+        amounts = [1000, 0, 1000, 1000, 1000, -5]
+        rates = ["FIXED_5", "FIXED_5", "FIXED_33", "FIXED_5", "FIXED_5", "FIXED_33"]
+        frequencies = ["WEEKLY", "WEEKLY", "WEEKLY", "BI_MONTHLY", "WEEKLY", "BI_MONTHLY"]
+        amortizations = [10, 10, 10, 10, 22, 22]
+
+        #Act
+        codes = validate_records(amounts, rates, frequencies, amortizations)
+
+        #Assert
+        self.assertEqual(codes, [VALID, INVALID_AMOUNT, INVALID_RATE, INVALID_FREQUENCY,
+                                 INVALID_AMORTIZATION, INVALID_AMOUNT])
+
+    def test_messages_match_mortgage(self):
+
+        """Tests that the message for each error code is the one raised by the Mortgage class"""
+
+        #Arrange
+        records = [(0, "FIXED_5", "WEEKLY", 10), (1000, "INVALID_RATE", "WEEKLY", 10),
+                   (1000, "FIXED_5", "INVALID_FREQUENCY", 10), (1000, "FIXED_5", "WEEKLY", 0),
+                   (1000, ["FIXED_5"], "WEEKLY", 10)]
+
+        #Act
+        codes = validate_records(*zip(*records))
+
+        #Assert
+        for record, code in zip(records, codes):
+            with self.assertRaises(ValueError) as context:
+                Mortgage(*record)
+            self.assertEqual(ERROR_MESSAGES[code], str(context.exception))
+
+    def test_non_numeric_amounts(self):
+
+        """Tests that amounts that are not numbers are reported as invalid instead of raising"""
+
+        #Arrange
+        amounts = ["abc", None, [1000], "1000"]
+
+        #Act
+        codes = validate_records(amounts, ["FIXED_5"] * 4, ["WEEKLY"] * 4, [10] * 4)
+
+        #Assert
+        self.assertEqual(codes, [INVALID_AMOUNT] * 4)
+
+    def test_non_finite_amounts(self):
+
+        """Tests that NaN and infinite amounts are reported as invalid, with the message Mortgage raises for them"""
+
+        #Arrange
+        amounts = [float("nan"), float("inf"), float("-inf")]
+
+        #Act
+        codes = validate_records(amounts, ["FIXED_5"] * 3, ["WEEKLY"] * 3, [10] * 3)
+
+        #Assert
+        self.assertEqual(codes, [INVALID_AMOUNT] * 3)
+        for amount in amounts:
+            with self.assertRaises(ValueError) as context:
+                Mortgage(amount, "FIXED_5", "WEEKLY", 10)
+            self.assertEqual(ERROR_MESSAGES[INVALID_AMOUNT], str(context.exception))
+
+    def test_mismatched_column_lengths(self):
+
+        """Tests that a value error is raised when the columns have different lengths"""
+
+        #Act & Assert
+        with self.assertRaises(ValueError):
+            validate_records([1000, 2000], ["FIXED_5"], ["WEEKLY"], [10])
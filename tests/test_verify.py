@@ -0,0 +1,119 @@
+"""
+Description: Tests for verifying payments against a portfolio file.
+Author: Pablito Salazar
+Date: October 18, 2026
+Usage: Use the tests encapsulated within this class to test the verify module.
+"""
+import io
+import os
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import TestCase
+
+from mortgage.synthetic import write_portfolio
+from mortgage.verify import main, verify_file, verify_stream
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), "..", "data", "pixell_river_mortgages.txt")
+
+class VerifyTests(TestCase):
+
+    """Test cases for the verify command"""
+
+    def test_sample_file_passes(self):
+
+        """Tests that every row of the sample file matches its expected payment or rejection"""
+
+        #Act
+        report = verify_file(DATA_FILE)
+
+        #Assert
+        self.assertTrue(report.passed)
+        self.assertEqual((report.rows, report.checked, report.expected_rejects), (22, 16, 6))
+
+    def test_payment_mismatch(self):
+
+        """Tests that a payment outside the tolerance is counted as a mismatch and reported as the worst deviation"""
+
+        #Arrange
+        input_file = io.StringIO("500000,FIXED_1,10,MONTHLY,5548.51\n"
+                                 "500000,FIXED_1,10,MONTHLY,5549.51\n")
+
+        #Act
+        report = verify_stream(input_file)
+
+        #Assert
+        self.assertEqual(report.mismatches, 1)
+        self.assertFalse(report.passed)
+        self.assertEqual(report.worst[0][1], "500000,FIXED_1,10,MONTHLY,5549.51")
+        self.assertAlmostEqual(report.worst[0][0], 0.995456, places=6)
+
+    def test_unexpected_reject_and_price(self):
+
+        """Tests that rejected rows with an expected payment and priced rows marked EXCEPTION both fail"""
+
+        #Arrange
+        input_file = io.StringIO("0,FIXED_1,10,MONTHLY,5548.51\n"
+                                 "500000,FIXED_1,10,MONTHLY,EXCEPTION\n")
+
+        #Act
+        report = verify_stream(input_file)
+
+        #Assert
+        self.assertEqual(report.unexpected_rejects, 1)
+        self.assertEqual(report.unexpected_prices, 1)
+        self.assertEqual(report.failures, 2)
+
+    def test_generated_file_passes(self):
+
+        """Tests that a synthetic file with every kind of invalid row, truncated rows included, passes the command"""
+
+        with tempfile.TemporaryDirectory() as directory:
+            #Arrange
+            path = os.path.join(directory, "portfolio.txt")
+            write_portfolio(path, 5000, seed=11, invalid_ratio=0.2)
+
+            #Act
+            with redirect_stdout(io.StringIO()) as output:
+                exit_code = main([path])
+
+            #Assert
+            self.assertEqual(exit_code, 0)
+            self.assertIn("Unexpected rejects: 0", output.getvalue())
+            self.assertIn("Result: PASSED", output.getvalue())
+
+    def test_configurable_tolerance(self):
+
+        """Tests that a looser tolerance accepts a larger deviation"""
+
+        #Arrange
+        input_file = io.StringIO("500000,FIXED_1,10,MONTHLY,5549.51\n")
+
+        #Act
+        report = verify_stream(input_file, tolerance=1.0)
+
+        #Assert
+        self.assertTrue(report.passed)
+
+    def test_negative_tolerance(self):
+
+        """Tests that a value error is raised when the tolerance is negative"""
+
+        #Act
+        with self.assertRaises(ValueError) as context:
+            verify_stream(io.StringIO(""), tolerance=-1)
+
+        #Assert
+        self.assertEqual(str(context.exception), "Tolerance must not be negative.")
+
+    def test_exit_code(self):
+
+        """Tests that the command exits with zero for the sample file and non-zero for a missing file"""
+
+        #Act
+        with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+            passed_code = main([DATA_FILE])
+            missing_code = main(["missing_portfolio.txt"])
+
+        #Assert
+        self.assertEqual(passed_code, 0)
+        self.assertNotEqual(missing_code, 0)